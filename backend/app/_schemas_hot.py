@@ -0,0 +1,150 @@
+"""
+SignVista — Hot-Path Request Structs
+
+The four per-frame request bodies (translate, learn, game, AR) are decoded
+here instead of through Pydantic. Each struct is a frozen, slotted dataclass
+with plain `str` fields, and each decoder is a straight orjson.loads plus
+explicit type checks — no Union/Optional, no validator dispatch.
+
+The module is written to be mypyc-compatible:
+
+    mypyc app/_schemas_hot.py
+
+When no compiled build is present it runs unchanged as pure Python.
+The Pydantic models in app.schemas remain the documented contract; routes
+pass them to `openapi_body()` so the OpenAPI docs stay identical.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import orjson
+from pydantic import BaseModel
+
+
+class HotDecodeError(ValueError):
+    """
+    Raised when a per-frame request body is malformed.
+
+    Carries one error in FastAPI's validation format, so routes can re-raise
+    it as a RequestValidationError and clients get the same 422 body shape
+    as on the Pydantic-validated routes.
+    """
+
+    def __init__(self, error_type: str, loc: Tuple[Any, ...], msg: str, value: Any,
+                 ctx: Optional[Dict[str, Any]] = None):
+        super().__init__(msg)
+        self.error: Dict[str, Any] = {"type": error_type, "loc": loc, "msg": msg, "input": value}
+        if ctx is not None:
+            self.error["ctx"] = ctx
+
+    def errors(self) -> List[Dict[str, Any]]:
+        return [self.error]
+
+
+# ─── Structs ──────────────────────────────────────────────────────
+
+@dataclass(slots=True, frozen=True)
+class RecognizeFrameStruct:
+    sessionId: str
+    frame: str
+
+
+@dataclass(slots=True, frozen=True)
+class LearnAttemptStruct:
+    sessionId: str
+    targetWord: str
+    frame: str
+
+
+@dataclass(slots=True, frozen=True)
+class GameAttemptStruct:
+    sessionId: str
+    gameId: str
+    frame: str
+
+
+@dataclass(slots=True, frozen=True)
+class ARLandmarksStruct:
+    sessionId: str
+    frame: str
+
+
+# ─── Decoders ─────────────────────────────────────────────────────
+
+def _load_object(raw: bytes) -> Dict[str, Any]:
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        raise HotDecodeError("json_invalid", ("body", e.pos), "JSON decode error", {},
+                             ctx={"error": e.msg})
+    if type(data) is not dict:
+        raise HotDecodeError("model_attributes_type", ("body",),
+                             "Input should be a valid dictionary or object to extract fields from",
+                             data)
+    return data
+
+
+def _str_field(data: Dict[str, Any], name: str) -> str:
+    value = data.get(name)
+    if value is None:
+        raise HotDecodeError("missing", ("body", name), "Field required", data)
+    if type(value) is not str:
+        raise HotDecodeError("string_type", ("body", name), "Input should be a valid string", value)
+    return value
+
+
+def _id_field(data: Dict[str, Any], name: str) -> str:
+    # Ids repeat on every frame from the same client — share one object.
+    return sys.intern(_str_field(data, name))
+
+
+def decode_recognize_frame(raw: bytes) -> RecognizeFrameStruct:
+    """Decode a POST /api/recognize-frame body."""
+    data = _load_object(raw)
+    return RecognizeFrameStruct(
+        sessionId=_id_field(data, "sessionId"),
+        frame=_str_field(data, "frame"),
+    )
+
+
+def decode_learn_attempt(raw: bytes) -> LearnAttemptStruct:
+    """Decode a POST /api/learn/attempt body."""
+    data = _load_object(raw)
+    return LearnAttemptStruct(
+        sessionId=_id_field(data, "sessionId"),
+        targetWord=_id_field(data, "targetWord"),
+        frame=_str_field(data, "frame"),
+    )
+
+
+def decode_game_attempt(raw: bytes) -> GameAttemptStruct:
+    """Decode a POST /api/game/attempt body."""
+    data = _load_object(raw)
+    return GameAttemptStruct(
+        sessionId=_id_field(data, "sessionId"),
+        gameId=_id_field(data, "gameId"),
+        frame=_str_field(data, "frame"),
+    )
+
+
+def decode_ar_landmarks(raw: bytes) -> ARLandmarksStruct:
+    """Decode a POST /api/ar/landmarks body."""
+    data = _load_object(raw)
+    return ARLandmarksStruct(
+        sessionId=_id_field(data, "sessionId"),
+        frame=_str_field(data, "frame"),
+    )
+
+
+# ─── OpenAPI ──────────────────────────────────────────────────────
+
+def openapi_body(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Build `openapi_extra` documenting a route's body with a Pydantic model."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
@@ -29,14 +29,43 @@ class Settings:
     # ML Model paths — Ishit will place weights here
     MODEL_PATH: str = os.getenv("MODEL_PATH", "ml/models/weights/model.pth")
     ANN_MODEL_PATH: str = os.getenv("ANN_MODEL_PATH", "ml/models/weights/model.h5")
+    # YuNet face detector (OpenCV zoo); Haar cascade is used if it is absent
+    FACE_MODEL_PATH: str = os.getenv("FACE_MODEL_PATH", "ml/models/weights/face_detection_yunet_2023mar.onnx")
+    # MediaPipe HolisticLandmarker task bundle; keypoints use the legacy
+    # Holistic solution if it is absent
+    HOLISTIC_MODEL_PATH: str = os.getenv("HOLISTIC_MODEL_PATH", "ml/models/weights/holistic_landmarker.task")
+    # Sessions that keep their own Holistic graph (Tasks landmarker or legacy
+    # solution); each costs roughly 50-150 MB, so the least recently used
+    # session's graph is closed past this many
+    MAX_HOLISTIC_SESSIONS: int = int(os.getenv("MAX_HOLISTIC_SESSIONS", "8"))
+    # Load the face detector when app.main is imported, so a pre-forking
+    # server (gunicorn --preload) shares it copy-on-write across workers
+    PRELOAD_FACE_DETECTOR: bool = os.getenv("PRELOAD_FACE_DETECTOR", "false").lower() == "true"
 
     # Inference
+    # Fallback LSTM runtime: "keras" (FP32, XLA), "tflite" (INT8 weights,
+    # converted at startup), or "tensorrt" (needs an engine built with
+    # `python -m ml.trt_runner build`). Falls back to keras if unavailable.
+    LSTM_BACKEND: str = os.getenv("LSTM_BACKEND", "keras")
+    TRT_ENGINE_PATH: str = os.getenv("TRT_ENGINE_PATH", "ml/models/weights/lstm_fp16.engine")
+    # ISL module models (detection/recognition/translation) runtime: "keras"
+    # (traced tf.function) or "tflite" (INT8 weights, converted at startup)
+    ISL_MODEL_BACKEND: str = os.getenv("ISL_MODEL_BACKEND", "keras")
+    # Run the LSTM in float16: "auto" (on GPUs with compute capability >= 7.0),
+    # "true" or "false"
+    ENABLE_MIXED_PRECISION: str = os.getenv("ENABLE_MIXED_PRECISION", "auto")
+    # Concurrent sessions' LSTM calls are batched together: up to this many
+    # per forward pass, waiting at most LSTM_MAX_WAIT_MS for company (1 = off)
+    LSTM_MAX_BATCH: int = int(os.getenv("LSTM_MAX_BATCH", "8"))
+    LSTM_MAX_WAIT_MS: float = float(os.getenv("LSTM_MAX_WAIT_MS", "4"))
     CONFIDENCE_THRESHOLD: float = float(os.getenv("CONFIDENCE_THRESHOLD", "0.6"))
     BUFFER_SIZE: int = int(os.getenv("BUFFER_SIZE", "45"))
     FRAME_PROCESS_FPS: int = int(os.getenv("FRAME_PROCESS_FPS", "5"))
 
     # Frame validation
     MAX_FRAME_SIZE_BYTES: int = int(os.getenv("MAX_FRAME_SIZE_BYTES", str(1 * 1024 * 1024)))  # 1MB
+    # Frames wider than this are downscaled (during JPEG decode where possible)
+    TARGET_FRAME_WIDTH: int = int(os.getenv("TARGET_FRAME_WIDTH", "640"))
 
     # Game
     GAME_DURATION_SECONDS: int = int(os.getenv("GAME_DURATION_SECONDS", "30"))
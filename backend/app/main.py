@@ -14,10 +14,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
+from app.routing import ORJSONRoute
 from app.schemas import HealthResponse
 from app.session_store import get_active_session_count
 from ml.inference import initialize_model, is_model_loaded, initialize_isl_modules, are_isl_modules_initialized, get_isl_modules_status
 from ml.vocabulary import NUM_CLASSES
+from ml import face_detector, _landmark_kernels, _selection_kernels
 
 from app.database import engine
 from app import models
@@ -34,6 +36,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger("signvista")
 
+# Pre-fork: load the face detector in the master process (see ml.face_detector)
+if settings.PRELOAD_FACE_DETECTOR:
+    face_detector.warm_up()
+
 
 # ─── Lifespan (startup/shutdown) ──────────────────────────────────
 
@@ -66,6 +72,13 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("⚠️ ISL modules NOT initialized — using fallback LSTM only")
 
+    # Load the face gate's detector off the request path
+    face_detector.warm_up()
+
+    # JIT-compile the numba kernels (no-op without numba)
+    _selection_kernels.warm_up()
+    _landmark_kernels.warm_up()
+
     yield
 
     # Cleanup
@@ -86,6 +99,8 @@ app = FastAPI(
     docs_url="/docs",      # Swagger UI
     redoc_url="/redoc",    # ReDoc
 )
+# Parse JSON bodies with orjson (routers opt in via route_class too)
+app.router.route_class = ORJSONRoute
 
 
 # ─── CORS Middleware ──────────────────────────────────────────────
@@ -13,10 +13,11 @@ Ayush: Send frames here when AR mode is active. Use the landmark coordinates
 
 import logging
 
-import cv2
 import numpy as np
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 
+from app._schemas_hot import HotDecodeError, decode_ar_landmarks, openapi_body
 from app.schemas import (
     ARLandmarksRequest,
     ARLandmarksResponse,
@@ -24,18 +25,69 @@ from app.schemas import (
 )
 from app.utils.frame_utils import decode_base64_frame, validate_frame, resize_frame, FrameDecodeError
 from ml.face_detector import detect_face
-from ml.inference import predict_from_raw_frame
+from ml.inference import predict_from_raw_frame, run_in_frame_stage
+from ml.keypoint_extractor import to_rgb
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ar", tags=["AR"])
 
 
-def _extract_landmarks_full(frame: np.ndarray) -> dict:
+# Sentinel for "Mediapipe Pose/Hands solutions missing" (compared with `is`)
+_UNAVAILABLE = object()
+
+# Lazy-load Mediapipe Pose / Hands once. The graphs are shared by every
+# session, so they run in static image mode (no tracking state carried from
+# one user's frames into another's), and they are only ever used from the
+# single frame-stage worker thread (see _extract_landmarks_full).
+_pose = None
+_hands = None
+
+
+def _get_pose():
+    """Lazy-initialize Mediapipe Pose (_UNAVAILABLE if it can't be used)."""
+    global _pose
+    if _pose is None:
+        try:
+            import mediapipe as mp
+            _pose = mp.solutions.pose.Pose(
+                static_image_mode=True,
+                model_complexity=1,
+                min_detection_confidence=0.5,
+            )
+        except (ImportError, AttributeError):
+            _pose = _UNAVAILABLE
+    return _pose
+
+
+def _get_hands():
+    """Lazy-initialize Mediapipe Hands (_UNAVAILABLE if it can't be used)."""
+    global _hands
+    if _hands is None:
+        try:
+            import mediapipe as mp
+            _hands = mp.solutions.hands.Hands(
+                static_image_mode=True,
+                max_num_hands=2,
+                min_detection_confidence=0.5,
+            )
+        except (ImportError, AttributeError):
+            _hands = _UNAVAILABLE
+    return _hands
+
+
+async def _extract_landmarks_full(frame: np.ndarray) -> dict:
     """
     Extract both pose and hand landmarks from a frame.
     Returns all landmark data needed for AR overlay.
+
+    Runs on the frame-stage worker, off the event loop.
     """
+    return await run_in_frame_stage(_extract_landmarks_sync, frame)
+
+
+def _extract_landmarks_sync(frame: np.ndarray) -> dict:
+    """Blocking body of _extract_landmarks_full."""
     result = {
         "pose_landmarks": [],
         "left_hand_landmarks": [],
@@ -48,61 +100,53 @@ def _extract_landmarks_full(frame: np.ndarray) -> dict:
 
     # Extract pose landmarks via Mediapipe
     try:
-        import mediapipe as mp
+        pose, hands = _get_pose(), _get_hands()
+        if pose is _UNAVAILABLE or hands is _UNAVAILABLE:
+            raise ImportError("Mediapipe pose/hands solutions unavailable")
 
         # Pose landmarks (33 points)
-        with mp.solutions.pose.Pose(
-            static_image_mode=True,
-            model_complexity=1,
-            min_detection_confidence=0.5,
-        ) as pose:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pose_results = pose.process(frame_rgb)
-
-            if pose_results.pose_landmarks:
-                for lm in pose_results.pose_landmarks.landmark:
-                    result["pose_landmarks"].append(
+        frame_rgb = to_rgb(frame)
+        pose_results = pose.process(frame_rgb)
+
+        if pose_results.pose_landmarks:
+            for lm in pose_results.pose_landmarks.landmark:
+                result["pose_landmarks"].append(
+                    LandmarkPoint(
+                        x=round(lm.x, 4),
+                        y=round(lm.y, 4),
+                        z=round(lm.z, 4),
+                        visibility=round(lm.visibility, 3),
+                    )
+                )
+
+        # Hand landmarks (21 points per hand)
+        hand_results = hands.process(frame_rgb)
+
+        if hand_results.multi_hand_landmarks:
+            for idx, hand_lms in enumerate(hand_results.multi_hand_landmarks):
+                hand_points = []
+                for lm in hand_lms.landmark:
+                    hand_points.append(
                         LandmarkPoint(
                             x=round(lm.x, 4),
                             y=round(lm.y, 4),
                             z=round(lm.z, 4),
-                            visibility=round(lm.visibility, 3),
+                            visibility=1.0,
                         )
                     )
 
-        # Hand landmarks (21 points per hand)
-        with mp.solutions.hands.Hands(
-            static_image_mode=True,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-        ) as hands:
-            hand_results = hands.process(frame_rgb)
-
-            if hand_results.multi_hand_landmarks:
-                for idx, hand_lms in enumerate(hand_results.multi_hand_landmarks):
-                    hand_points = []
-                    for lm in hand_lms.landmark:
-                        hand_points.append(
-                            LandmarkPoint(
-                                x=round(lm.x, 4),
-                                y=round(lm.y, 4),
-                                z=round(lm.z, 4),
-                                visibility=1.0,
-                            )
-                        )
-
-                    # Determine handedness
-                    if hand_results.multi_handedness:
-                        handedness = hand_results.multi_handedness[idx].classification[0].label
-                        if handedness == "Left":
-                            result["left_hand_landmarks"] = hand_points
-                        else:
-                            result["right_hand_landmarks"] = hand_points
+                # Determine handedness
+                if hand_results.multi_handedness:
+                    handedness = hand_results.multi_handedness[idx].classification[0].label
+                    if handedness == "Left":
+                        result["left_hand_landmarks"] = hand_points
                     else:
-                        if idx == 0:
-                            result["right_hand_landmarks"] = hand_points
-                        else:
-                            result["left_hand_landmarks"] = hand_points
+                        result["right_hand_landmarks"] = hand_points
+                else:
+                    if idx == 0:
+                        result["right_hand_landmarks"] = hand_points
+                    else:
+                        result["left_hand_landmarks"] = hand_points
 
     except ImportError:
         logger.warning("⚠️ Mediapipe not installed — returning mock AR landmarks")
@@ -121,11 +165,26 @@ def _extract_landmarks_full(frame: np.ndarray) -> dict:
     return result
 
 
-@router.post("/landmarks", response_model=ARLandmarksResponse)
-async def get_ar_landmarks(request: ARLandmarksRequest):
+@router.post(
+    "/landmarks",
+    response_model=ARLandmarksResponse,
+    openapi_extra=openapi_body(ARLandmarksRequest),
+)
+async def get_ar_landmarks(http_request: Request):
     """
     Extract pose and hand landmarks from a camera frame for AR overlay.
+
+    Response fields:
+    - pose_landmarks: 33 pose points; left/right_hand_landmarks: 21 points each
+      (x, y, z plus visibility confidence)
+    - prediction / confidence: current sign prediction, if any
+    - gesture_hint: AR overlay hint text
     """
+    try:
+        request = decode_ar_landmarks(await http_request.body())
+    except HotDecodeError as e:
+        raise RequestValidationError(e.errors())
+
     if not request.sessionId or not request.sessionId.strip():
         raise HTTPException(status_code=400, detail="sessionId is required")
 
@@ -138,10 +197,10 @@ async def get_ar_landmarks(request: ARLandmarksRequest):
     if not validate_frame(frame):
         raise HTTPException(status_code=400, detail="Invalid frame")
 
-    frame = resize_frame(frame, target_width=640)
+    frame = resize_frame(frame)
 
     # Run ML inference pipeline + get raw landmarks (one pass!)
-    predicted, confidence, status, results, module_details = predict_from_raw_frame(
+    predicted, confidence, status, results, module_details = await predict_from_raw_frame(
         session_id=request.sessionId,
         frame=frame,
         return_landmarks=True,
@@ -159,21 +218,23 @@ async def get_ar_landmarks(request: ARLandmarksRequest):
     lh_lms = []
     rh_lms = []
     
+    # Tasks results hold plain landmark lists; legacy Holistic results wrap
+    # them in `.landmark`
     if results:
         if results.pose_landmarks:
             pose_lms = [
-                LandmarkPoint(x=round(lm.x, 4), y=round(lm.y, 4), z=round(lm.z, 4), visibility=round(lm.visibility, 3))
-                for lm in results.pose_landmarks.landmark
+                LandmarkPoint(x=round(lm.x, 4), y=round(lm.y, 4), z=round(lm.z, 4), visibility=round(lm.visibility or 0.0, 3))
+                for lm in getattr(results.pose_landmarks, "landmark", results.pose_landmarks)
             ]
         if results.left_hand_landmarks:
             lh_lms = [
                 LandmarkPoint(x=round(lm.x, 4), y=round(lm.y, 4), z=round(lm.z, 4), visibility=1.0)
-                for lm in results.left_hand_landmarks.landmark
+                for lm in getattr(results.left_hand_landmarks, "landmark", results.left_hand_landmarks)
             ]
         if results.right_hand_landmarks:
             rh_lms = [
                 LandmarkPoint(x=round(lm.x, 4), y=round(lm.y, 4), z=round(lm.z, 4), visibility=1.0)
-                for lm in results.right_hand_landmarks.landmark
+                for lm in getattr(results.right_hand_landmarks, "landmark", results.right_hand_landmarks)
             ]
 
     # Face detection using existing utility
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends
+from app.routing import ORJSONRoute
 from app.schemas import AuthRegisterRequest, AuthLoginRequest, AuthResponse
 from app.session_store import register_user, login_user, USERS
 import logging
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/auth", tags=["Authentication"])
+router = APIRouter(prefix="/api/auth", tags=["Authentication"], route_class=ORJSONRoute)
 
 @router.post("/register", response_model=AuthResponse)
 async def auth_register(request: AuthRegisterRequest):
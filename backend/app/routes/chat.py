@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException
+from app.routing import ORJSONRoute
 from typing import List, Optional
 from pydantic import BaseModel
 import time
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 class Message(BaseModel):
     id: str
@@ -1,12 +1,13 @@
 from typing import List
 from fastapi import APIRouter, HTTPException, Depends
+from app.routing import ORJSONRoute
 from app.schemas import CommunityFeedResponse, CreatePostRequest, LikeRequest, CommunityPost, ActiveUsersResponse
 from app.session_store import get_session, get_community_feed, add_community_post, toggle_like, get_active_users
 from app.dependencies import get_current_user
 import time
-import uuid
+import secrets
 
-router = APIRouter(prefix="/api/community", tags=["Community"])
+router = APIRouter(prefix="/api/community", tags=["Community"], route_class=ORJSONRoute)
 
 @router.get("/feed", response_model=CommunityFeedResponse)
 async def get_feed():
@@ -37,7 +38,7 @@ async def create_post(request: CreatePostRequest, current_user: dict = Depends(g
     
     # Use real user data from JWT
     new_post = {
-        "id": str(uuid.uuid4())[:8],
+        "id": secrets.token_hex(4),
         "user_name": current_user["name"],
         "avatar_initials": current_user["name"][:2].upper(),
         "content": request.content,
@@ -7,12 +7,15 @@ Ayush: The ultimate personalized dashboard endpoint.
        Call this when the user lands on the dashboard.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from app.dependencies import get_current_user
+from itertools import islice
 from typing import List
 
 from app.schemas import DashboardResponse, XPLevelInfo, ActivityEvent
-from app.session_store import get_session, USER_LEVEL_THRESHOLDS
+from app.session_store import (
+    get_session, UserSession, USER_LEVEL_THRESHOLDS, cache_dashboard, get_cached_dashboard,
+)
 from app.routes.history import format_activity_title, format_activity_desc
 from ml.vocabulary import WORD_LIST
 
@@ -23,9 +26,21 @@ router = APIRouter(prefix="/api", tags=["Dashboard"])
 async def get_dashboard(session_id: str, current_user: dict = Depends(get_current_user)):
     """
     Get aggregated dashboard summary.
+
+    Served from pre-encoded JSON until the session's dashboard_version changes.
     """
     session = get_session(session_id)
-    
+    cached = get_cached_dashboard(session_id, session.dashboard_version)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    body = _build_dashboard(session_id, session).model_dump_json().encode()
+    cache_dashboard(session_id, session.dashboard_version, body)
+    return Response(content=body, media_type="application/json")
+
+
+def _build_dashboard(session_id: str, session: UserSession) -> DashboardResponse:
+    """Assemble the dashboard model from live session state."""
     # Calculate XP Bar
     lvl = session.level
     current_xp = session.total_xp
@@ -53,7 +68,7 @@ async def get_dashboard(session_id: str, current_user: dict = Depends(get_curren
 
     # Recent Activity (last 5)
     recent = []
-    for h in session.activity_history[-5:][::-1]:
+    for h in islice(reversed(session.activity_history), 5):
         recent.append(ActivityEvent(
             type=h["type"],
             timestamp=h["timestamp"],
@@ -5,6 +5,7 @@ Debug endpoint for ISL detection analysis.
 import logging
 import numpy as np
 from fastapi import APIRouter, HTTPException
+from app.routing import ORJSONRoute
 
 from app.schemas import RecognizeFrameRequest
 from app.utils.frame_utils import decode_base64_frame, validate_frame, resize_frame, FrameDecodeError
@@ -13,7 +14,7 @@ from ml.vocabulary import get_word_by_module_index
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/debug", tags=["Debug"])
+router = APIRouter(prefix="/api/debug", tags=["Debug"], route_class=ORJSONRoute)
 
 
 @router.post("/analyze-detection")
@@ -34,7 +35,7 @@ async def analyze_detection(request: RecognizeFrameRequest):
     if not validate_frame(frame):
         raise HTTPException(status_code=400, detail="Invalid frame")
 
-    frame = resize_frame(frame, target_width=640)
+    frame = resize_frame(frame)
 
     if _detection_module is None:
         raise HTTPException(status_code=503, detail="Detection module not initialized")
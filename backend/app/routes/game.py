@@ -12,14 +12,18 @@ Ayush: Start a game → get challenges → submit frames → show final score.
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from app.routing import ORJSONRoute
 
+from app._schemas_hot import HotDecodeError, decode_game_attempt, openapi_body
 from app.schemas import (
     GameStartRequest,
     GameStartResponse,
     GameAttemptRequest,
     GameAttemptResponse,
     GameResultResponse,
+    to_basis_points,
 )
 from app.session_store import get_session
 from app.utils.frame_utils import decode_base64_frame, validate_frame, resize_frame, FrameDecodeError
@@ -28,7 +32,7 @@ from ml.vocabulary import WORD_DISPLAY
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/game", tags=["Game"])
+router = APIRouter(prefix="/api/game", tags=["Game"], route_class=ORJSONRoute)
 
 
 @router.post("/start", response_model=GameStartResponse)
@@ -60,8 +64,12 @@ async def start_game(request: GameStartRequest):
     )
 
 
-@router.post("/attempt", response_model=GameAttemptResponse)
-async def game_attempt(request: GameAttemptRequest):
+@router.post(
+    "/attempt",
+    response_model=GameAttemptResponse,
+    openapi_extra=openapi_body(GameAttemptRequest),
+)
+async def game_attempt(http_request: Request):
     """
     Submit a sign during an active game.
 
@@ -76,7 +84,19 @@ async def game_attempt(request: GameAttemptRequest):
         "frame": "data:image/jpeg;base64,..."
     }
     ```
+    `gameId` comes from POST /api/game/start.
+
+    Response fields:
+    - predicted / correct: model prediction and whether it matched the challenge
+    - currentChallenge: word to sign (same if wrong, next if correct)
+    - score / streak / multiplier / wordsCompleted: running game state
+    - confidence_bp: model confidence in basis points (0-10000)
     """
+    try:
+        request = decode_game_attempt(await http_request.body())
+    except HotDecodeError as e:
+        raise RequestValidationError(e.errors())
+
     if not request.sessionId or not request.sessionId.strip():
         raise HTTPException(status_code=400, detail="sessionId is required")
 
@@ -103,10 +123,10 @@ async def game_attempt(request: GameAttemptRequest):
     if not validate_frame(frame):
         raise HTTPException(status_code=400, detail="Invalid frame")
 
-    frame = resize_frame(frame, target_width=640)
+    frame = resize_frame(frame)
 
     # Run ML inference
-    predicted, confidence, buffer_status, _, _ = predict_from_raw_frame(
+    predicted, confidence, buffer_status, _, _ = await predict_from_raw_frame(
         session_id=f"{request.sessionId}_game_{request.gameId}",
         frame=frame,
     )
@@ -127,7 +147,7 @@ async def game_attempt(request: GameAttemptRequest):
         streak=result["streak"],
         multiplier=result["multiplier"],
         wordsCompleted=result["wordsCompleted"],
-        confidence=round(confidence, 3),
+        confidence_bp=to_basis_points(confidence),
     )
 
 
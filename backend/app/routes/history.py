@@ -62,7 +62,7 @@ async def get_history(
     Get session activity history with formatting for display.
     """
     session = get_session(session_id)
-    raw_history = session.activity_history[::-1]  # Newest first
+    raw_history = reversed(session.activity_history)  # Newest first
     
     events = []
     for h in raw_history:
@@ -10,9 +10,11 @@ Ayush: User selects a word from vocabulary, records their sign,
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 
-from app.schemas import LearnAttemptRequest, LearnAttemptResponse
+from app._schemas_hot import HotDecodeError, decode_learn_attempt, openapi_body
+from app.schemas import FaultCode, LearnAttemptRequest, LearnAttemptResponse, to_basis_points
 from app.session_store import get_session
 from app.utils.frame_utils import decode_base64_frame, validate_frame, resize_frame, FrameDecodeError
 from ml.inference import predict_from_raw_frame
@@ -23,8 +25,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/learn", tags=["Learn"])
 
 
-@router.post("/attempt", response_model=LearnAttemptResponse)
-async def learn_attempt(request: LearnAttemptRequest):
+@router.post(
+    "/attempt",
+    response_model=LearnAttemptResponse,
+    openapi_extra=openapi_body(LearnAttemptRequest),
+)
+async def learn_attempt(http_request: Request):
     """
     Submit a practice attempt for a specific word.
 
@@ -43,7 +49,20 @@ async def learn_attempt(request: LearnAttemptRequest):
         "frame": "data:image/jpeg;base64,/9j/4AAQ..."
     }
     ```
+
+    Response fields:
+    - predicted / correct: model prediction and whether it matches targetWord
+    - proficiency_bp: proficiency for this word in basis points (0-10000)
+    - attempts / correct_count: running totals for this word
+    - fault: FaultCode — the client renders the feedback text
+    - buffer_status: 'collecting (n/45)' while building the frame buffer
+    - confidence_bp: raw model confidence in basis points (0-10000)
     """
+    try:
+        request = decode_learn_attempt(await http_request.body())
+    except HotDecodeError as e:
+        raise RequestValidationError(e.errors())
+
     # Validate session ID
     if not request.sessionId or not request.sessionId.strip():
         raise HTTPException(status_code=400, detail="sessionId is required")
@@ -64,10 +83,10 @@ async def learn_attempt(request: LearnAttemptRequest):
     if not validate_frame(frame):
         raise HTTPException(status_code=400, detail="Invalid frame")
 
-    frame = resize_frame(frame, target_width=640)
+    frame = resize_frame(frame)
 
     # Run ML inference
-    predicted, confidence, buffer_status, _, _ = predict_from_raw_frame(
+    predicted, confidence, buffer_status, _, _ = await predict_from_raw_frame(
         session_id=request.sessionId,
         frame=frame,
     )
@@ -77,11 +96,12 @@ async def learn_attempt(request: LearnAttemptRequest):
         return LearnAttemptResponse(
             predicted=None,
             correct=False,
-            proficiency=0.0,
+            proficiency_bp=0,
             attempts=0,
             correct_count=0,
-            fault=f"Building frame buffer... {buffer_status}",
-            confidence=0.0,
+            fault=FaultCode.BUFFERING,
+            buffer_status=buffer_status,
+            confidence_bp=0,
         )
 
     # Record attempt in session
@@ -96,9 +116,9 @@ async def learn_attempt(request: LearnAttemptRequest):
     return LearnAttemptResponse(
         predicted=predicted,
         correct=result["correct"],
-        proficiency=result["proficiency"],
+        proficiency_bp=to_basis_points(result["proficiency"] / 100),
         attempts=result["attempts"],
         correct_count=result["correct_count"],
         fault=result["fault"],
-        confidence=round(confidence, 3),
+        confidence_bp=to_basis_points(confidence),
     )
@@ -5,7 +5,8 @@ POST /api/profile       — Create/update user profile
 GET  /api/profile/{sessionId} — Get user profile + welcome message
 
 Ayush: Call POST after the onboarding form, GET when loading the dashboard.
-       Welcome message comes in the user's preferred language.
+       The welcome text is rendered client-side from welcome_key in the
+       user's preferred language.
 """
 
 import time
@@ -13,6 +14,7 @@ import logging
 from typing import Dict, Optional
 
 from fastapi import APIRouter, HTTPException, Depends
+from app.routing import ORJSONRoute
 from app.dependencies import get_current_user
 
 from app.schemas import ProfileCreateRequest, ProfileResponse
@@ -22,7 +24,7 @@ from ml.sign_demos import get_sign_demo
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api", tags=["Profile"])
+router = APIRouter(prefix="/api", tags=["Profile"], route_class=ORJSONRoute)
 
 
 # ─── In-Memory Profile Store ─────────────────────────────────────
@@ -32,10 +34,8 @@ _profiles: Dict[str, Dict] = {}
 
 # ─── Welcome Messages ────────────────────────────────────────────
 
-WELCOME_MESSAGES = {
-    "en": "Welcome to SignVista, {name}! 🖐️ Let's bridge the communication gap together.",
-    "hi": "साइनविस्टा में आपका स्वागत है, {name}! 🖐️ आइए साथ मिलकर संवाद की खाई पाटें।",
-}
+# Text for this key lives in the frontend string table (en/hi).
+WELCOME_KEY = "welcome"
 
 WELCOME_SIGN_WORDS = ["hello", "good", "friend"]  # Words shown as sign greeting
 
@@ -83,11 +83,6 @@ async def create_profile(request: ProfileCreateRequest, current_user: dict = Dep
     # Ensure session exists
     get_session(request.sessionId)
 
-    # Build welcome response
-    welcome_msg = WELCOME_MESSAGES.get(lang, WELCOME_MESSAGES["en"]).format(
-        name=profile["name"]
-    )
-
     # Get sign data for welcome words
     welcome_signs = []
     for word in WELCOME_SIGN_WORDS:
@@ -107,7 +102,7 @@ async def create_profile(request: ProfileCreateRequest, current_user: dict = Dep
         email=profile["email"],
         phone=profile["phone"],
         preferred_language=profile["preferred_language"],
-        welcome_message=welcome_msg,
+        welcome_key=WELCOME_KEY,
         welcome_sign_data=welcome_signs,
         created_at=profile["created_at"],
     )
@@ -141,11 +136,6 @@ async def get_profile(session_id: str, current_user: dict = Depends(get_current_
         else:
             raise HTTPException(status_code=404, detail="Profile not found. Create one with POST /api/profile first.")
 
-    lang = profile["preferred_language"]
-    welcome_msg = WELCOME_MESSAGES.get(lang, WELCOME_MESSAGES["en"]).format(
-        name=profile["name"]
-    )
-
     welcome_signs = []
     for word in WELCOME_SIGN_WORDS:
         demo = get_sign_demo(word)
@@ -164,7 +154,7 @@ async def get_profile(session_id: str, current_user: dict = Depends(get_current_
         email=profile["email"],
         phone=profile["phone"],
         preferred_language=profile["preferred_language"],
-        welcome_message=welcome_msg,
+        welcome_key=WELCOME_KEY,
         welcome_sign_data=welcome_signs,
         created_at=profile["created_at"],
     )
@@ -8,6 +8,7 @@ Manages user application preferences in the SQLite database.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from app.routing import ORJSONRoute
 from sqlalchemy.orm import Session
 import time
 
@@ -15,7 +16,7 @@ from app.dependencies import get_current_user
 from app.database import get_db
 from app import models, schemas
 
-router = APIRouter(prefix="/api", tags=["Settings"])
+router = APIRouter(prefix="/api", tags=["Settings"], route_class=ORJSONRoute)
 
 
 @router.get("/settings/{session_id}", response_model=schemas.UserSettingsResponse)
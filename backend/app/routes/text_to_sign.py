@@ -15,6 +15,7 @@ import re
 from typing import List
 
 from fastapi import APIRouter, HTTPException
+from app.routing import ORJSONRoute
 
 from app.schemas import (
     TextToSignRequest,
@@ -27,7 +28,7 @@ from ml.vocabulary import WORD_DISPLAY, WORD_TO_INDEX, is_valid_word
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api", tags=["Text-to-Sign"])
+router = APIRouter(prefix="/api", tags=["Text-to-Sign"], route_class=ORJSONRoute)
 
 
 # ─── Hindi → English Word Mapping (basic) ─────────────────────────
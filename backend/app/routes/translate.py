@@ -4,15 +4,26 @@ SignVista — Translate Route
 POST /api/recognize-frame
 Real-time ISL word recognition from webcam frames.
 
+GET  /api/recognize-frame/history/{sessionId}
+Last 5 predicted words.
+
 Ayush: Send a base64 JPEG frame every 200ms.
-       Response includes word, confidence, buffer status, and history.
+       Response includes word, confidence, buffer status, and history_version.
+       Re-fetch the history only when history_version changes.
 """
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 
-from app.schemas import RecognizeFrameRequest, RecognizeFrameResponse
+from app._schemas_hot import HotDecodeError, decode_recognize_frame, openapi_body
+from app.schemas import (
+    RecognizeFrameRequest,
+    RecognizeFrameResponse,
+    TranslateHistoryResponse,
+    to_basis_points,
+)
 from app.session_store import get_session
 from app.utils.frame_utils import decode_base64_frame, validate_frame, resize_frame, FrameDecodeError
 from ml.inference import predict_from_raw_frame
@@ -22,9 +33,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["Translate"])
 
 
-@router.post("/recognize-frame", response_model=RecognizeFrameResponse)
+@router.post(
+    "/recognize-frame",
+    response_model=RecognizeFrameResponse,
+    openapi_extra=openapi_body(RecognizeFrameRequest),
+)
 async def recognize_frame(
-    request: RecognizeFrameRequest,
+    http_request: Request,
     return_module_details: bool = False
 ):
     """
@@ -39,7 +54,7 @@ async def recognize_frame(
     6. Return word + confidence
 
     Args:
-        request: Frame data with sessionId and base64 frame
+        http_request: Raw request; the body is decoded into a RecognizeFrameStruct
         return_module_details: Optional query parameter to include detailed module information
                                in the response (active modules, all predictions, timing info)
 
@@ -50,7 +65,21 @@ async def recognize_frame(
         "frame": "data:image/jpeg;base64,/9j/4AAQ..."
     }
     ```
+    `frame` is a base64 JPEG, with or without the data URI prefix.
+
+    Response fields:
+    - word: predicted ISL word, null if no confident prediction
+    - confidence_bp: prediction confidence in basis points (0-10000)
+    - buffer_status: 'collecting' while building the 45-frame buffer, 'ready' when predicting
+    - history_version: bumped when a word is added to the history; re-fetch
+      it from GET /api/recognize-frame/history/{sessionId} when it changes
+    - module_details: per-module predictions/timing, only when requested
     """
+    try:
+        request = decode_recognize_frame(await http_request.body())
+    except HotDecodeError as e:
+        raise RequestValidationError(e.errors())
+
     # Validate session ID
     if not request.sessionId or not request.sessionId.strip():
         raise HTTPException(status_code=400, detail="sessionId is required")
@@ -66,10 +95,10 @@ async def recognize_frame(
         raise HTTPException(status_code=400, detail="Invalid frame: too small or wrong format")
 
     # Resize for performance
-    frame = resize_frame(frame, target_width=640)
+    frame = resize_frame(frame)
 
     # Run ML inference pipeline (with landmarks for AR mapping if needed)
-    word, confidence, buffer_status, _, module_details = predict_from_raw_frame(
+    word, confidence, buffer_status, _, module_details = await predict_from_raw_frame(
         session_id=request.sessionId,
         frame=frame,
         return_module_details=return_module_details
@@ -90,8 +119,27 @@ async def recognize_frame(
 
     return RecognizeFrameResponse(
         word=word,
-        confidence=round(confidence, 3),
+        confidence_bp=to_basis_points(confidence),
         buffer_status=buffer_status,
-        history=session.translate.get_history(),
+        history_version=session.translate.history_version,
         module_details=module_details
     )
+
+
+@router.get("/recognize-frame/history/{session_id}", response_model=TranslateHistoryResponse)
+async def get_translate_history(session_id: str):
+    """
+    Get the last 5 predicted words for a translate session.
+
+    Ayush calls this only when history_version in a recognize-frame
+    response differs from the last one seen.
+    """
+    if not session_id or not session_id.strip():
+        raise HTTPException(status_code=400, detail="sessionId is required")
+
+    session = get_session(session_id)
+    return TranslateHistoryResponse(
+        sessionId=session_id,
+        history=session.translate.get_history(),
+        history_version=session.translate.history_version,
+    )
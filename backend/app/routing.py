@@ -0,0 +1,41 @@
+"""
+SignVista Route Class
+
+APIRoute subclass that parses JSON request bodies with orjson.
+FastAPI reads bodies through starlette's Request.json(), which caches the
+parsed value on `request._json`; filling that cache first means the stdlib
+json parser never runs.
+
+Routers that take Pydantic body models use:
+    router = APIRouter(..., route_class=ORJSONRoute)
+"""
+
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that pre-parses JSON bodies with orjson."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_handler = super().get_route_handler()
+
+        # Routes without a body model (including the per-frame routes that
+        # decode their raw body themselves) never call request.json().
+        if self.body_field is None:
+            return original_handler
+
+        async def orjson_route_handler(request: Request) -> Response:
+            body = await request.body()
+            if body and "json" in request.headers.get("content-type", ""):
+                try:
+                    request._json = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    # Leave the cache empty so FastAPI raises its usual 422
+                    pass
+            return await original_handler(request)
+
+        return orjson_route_handler
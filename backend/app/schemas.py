@@ -5,58 +5,110 @@ These define the exact JSON contracts between Ayush's frontend and our backend.
 Ayush: Use these as your TypeScript interface reference.
 """
 
-from typing import Dict, List, Optional
+import sys
+from enum import IntEnum
+from typing import Annotated, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+
+# Confidence/proficiency values on the per-frame responses are sent as
+# integer basis points (0-10000) — cheaper to encode than floats.
+BASIS_POINTS = 10_000
+
+
+def to_basis_points(fraction: float) -> int:
+    """Convert a 0.0-1.0 fraction to integer basis points (0-10000)."""
+    return int(round(fraction * BASIS_POINTS))
+
+
+# Ids repeat on every request from the same client — intern them so equal
+# values share one string object.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Closed value sets, validated by pydantic-core's literal fast path.
+Difficulty = Literal["easy", "medium", "hard"]
+MasteryTier = Literal["Novice", "Beginner", "Intermediate", "Advanced", "Master"]
+Language = Literal["en", "hi"]
+Theme = Literal["light", "dark", "system"]
+
+
+class FaultCode(IntEnum):
+    """Learn-mode feedback codes. The frontend maps these to en/hi text."""
+    GOOD = 0
+    EXCELLENT = 1
+    IMPRECISE = 2
+    LOW_CONFIDENCE = 3
+    NOT_RECOGNIZED = 4
+    CLOSE = 5
+    INCORRECT = 6
+    BUFFERING = 7
 
 
 # ─── Translate Mode ───────────────────────────────────────────────
 
 class RecognizeFrameRequest(BaseModel):
     """POST /api/recognize-frame — sent every 200ms from frontend camera."""
-    sessionId: str = Field(..., description="Unique session identifier")
-    frame: str = Field(..., description="Base64-encoded JPEG frame (with or without data URI prefix)")
+    sessionId: InternedStr
+    frame: str
 
 
 class RecognizeFrameResponse(BaseModel):
     """Response from translation inference."""
-    word: Optional[str] = Field(None, description="Predicted ISL word (null if no confident prediction)")
-    confidence: float = Field(0.0, description="Prediction confidence 0.0-1.0")
-    buffer_status: str = Field("collecting", description="'collecting' while building 45-frame buffer, 'ready' when predicting")
-    history: List[str] = Field(default_factory=list, description="Last 5 predicted words for context")
-    module_details: Optional[Dict] = Field(None, description="Detailed module information (optional, only when requested)")
+    model_config = ConfigDict(frozen=True)
+
+    word: Optional[str] = None
+    confidence_bp: int = 0
+    buffer_status: str = "collecting"
+    history_version: int = 0
+    module_details: Optional[Dict] = None
+
+
+class TranslateHistoryResponse(BaseModel):
+    """GET /api/recognize-frame/history/{sessionId} — last 5 predicted words."""
+    model_config = ConfigDict(frozen=True)
+
+    sessionId: str
+    history: List[str] = Field(default_factory=list)
+    history_version: int = 0
 
 
 # ─── Learn Mode ───────────────────────────────────────────────────
 
 class LearnAttemptRequest(BaseModel):
     """POST /api/learn/attempt — practice a specific word."""
-    sessionId: str = Field(..., description="Unique session identifier")
-    targetWord: str = Field(..., description="The word the user is trying to sign")
-    frame: str = Field(..., description="Base64-encoded JPEG frame")
+    sessionId: InternedStr
+    targetWord: InternedStr
+    frame: str
 
 
 class LearnAttemptResponse(BaseModel):
     """Response with proficiency feedback."""
-    predicted: Optional[str] = Field(None, description="What the model predicted")
-    correct: bool = Field(False, description="Whether predicted matches targetWord")
-    proficiency: float = Field(0.0, description="Proficiency percentage for this word (0-100)")
-    attempts: int = Field(0, description="Total attempts for this word")
-    correct_count: int = Field(0, description="Total correct attempts for this word")
-    fault: str = Field("", description="Feedback message — 'Good form!' or specific fault")
-    confidence: float = Field(0.0, description="Raw model confidence")
+    model_config = ConfigDict(frozen=True)
+
+    predicted: Optional[str] = None
+    correct: bool = False
+    proficiency_bp: int = 0
+    attempts: int = 0
+    correct_count: int = 0
+    fault: FaultCode = FaultCode.GOOD
+    buffer_status: str = "ready"
+    confidence_bp: int = 0
 
 
 # ─── Game Mode ────────────────────────────────────────────────────
 
 class GameStartRequest(BaseModel):
     """POST /api/game/start — initialize a new game round."""
-    sessionId: str = Field(..., description="Unique session identifier")
+    sessionId: InternedStr = Field(..., description="Unique session identifier")
     duration: int = Field(30, description="Game duration in seconds (default 30)")
 
 
 class GameStartResponse(BaseModel):
     """Returns the first challenge word and game metadata."""
+    model_config = ConfigDict(frozen=True)
+
     gameId: str = Field(..., description="Unique game session ID")
     currentChallenge: str = Field(..., description="First word to sign")
     duration: int = Field(30, description="Game duration in seconds")
@@ -65,25 +117,29 @@ class GameStartResponse(BaseModel):
 
 class GameAttemptRequest(BaseModel):
     """POST /api/game/attempt — submit a sign during game."""
-    sessionId: str = Field(..., description="Unique session identifier")
-    gameId: str = Field(..., description="Game session ID from /game/start")
-    frame: str = Field(..., description="Base64-encoded JPEG frame")
+    sessionId: InternedStr
+    gameId: InternedStr
+    frame: str
 
 
 class GameAttemptResponse(BaseModel):
     """Response after each game attempt."""
-    predicted: Optional[str] = Field(None, description="What the model predicted")
-    correct: bool = Field(False, description="Whether it matched the challenge")
-    currentChallenge: str = Field(..., description="Current word to sign (same if wrong, next if correct)")
-    score: int = Field(0, description="Current total score")
-    streak: int = Field(0, description="Current consecutive correct streak")
-    multiplier: int = Field(1, description="Current streak multiplier")
-    wordsCompleted: int = Field(0, description="Total words signed correctly this game")
-    confidence: float = Field(0.0, description="Model confidence")
+    model_config = ConfigDict(frozen=True)
+
+    predicted: Optional[str] = None
+    correct: bool = False
+    currentChallenge: str
+    score: int = 0
+    streak: int = 0
+    multiplier: int = 1
+    wordsCompleted: int = 0
+    confidence_bp: int = 0
 
 
 class GameResultResponse(BaseModel):
     """GET /api/game/result/{sessionId}/{gameId} — final game results."""
+    model_config = ConfigDict(frozen=True)
+
     gameId: str
     score: int = Field(0)
     wordsCompleted: int = Field(0)
@@ -97,7 +153,8 @@ class GameResultResponse(BaseModel):
 
 # ─── Stats ────────────────────────────────────────────────────────
 
-class WordStats(BaseModel):
+@dataclass(frozen=True, slots=True)
+class WordStats:
     """Stats for a single word."""
     attempts: int = 0
     correct: int = 0
@@ -106,6 +163,8 @@ class WordStats(BaseModel):
 
 class SessionStatsResponse(BaseModel):
     """GET /api/stats/{sessionId} — complete learning stats."""
+    model_config = ConfigDict(frozen=True)
+
     sessionId: str
     words: Dict[str, WordStats] = Field(default_factory=dict)
     total_attempts: int = 0
@@ -128,6 +187,8 @@ class WordInfo(BaseModel):
 
 class VocabularyResponse(BaseModel):
     """GET /api/vocabulary — available words."""
+    model_config = ConfigDict(frozen=True)
+
     total: int
     words: List[WordInfo]
 
@@ -136,6 +197,8 @@ class VocabularyResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """GET /health"""
+    model_config = ConfigDict(frozen=True)
+
     status: str = "ok"
     model_loaded: bool = False
     active_sessions: int = 0
@@ -148,7 +211,7 @@ class HealthResponse(BaseModel):
 
 class ProfileCreateRequest(BaseModel):
     """POST /api/profile — register/update user profile."""
-    sessionId: str = Field(..., description="Unique session identifier")
+    sessionId: InternedStr = Field(..., description="Unique session identifier")
     name: str = Field(..., description="User's full name", min_length=1, max_length=100)
     email: str = Field(..., description="User's email address")
     phone: str = Field("", description="Phone number (optional)")
@@ -157,12 +220,14 @@ class ProfileCreateRequest(BaseModel):
 
 class ProfileResponse(BaseModel):
     """Response with user profile data."""
+    model_config = ConfigDict(frozen=True)
+
     sessionId: str
     name: str
     email: str
     phone: str = ""
-    preferred_language: str = "en"
-    welcome_message: str = Field("", description="Welcome text in preferred language")
+    preferred_language: Language = "en"
+    welcome_key: str = Field("welcome", description="Message key — client renders it in preferred_language")
     welcome_sign_data: List[Dict] = Field(default_factory=list, description="Sign language GIF data for welcome")
     created_at: Optional[float] = None
 
@@ -187,6 +252,8 @@ class SignWordData(BaseModel):
 
 class TextToSignResponse(BaseModel):
     """Response with sign language data for each word."""
+    model_config = ConfigDict(frozen=True)
+
     original_text: str
     words: List[SignWordData]
     total_words: int = 0
@@ -198,12 +265,14 @@ class TextToSignResponse(BaseModel):
 
 class SignDemoResponse(BaseModel):
     """GET /api/signs/{word} — get sign demonstration data for a word."""
+    model_config = ConfigDict(frozen=True)
+
     word: str
     display_name: str
     gif_url: str = Field("", description="URL to the GIF demonstration")
     description: str = Field("", description="Step-by-step description of the sign")
     tips: List[str] = Field(default_factory=list, description="Practice tips")
-    difficulty: str = Field("easy", description="easy | medium | hard")
+    difficulty: Difficulty = Field("easy", description="easy | medium | hard")
     category: str = Field("common", description="Word category")
 
 
@@ -211,27 +280,30 @@ class SignDemoResponse(BaseModel):
 
 class ARLandmarksRequest(BaseModel):
     """POST /api/ar/landmarks — extract landmarks for AR overlay."""
-    sessionId: str = Field(..., description="Unique session identifier")
-    frame: str = Field(..., description="Base64-encoded JPEG frame")
+    sessionId: InternedStr
+    frame: str
 
 
-class LandmarkPoint(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LandmarkPoint:
     """Single landmark point with 3D coordinates."""
     x: float
     y: float
     z: float
-    visibility: float = Field(1.0, description="Landmark visibility confidence")
+    visibility: float = 1.0
 
 
 class ARLandmarksResponse(BaseModel):
     """Response with pose and hand landmarks for AR rendering."""
-    pose_landmarks: List[LandmarkPoint] = Field(default_factory=list, description="33 pose landmarks")
-    left_hand_landmarks: List[LandmarkPoint] = Field(default_factory=list, description="21 left hand landmarks")
-    right_hand_landmarks: List[LandmarkPoint] = Field(default_factory=list, description="21 right hand landmarks")
+    model_config = ConfigDict(frozen=True)
+
+    pose_landmarks: List[LandmarkPoint] = Field(default_factory=list)
+    left_hand_landmarks: List[LandmarkPoint] = Field(default_factory=list)
+    right_hand_landmarks: List[LandmarkPoint] = Field(default_factory=list)
     face_detected: bool = False
-    prediction: Optional[str] = Field(None, description="Current sign prediction if available")
+    prediction: Optional[str] = None
     confidence: float = 0.0
-    gesture_hint: str = Field("", description="AR overlay hint text")
+    gesture_hint: str = ""
 
 
 # ─── Dictionary ──────────────────────────────────────────────────
@@ -242,13 +314,15 @@ class DictionaryEntry(BaseModel):
     display_name: str
     hindi_name: str = ""
     category: str = "common"
-    difficulty: str = "easy"
+    difficulty: Difficulty = "easy"
     gif_url: str = ""
     description: str = ""
     tips: List[str] = Field(default_factory=list)
 
 class DictionaryResponse(BaseModel):
     """GET /api/dictionary"""
+    model_config = ConfigDict(frozen=True)
+
     total: int
     categories: List[str]
     difficulties: List[str]
@@ -263,10 +337,12 @@ class ProgressWordDetail(BaseModel):
     proficiency: float
     attempts: int
     correct: int
-    mastery_tier: str = "Novice"  # Novice, Beginner, Intermediate, Advanced, Master
+    mastery_tier: MasteryTier = "Novice"
 
 class ProgressResponse(BaseModel):
     """GET /api/progress/{sessionId}"""
+    model_config = ConfigDict(frozen=True)
+
     sessionId: str
     overall_proficiency: float
     words_practiced: int
@@ -275,6 +351,8 @@ class ProgressResponse(BaseModel):
 
 class LearningPathResponse(BaseModel):
     """GET /api/progress/{sessionId}/next"""
+    model_config = ConfigDict(frozen=True)
+
     suggested_words: List[DictionaryEntry]
 
 class ActivityEvent(BaseModel):
@@ -287,6 +365,8 @@ class ActivityEvent(BaseModel):
 
 class HistoryResponse(BaseModel):
     """GET /api/history/{sessionId}"""
+    model_config = ConfigDict(frozen=True)
+
     sessionId: str
     activities: List[ActivityEvent]
 
@@ -300,11 +380,14 @@ class AchievementInfo(BaseModel):
 
 class AchievementsResponse(BaseModel):
     """GET /api/achievements/{sessionId}"""
+    model_config = ConfigDict(frozen=True)
+
     sessionId: str
     total_unlocked: int
     achievements: List[AchievementInfo]
 
-class XPLevelInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class XPLevelInfo:
     """XP bar details."""
     current_xp: int
     level: int
@@ -313,6 +396,8 @@ class XPLevelInfo(BaseModel):
 
 class DashboardResponse(BaseModel):
     """Unified dashboard data."""
+    model_config = ConfigDict(frozen=True)
+
     sessionId: str
     user_name: str = "User"
     xp_info: XPLevelInfo
@@ -358,6 +443,8 @@ class LikeRequest(BaseModel):
     postId: str
 
 class CommunityFeedResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     posts: List[CommunityPost]
 
 class ActiveUser(BaseModel):
@@ -366,6 +453,8 @@ class ActiveUser(BaseModel):
     is_online: bool = True
 
 class ActiveUsersResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     users: List[ActiveUser]
 
 
@@ -386,6 +475,8 @@ class AuthLoginRequest(BaseModel):
 
 class AuthResponse(BaseModel):
     """Authentication response payload."""
+    model_config = ConfigDict(frozen=True)
+
     status: str = "ok"
     sessionId: str
     user_name: str
@@ -399,6 +490,8 @@ class AuthResponse(BaseModel):
 # ─── Notifications & Settings ──────────────────────────────────────
 
 class NotificationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     title: str
     message: str
@@ -408,18 +501,22 @@ class NotificationResponse(BaseModel):
     action_url: Optional[str] = None
 
 class NotificationsListResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     unread_count: int
     notifications: List[NotificationResponse]
 
 class UserSettingsResponse(BaseModel):
-    theme: str
+    model_config = ConfigDict(frozen=True)
+
+    theme: Theme
     notifications_enabled: bool
     sound_enabled: bool
     daily_goal_minutes: int
     updated_at: float
 
 class UserSettingsUpdate(BaseModel):
-    theme: Optional[str] = None
+    theme: Optional[Theme] = None
     notifications_enabled: Optional[bool] = None
     sound_enabled: Optional[bool] = None
     daily_goal_minutes: Optional[int] = None
@@ -9,43 +9,136 @@ For production, replace with Redis or a database.
 """
 
 import time
-import uuid
+import secrets
 import random
-import json
 import os
-from collections import deque
-from typing import Any, Dict, List, Optional, Tuple
+import itertools
+import bisect
+import hashlib
+import threading
+import atexit
+import mmap
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import orjson
 
 from ml.vocabulary import WORD_LIST, WORD_DISPLAY, is_valid_word
+from ml.buffer_manager import delete_buffer, delete_all_buffers
+from ml.keypoint_extractor import close_session, close_all_sessions
+from ml import face_detector
 from app.config import settings
-from passlib.context import CryptContext
+from app.schemas import FaultCode
+import bcrypt
 
 # ─── Auth Setup ──────────────────────────────────────────────────
-pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
+# New hashes use bcrypt (native C); sha256_crypt is kept only so hashes
+# already in users_db.json still verify.
+BCRYPT_ROUNDS = 12
+BCRYPT_MAX_BYTES = 72  # bcrypt ignores anything past 72 bytes
+_legacy_pwd_context = None
+
+def get_legacy_pwd_context():
+    """
+    Return the sha256_crypt CryptContext, building it on first use.
+
+    passlib is only imported when a legacy hash is actually checked,
+    keeping it off the import path of every route module.
+    """
+    global _legacy_pwd_context
+    if _legacy_pwd_context is None:
+        from passlib.context import CryptContext
+        _legacy_pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
+    return _legacy_pwd_context
+
+# Process-local key so cached verifications are never keyed on plaintext
+_VERIFY_CACHE_KEY = os.urandom(16)
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    secret = password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+    return bcrypt.hashpw(secret, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("ascii")
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith("$2"):
+        secret = plain_password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+        return bcrypt.checkpw(secret, hashed_password.encode("ascii"))
+    return get_legacy_pwd_context().verify(plain_password, hashed_password)
+
+# Successful verifications, keyed on (keyed blake2b of plaintext, stored hash).
+# Bounded LRU; cleared whenever USERS is saved.
+VERIFY_CACHE_SIZE = 1024
+_verified: "OrderedDict[Tuple[bytes, str], None]" = OrderedDict()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    fingerprint = hashlib.blake2b(
+        plain_password.encode("utf-8"), key=_VERIFY_CACHE_KEY, digest_size=32
+    ).digest()
+    cache_key = (fingerprint, hashed_password)
+    if cache_key in _verified:
+        _verified.move_to_end(cache_key)
+        return True
+
+    if not _check_password(plain_password, hashed_password):
+        return False
+    _verified[cache_key] = None
+    if len(_verified) > VERIFY_CACHE_SIZE:
+        _verified.popitem(last=False)
+    return True
 
 # Persistent global users (in-memory mock database)
 USERS: Dict[str, Dict[str, Any]] = {}
 USERS_DB_PATH = "users_db.json"
 
+# Writes are debounced: bursts of registrations coalesce into one atomic
+# rewrite of users_db.json, SAVE_DELAY_SECONDS after the first change.
+SAVE_DELAY_SECONDS = 0.5
+_save_timer: Optional[threading.Timer] = None
+_save_lock = threading.Lock()
+
 def save_users():
-    try:
-        with open(USERS_DB_PATH, "w") as f:
-            json.dump(USERS, f, indent=4)
-    except Exception as e:
-        print(f"Error saving users: {e}")
+    global _save_timer
+    _verified.clear()
+    with _save_lock:
+        if _save_timer is not None:
+            return
+        _save_timer = threading.Timer(SAVE_DELAY_SECONDS, _flush_users)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+def _flush_users():
+    global _save_timer
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        tmp_path = USERS_DB_PATH + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(USERS, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_path, USERS_DB_PATH)
+        except Exception as e:
+            print(f"Error saving users: {e}")
+
+def _flush_pending_users():
+    if _save_timer is not None:
+        _flush_users()
+
+atexit.register(_flush_pending_users)
 
 def load_users():
     global USERS
     if os.path.exists(USERS_DB_PATH):
         try:
-            with open(USERS_DB_PATH, "r") as f:
-                USERS = json.load(f)
+            # Parse straight out of a read-only mapping — no buffered copy
+            fd = os.open(USERS_DB_PATH, os.O_RDONLY)
+            try:
+                if os.fstat(fd).st_size == 0:
+                    return
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        USERS = orjson.loads(view)
+            finally:
+                os.close(fd)
         except Exception as e:
             print(f"Error loading users: {e}")
 
@@ -55,7 +148,10 @@ load_users()
 
 # ─── Constants ───────────────────────────────────────────────────
 
-USER_LEVEL_THRESHOLDS = [0, 100, 300, 600, 1000, 1500, 2200, 3000, 4000, 5500]
+ACTIVITY_HISTORY_SIZE = 50  # Oldest entries fall off the activity log
+
+# Sorted XP needed to reach each level (index 0 → level 1)
+USER_LEVEL_THRESHOLDS = (0, 100, 300, 600, 1000, 1500, 2200, 3000, 4000, 5500)
 
 ACHIEVEMENT_DEFINITIONS = [
     {"id": "first_sign",      "name": "🌱 First Sign",      "desc": "First correct sign attempt"},
@@ -72,6 +168,12 @@ ACHIEVEMENT_DEFINITIONS = [
     {"id": "grandmaster",     "name": "👑 Grandmaster",     "desc": "Reach Level 10"},
 ]
 
+# Every achievement check_achievements can award ("on_fire" has no
+# streak tracking behind it yet, so it is never awarded).
+_CHECKED_ACHIEVEMENT_IDS = frozenset(
+    a["id"] for a in ACHIEVEMENT_DEFINITIONS if a["id"] != "on_fire"
+)
+
 
 # ─── Session Data Structures ─────────────────────────────────────
 
@@ -83,12 +185,14 @@ class TranslateSession:
         self.last_prediction: Optional[str] = None
         self.last_confidence: float = 0.0
         self.total_predictions: int = 0
+        self.history_version: int = 0  # Bumped whenever history changes
 
     def add_prediction(self, word: str, confidence: float):
         self.history.append(word)
         self.last_prediction = word
         self.last_confidence = confidence
         self.total_predictions += 1
+        self.history_version += 1
 
     def get_history(self) -> List[str]:
         return list(self.history)
@@ -99,6 +203,12 @@ class LearnSession:
 
     def __init__(self):
         self.word_stats: Dict[str, Dict[str, Any]] = {}
+        self._total_correct = 0  # Sum of word_stats[*]["correct"]
+        self._proficiency_sum = 0.0  # Sum of word_stats[*]["proficiency"]
+
+    @property
+    def total_correct(self) -> int:
+        return self._total_correct
 
     def record_attempt(self, target_word: str, predicted_word: Optional[str], confidence: float, user_session: Any) -> Dict[str, Any]:
         """Record a learning attempt and return updated stats."""
@@ -120,6 +230,7 @@ class LearnSession:
         is_correct = predicted_word is not None and predicted_word.lower() == word_key
         if is_correct:
             stats["correct"] += 1
+            self._total_correct += 1
             # Award XP for correct sign
             user_session.award_xp(10, f"Correct sign: {target_word}")
         else:
@@ -130,7 +241,9 @@ class LearnSession:
             stats["best_confidence"] = confidence
 
         # Calculate proficiency as percentage
+        old_proficiency = stats["proficiency"]
         stats["proficiency"] = round((stats["correct"] / stats["attempts"]) * 100, 1)
+        self._proficiency_sum += stats["proficiency"] - old_proficiency
 
         # Generate fault feedback
         fault = self._generate_fault(is_correct, confidence, stats)
@@ -153,24 +266,24 @@ class LearnSession:
             "fault": fault,
         }
 
-    def _generate_fault(self, is_correct: bool, confidence: float, stats: Dict) -> str:
-        """Generate feedback message based on attempt result."""
+    def _generate_fault(self, is_correct: bool, confidence: float, stats: Dict) -> FaultCode:
+        """Pick a feedback code based on attempt result."""
         if is_correct:
             if confidence >= 0.9:
-                return "Excellent form! Perfect sign! 🌟"
+                return FaultCode.EXCELLENT
             elif confidence >= 0.75:
-                return "Good form! Keep it up! 👍"
+                return FaultCode.GOOD
             elif confidence >= 0.6:
-                return "Correct! Try to be more precise with hand positioning."
+                return FaultCode.IMPRECISE
             else:
-                return "Correct, but confidence is low. Practice the motion more smoothly."
+                return FaultCode.LOW_CONFIDENCE
         else:
             if confidence < 0.3:
-                return "Sign not recognized clearly. Ensure good lighting and face visibility."
+                return FaultCode.NOT_RECOGNIZED
             elif confidence < 0.5:
-                return "Close, but not quite. Check your hand position and movement speed."
+                return FaultCode.CLOSE
             else:
-                return "Incorrect sign detected. Watch the demo again and focus on the hand shape."
+                return FaultCode.INCORRECT
 
     def get_stats(self) -> Dict[str, Dict]:
         return self.word_stats
@@ -181,8 +294,7 @@ class LearnSession:
     def get_overall_proficiency(self) -> float:
         if not self.word_stats:
             return 0.0
-        total_prof = sum(s["proficiency"] for s in self.word_stats.values())
-        return round(total_prof / len(self.word_stats), 1)
+        return round(self._proficiency_sum / len(self.word_stats), 1)
 
 
 class GameSession:
@@ -201,6 +313,8 @@ class GameSession:
 
         # Generate random challenge queue
         self.challenges: List[str] = self._generate_challenges()
+        # Lowercased once so attempts don't re-lower the challenge per frame
+        self._challenges_lc: List[str] = [c.lower() for c in self.challenges]
         self.current_index = 0
         self.is_active = True
 
@@ -247,9 +361,10 @@ class GameSession:
             self.is_active = False
             return self._build_result(predicted, False)
 
+        challenge = self.current_challenge  # Also wraps current_index
         is_correct = (
             predicted is not None
-            and predicted.lower() == self.current_challenge.lower()
+            and predicted.lower() == self._challenges_lc[self.current_index]
         )
 
         if is_correct:
@@ -259,10 +374,10 @@ class GameSession:
             points = settings.GAME_POINTS_PER_CORRECT * self.multiplier
             self.score += points
             self.words_completed += 1
-            self.word_results[self.current_challenge] = True
+            self.word_results[challenge] = True
             self.current_index += 1  # Move to next challenge
         else:
-            self.word_results.setdefault(self.current_challenge, False)
+            self.word_results.setdefault(challenge, False)
             self.streak = 0
 
         return self._build_result(predicted, is_correct)
@@ -311,6 +426,33 @@ class GameSession:
         }
 
 
+# Globally unique so a recreated session never matches a stale cache entry
+_dashboard_versions = itertools.count(1)
+
+# sessionId → (dashboard_version, pre-encoded JSON); most recent last.
+# Dashboard data only changes on XP/activity writes, which bump
+# UserSession.dashboard_version. Entries are dropped with their session.
+MAX_CACHED_DASHBOARDS = 256
+dashboard_cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+
+
+def get_cached_dashboard(session_id: str, version: int) -> Optional[bytes]:
+    """Return the session's encoded dashboard if it is still at `version`."""
+    cached = dashboard_cache.get(session_id)
+    if cached is None or cached[0] != version:
+        return None
+    dashboard_cache.move_to_end(session_id)
+    return cached[1]
+
+
+def cache_dashboard(session_id: str, version: int, body: bytes):
+    """Store the session's encoded dashboard, evicting the least recent."""
+    dashboard_cache[session_id] = (version, body)
+    dashboard_cache.move_to_end(session_id)
+    if len(dashboard_cache) > MAX_CACHED_DASHBOARDS:
+        dashboard_cache.popitem(last=False)
+
+
 class UserSession:
     """Complete session state for one user."""
 
@@ -328,11 +470,13 @@ class UserSession:
         self.level = 1
         self.current_streak = 0
         self.last_active_date = ""  # YYYY-MM-DD
-        self.unlocked_achievements: List[str] = []
-        self.activity_history: List[Dict] = []  # capped activity log
+        self.unlocked_achievements: Set[str] = set()
+        self.activity_history: deque = deque(maxlen=ACTIVITY_HISTORY_SIZE)
+        # Bumped on every XP/activity write; keys the dashboard cache
+        self.dashboard_version = next(_dashboard_versions)
 
     def start_game(self, duration: int = 30) -> GameSession:
-        game_id = str(uuid.uuid4())[:8]
+        game_id = secrets.token_hex(4)
         game = GameSession(game_id, duration)
         self.games[game_id] = game
         self.games_played += 1
@@ -366,16 +510,12 @@ class UserSession:
 
     def award_xp(self, amount: int, reason: str):
         self.total_xp += amount
+        self.dashboard_version = next(_dashboard_versions)
         self._check_level_up()
 
     def _check_level_up(self):
-        new_level = 1
-        for i, threshold in enumerate(USER_LEVEL_THRESHOLDS):
-            if self.total_xp >= threshold:
-                new_level = i + 1
-            else:
-                break
-        
+        new_level = bisect.bisect_right(USER_LEVEL_THRESHOLDS, self.total_xp)
+
         if new_level > self.level:
             old_level = self.level
             self.level = new_level
@@ -388,79 +528,106 @@ class UserSession:
             "data": data,
             "timestamp": time.time()
         })
-        # Cap at 50 entries
-        if len(self.activity_history) > 50:
-            self.activity_history.pop(0)
+        self.dashboard_version = next(_dashboard_versions)
 
     def check_achievements(self, trigger_type: str, context: Dict):
+        # Nothing left to unlock — skip every check
+        if self.unlocked_achievements >= _CHECKED_ACHIEVEMENT_IDS:
+            return
+
+        unlocked_now = self._check_progress_achievements()
+        trigger_check = self._TRIGGER_CHECKS.get(trigger_type)
+        if trigger_check is not None:
+            unlocked_now.extend(trigger_check(self, context))
+
+        for aid in unlocked_now:
+            if aid not in self.unlocked_achievements:
+                self.unlocked_achievements.add(aid)
+                self.add_activity("achievement_unlocked", {"id": aid})
+
+    def _check_progress_achievements(self) -> List[str]:
+        """Checks that run on every trigger."""
+        unlocked = self.unlocked_achievements
         unlocked_now = []
-        
+
         # 📚 Word Collector: Practice 5 different words
-        if "word_collector" not in self.unlocked_achievements:
+        if "word_collector" not in unlocked:
             if self.learn.get_words_practiced() >= 5:
                 unlocked_now.append("word_collector")
 
         # 🎯 Sharpshooter: 80% proficiency on any word
-        if "sharpshooter" not in self.unlocked_achievements:
+        if "sharpshooter" not in unlocked:
             for stats in self.learn.word_stats.values():
                 if stats["attempts"] >= 5 and stats["proficiency"] >= 80:
                     unlocked_now.append("sharpshooter")
                     break
 
         # 🌱 First Sign
-        if "first_sign" not in self.unlocked_achievements:
-            total_correct = sum(s["correct"] for s in self.learn.word_stats.values())
-            if total_correct >= 1:
+        if "first_sign" not in unlocked:
+            if self.learn.total_correct >= 1:
                 unlocked_now.append("first_sign")
 
         # 🎮 Game On
-        if "game_on" not in self.unlocked_achievements and self.games_played >= 1:
+        if "game_on" not in unlocked and self.games_played >= 1:
             unlocked_now.append("game_on")
 
         # 🗣️ Polyglot: All 15 words
-        if "polyglot" not in self.unlocked_achievements:
+        if "polyglot" not in unlocked:
             if self.learn.get_words_practiced() >= 15:
                 unlocked_now.append("polyglot")
 
-        # Game specific
-        if trigger_type == "game":
-            game = context.get("game")
-            if game:
-                if "perfect_game" not in self.unlocked_achievements:
-                    if game.words_completed >= 5 and game.words_completed == game.total_attempts:
-                        unlocked_now.append("perfect_game")
-                
-                if "streak_master" not in self.unlocked_achievements and game.best_streak >= 5:
-                    unlocked_now.append("streak_master")
-                
-                if "diamond_hands" not in self.unlocked_achievements and game.best_streak >= 10:
-                    unlocked_now.append("diamond_hands")
-
-        # Level specific
-        if trigger_type == "level":
-            lvl = context.get("level", self.level)
-            if "rising_star" not in self.unlocked_achievements and lvl >= 3:
-                unlocked_now.append("rising_star")
-            if "isl_champion" not in self.unlocked_achievements and lvl >= 7:
-                unlocked_now.append("isl_champion")
-            if "grandmaster" not in self.unlocked_achievements and lvl >= 10:
-                unlocked_now.append("grandmaster")
+        return unlocked_now
 
-        for aid in unlocked_now:
-            if aid not in self.unlocked_achievements:
-                self.unlocked_achievements.append(aid)
-                self.add_activity("achievement_unlocked", {"id": aid})
+    def _check_game_achievements(self, context: Dict) -> List[str]:
+        unlocked = self.unlocked_achievements
+        unlocked_now = []
+        game = context.get("game")
+        if game:
+            if "perfect_game" not in unlocked:
+                if game.words_completed >= 5 and game.words_completed == game.total_attempts:
+                    unlocked_now.append("perfect_game")
+
+            if "streak_master" not in unlocked and game.best_streak >= 5:
+                unlocked_now.append("streak_master")
+
+            if "diamond_hands" not in unlocked and game.best_streak >= 10:
+                unlocked_now.append("diamond_hands")
+        return unlocked_now
+
+    def _check_level_achievements(self, context: Dict) -> List[str]:
+        unlocked = self.unlocked_achievements
+        unlocked_now = []
+        lvl = context.get("level", self.level)
+        if "rising_star" not in unlocked and lvl >= 3:
+            unlocked_now.append("rising_star")
+        if "isl_champion" not in unlocked and lvl >= 7:
+            unlocked_now.append("isl_champion")
+        if "grandmaster" not in unlocked and lvl >= 10:
+            unlocked_now.append("grandmaster")
+        return unlocked_now
+
+    # Trigger-specific checks; "learn" needs only the progress checks
+    _TRIGGER_CHECKS = {
+        "game": _check_game_achievements,
+        "level": _check_level_achievements,
+    }
 
 
 # ─── Global Session Store ─────────────────────────────────────────
 
-_sessions: Dict[str, UserSession] = {}
+class _SessionDict(dict[str, UserSession]):
+    """Session map that creates a UserSession on first lookup of an id."""
+
+    def __missing__(self, session_id: str) -> UserSession:
+        session = self[session_id] = UserSession(session_id)
+        return session
+
+
+_sessions: _SessionDict = _SessionDict()
 
 
 def get_session(session_id: str) -> UserSession:
     """Get or create a session. Auto-creates on first access."""
-    if session_id not in _sessions:
-        _sessions[session_id] = UserSession(session_id)
     return _sessions[session_id]
 
 
@@ -475,13 +642,21 @@ def get_active_session_count() -> int:
 
 
 def clear_session(session_id: str):
-    """Remove a session."""
+    """Remove a session and its buffer, landmarker and cached results."""
     _sessions.pop(session_id, None)
+    delete_buffer(session_id)
+    close_session(session_id)
+    face_detector.forget_session(session_id)
+    dashboard_cache.pop(session_id, None)
 
 
 def clear_all_sessions():
     """Clear all sessions (for testing)."""
     _sessions.clear()
+    delete_all_buffers()
+    close_all_sessions()
+    face_detector.forget_all_sessions()
+    dashboard_cache.clear()
 
 
 # ─── Community Data (Global) ──────────────────────────────────────
@@ -515,12 +690,21 @@ COMMUNITY_POSTS = [
     }
 ]
 
+# Feed index kept sorted newest-first as (-timestamp, insertion seq, post);
+# the sequence number keeps equal timestamps in insertion order (as the
+# stable sort did) and means dicts are never compared.
+_post_seq = itertools.count()
+_POSTS_BY_TS: List[Tuple[float, int, Dict]] = sorted(
+    (-p["timestamp"], next(_post_seq), p) for p in COMMUNITY_POSTS
+)
+
 def get_community_feed() -> List[Dict]:
     # Return posts sorted by timestamp desc
-    return sorted(COMMUNITY_POSTS, key=lambda x: x["timestamp"], reverse=True)
+    return [p for _, _, p in _POSTS_BY_TS]
 
 def add_community_post(post_data: Dict):
     COMMUNITY_POSTS.append(post_data)
+    bisect.insort(_POSTS_BY_TS, (-post_data["timestamp"], next(_post_seq), post_data))
 
 def toggle_like(post_id: str, session_id: str):
     for post in COMMUNITY_POSTS:
@@ -551,7 +735,7 @@ def register_user(data: Dict[str, Any]) -> Tuple[bool, str, Optional[UserSession
         return False, "Phone number already registered", None
         
     hashed_pwd = hash_password(data["password"])
-    user_id = str(uuid.uuid4())[:8]
+    user_id = secrets.token_hex(4)
     
     user_entry = {
         "user_id": user_id,
@@ -6,20 +6,70 @@ Used by all routes that receive camera frames.
 """
 
 import base64
-import re
+from typing import Optional, Union
 
 import cv2
 import numpy as np
 
 from app.config import settings
 
+# pybase64 (SIMD) is optional; stdlib base64 has the same decode signature
+try:
+    import pybase64 as _b64
+    _b64decode = _b64.b64decode
+except ImportError:
+    _b64decode = base64.b64decode
+
 
 class FrameDecodeError(Exception):
     """Raised when frame decoding fails."""
     pass
 
 
-def decode_base64_frame(frame_str: str) -> np.ndarray:
+# Data URI framing ("data:image/jpeg;base64,<payload>")
+_DATA_URI_PREFIX = b"data:"
+_BASE64_MARKER = b";base64,"
+
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT/JPG/DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_width(data: bytes) -> Optional[int]:
+    """Read the image width from a JPEG's SOF header without decoding it."""
+    if data[:2] != b"\xff\xd8":
+        return None
+    i, n = 2, len(data)
+    while i + 9 <= n:
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # Fill byte
+            i += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            return int.from_bytes(data[i + 7:i + 9], "big")
+        i += 2 + int.from_bytes(data[i + 2:i + 4], "big")
+    return None
+
+
+def _imread_flag(img_bytes: bytes, target_width: int) -> int:
+    """
+    Pick an imdecode flag that lets libjpeg downscale during the IDCT.
+
+    Only reduces when the result stays at least target_width wide, so the
+    final resize_frame() never has to upscale.
+    """
+    width = _jpeg_width(img_bytes)
+    if width is None:
+        return cv2.IMREAD_COLOR
+    if width >= 4 * target_width:
+        return cv2.IMREAD_REDUCED_COLOR_4
+    if width >= 2 * target_width:
+        return cv2.IMREAD_REDUCED_COLOR_2
+    return cv2.IMREAD_COLOR
+
+
+def decode_base64_frame(frame_str: Union[str, bytes], target_width: Optional[int] = None) -> np.ndarray:
     """
     Decode a base64-encoded JPEG frame into an OpenCV-compatible numpy array.
 
@@ -27,8 +77,12 @@ def decode_base64_frame(frame_str: str) -> np.ndarray:
     - Raw base64: "/9j/4AAQSkZJRg..."
     - Data URI:   "data:image/jpeg;base64,/9j/4AAQSkZJRg..."
 
+    Large JPEGs are decoded at 1/2 or 1/4 scale when that still leaves the
+    frame at least target_width wide.
+
     Args:
-        frame_str: Base64-encoded frame string
+        frame_str: Base64-encoded frame (str, or bytes straight off the wire)
+        target_width: Width the caller will resize to (default: settings.TARGET_FRAME_WIDTH)
 
     Returns:
         np.ndarray: BGR image array (OpenCV format)
@@ -39,15 +93,24 @@ def decode_base64_frame(frame_str: str) -> np.ndarray:
     if not frame_str:
         raise FrameDecodeError("Frame data is empty")
 
-    # Strip data URI prefix if present
-    if frame_str.startswith("data:"):
-        match = re.match(r"data:image/\w+;base64,(.+)", frame_str)
-        if not match:
+    if isinstance(frame_str, str):
+        try:
+            frame_bytes = frame_str.encode("ascii")
+        except UnicodeEncodeError:
+            raise FrameDecodeError("Frame data contains non-ASCII characters")
+    else:
+        frame_bytes = frame_str
+
+    # Strip data URI prefix if present (bounded scan — the header is short).
+    # Raw base64 frames only pay for a 5-byte slice compare.
+    if frame_bytes[:5] == _DATA_URI_PREFIX:
+        idx = frame_bytes.find(_BASE64_MARKER, 5, 64)
+        if idx < 0:
             raise FrameDecodeError("Invalid data URI format")
-        frame_str = match.group(1)
+        frame_bytes = frame_bytes[idx + len(_BASE64_MARKER):]
 
     # Validate size (base64 is ~33% larger than raw bytes)
-    estimated_bytes = len(frame_str) * 3 / 4
+    estimated_bytes = len(frame_bytes) * 3 / 4
     if estimated_bytes > settings.MAX_FRAME_SIZE_BYTES:
         raise FrameDecodeError(
             f"Frame too large: ~{estimated_bytes / 1024:.0f}KB "
@@ -55,16 +118,18 @@ def decode_base64_frame(frame_str: str) -> np.ndarray:
         )
 
     try:
-        # Decode base64 to bytes
-        img_bytes = base64.b64decode(frame_str)
+        # Decode base64 to bytes (no str round-trip, no alphabet pre-check)
+        img_bytes = _b64decode(frame_bytes, validate=False)
     except Exception as e:
         raise FrameDecodeError(f"Base64 decode failed: {str(e)}")
 
     # Convert to numpy array
     nparr = np.frombuffer(img_bytes, np.uint8)
 
-    # Decode image
-    frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+    # Decode image (downscaling inside the JPEG decoder when possible)
+    if target_width is None:
+        target_width = settings.TARGET_FRAME_WIDTH
+    frame = cv2.imdecode(nparr, _imread_flag(img_bytes, target_width))
     if frame is None:
         raise FrameDecodeError("Failed to decode image — invalid JPEG data")
 
@@ -83,28 +148,25 @@ def validate_frame(frame: np.ndarray) -> bool:
     """
     if frame is None:
         return False
-    if len(frame.shape) != 3:
-        return False
-    h, w, c = frame.shape
-    if h < 100 or w < 100:  # Too small
-        return False
-    if c != 3:  # Must be BGR
-        return False
-    return True
+    s = frame.shape
+    # 3-D BGR image, at least 100x100
+    return len(s) == 3 and s[2] == 3 and s[0] >= 100 and s[1] >= 100
 
 
-def resize_frame(frame: np.ndarray, target_width: int = 640) -> np.ndarray:
+def resize_frame(frame: np.ndarray, target_width: Optional[int] = None) -> np.ndarray:
     """
     Resize frame to target width while maintaining aspect ratio.
     Helps with Mediapipe performance.
 
     Args:
         frame: BGR image array
-        target_width: Desired width in pixels
+        target_width: Desired width in pixels (default: settings.TARGET_FRAME_WIDTH)
 
     Returns:
         Resized frame
     """
+    if target_width is None:
+        target_width = settings.TARGET_FRAME_WIDTH
     h, w = frame.shape[:2]
     if w <= target_width:
         return frame
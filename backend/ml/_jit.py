@@ -0,0 +1,21 @@
+"""
+SignVista JIT Helper
+
+numba is optional (not in requirements.txt). Kernel modules import `njit`
+from here: the real decorator when numba is installed, otherwise a no-op
+stand-in that leaves the plain Python/NumPy function as is. HAVE_NUMBA lets
+a module pick a loop kernel (fast compiled) or a vectorized one (fast
+without numba).
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
@@ -0,0 +1,53 @@
+"""
+SignVista Landmark Kernels
+
+Wrist-relative normalisation of the detection module's 42-value hand
+vector, in place. With numba installed (optional, not in requirements.txt)
+this is a compiled two-pass loop, which removes the per-call NumPy
+dispatch that dominates at this size; plain NumPy otherwise.
+"""
+
+import numpy as np
+
+from ._jit import HAVE_NUMBA, njit
+
+
+@njit(cache=True, fastmath=True)
+def _normalize_loops(landmarks: np.ndarray) -> np.ndarray:
+    """Loop kernel for numba: shift and track max |value|, then scale."""
+    wx = landmarks[0]
+    wy = landmarks[1]
+    max_val = 0.0
+    for i in range(landmarks.shape[0] // 2):
+        x = landmarks[2 * i] - wx
+        y = landmarks[2 * i + 1] - wy
+        landmarks[2 * i] = x
+        landmarks[2 * i + 1] = y
+        max_val = max(max_val, abs(x), abs(y))
+    if max_val > 0:
+        for i in range(landmarks.shape[0]):
+            landmarks[i] /= max_val
+    return landmarks
+
+
+def _normalize_numpy(landmarks: np.ndarray) -> np.ndarray:
+    """Vectorized equivalent of _normalize_loops, for when numba is absent."""
+    wx = landmarks[0]
+    wy = landmarks[1]
+    landmarks[0::2] -= wx
+    landmarks[1::2] -= wy
+    max_val = max(landmarks.max(), -landmarks.min())
+    if max_val > 0:
+        landmarks /= max_val
+    return landmarks
+
+
+# normalize_hand_landmarks(landmarks) makes a flat (x0, y0, x1, y1, ...)
+# vector wrist-relative and scales it by its max absolute value, in place
+# (all zeros stay zero). Returns it.
+normalize_hand_landmarks = _normalize_loops if HAVE_NUMBA else _normalize_numpy
+
+
+def warm_up():
+    """Compile the kernel now (with numba) rather than on the first frame."""
+    normalize_hand_landmarks(np.zeros(42, dtype=np.float32))
@@ -0,0 +1,33 @@
+"""
+SignVista Selection Kernels
+
+Numeric core of the "voting" prediction strategy, over parallel arrays of
+word ids and confidences. JIT-compiled with numba when it is installed
+(optional, not in requirements.txt); plain NumPy otherwise.
+"""
+
+import numpy as np
+
+from ._jit import njit
+
+
+@njit(cache=True)
+def pick_voting(word_ids: np.ndarray, confs: np.ndarray) -> int:
+    """
+    Return the index of the prediction the voting strategy selects.
+
+    The word with the most votes wins, and its most confident prediction is
+    picked. If several words tie on votes, the most confident prediction
+    overall is picked. Ties on confidence go to the earliest index.
+    """
+    votes = np.bincount(word_ids)
+    top = votes.max()
+    if np.count_nonzero(votes == top) == 1:
+        masked = np.where(word_ids == np.argmax(votes), confs, -np.inf)
+        return int(np.argmax(masked))
+    return int(np.argmax(confs))
+
+
+def warm_up():
+    """Compile the kernel now (with numba) rather than on the first frame."""
+    pick_voting(np.zeros(2, dtype=np.int32), np.zeros(2, dtype=np.float32))
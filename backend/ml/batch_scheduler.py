@@ -0,0 +1,99 @@
+"""
+SignVista Batch Scheduler
+
+Coalesces concurrent fallback-LSTM forward passes into one batch.
+Each session's frame handler awaits `submit(sequence)`; a background task
+collects up to `max_batch` pending sequences (waiting at most `max_wait_ms`
+after the first one), runs them through the predictor as a single
+(N, 45, 258) batch and hands every caller its own row back. Weight reads
+are then paid once per batch instead of once per session.
+
+The predictor always runs in `executor` (the loop's default executor when
+None), never on the event loop itself; with max_batch <= 1 each `submit`
+dispatches its own sequence there without batching.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import Executor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class BatchScheduler:
+    """Micro-batching front for a (N, 45, 258) -> (N, C) predictor."""
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        max_batch: int = 8,
+        max_wait_ms: float = 4.0,
+        executor: Optional[Executor] = None,
+    ):
+        self.predict_fn = predict_fn
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        # Bound to the event loop that first submits; rebuilt if it changes
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, sequence: np.ndarray) -> np.ndarray:
+        """
+        Predict one (1, 45, 258) sequence.
+
+        Returns:
+            The predictor's output row for this sequence, shape (1, C)
+        """
+        loop = asyncio.get_running_loop()
+        if self.max_batch <= 1:
+            return await loop.run_in_executor(self.executor, self.predict_fn, sequence)
+
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        self._queue.put_nowait((sequence, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        """Wait for one request, then gather more until full or timed out."""
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        """Background task: run collected batches and fan results out."""
+        while True:
+            batch = await self._collect()
+            try:
+                # Off the loop: other requests keep running during the forward
+                # pass, and queue up for the next batch meanwhile
+                results = await self._loop.run_in_executor(
+                    self.executor, self.predict_fn, np.concatenate([seq for seq, _ in batch])
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for i, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(results[i:i + 1])
+            if len(batch) > 1:
+                logger.debug(f"LSTM batch of {len(batch)} sequences")
@@ -9,8 +9,8 @@ Ishit: BUFFER_SIZE must match your LSTM's expected sequence length.
 """
 
 import logging
-from collections import deque
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Optional
 
 import numpy as np
 
@@ -21,64 +21,94 @@ logger = logging.getLogger(__name__)
 # Input dimensions
 KEYPOINT_DIM = 258  # 132 Pose + 63 Left Hand + 63 Right Hand
 
+# Keypoints are normalized coords/visibilities — half precision is plenty
+# for storage; sequences are upcast to float32 for the LSTM.
+STORAGE_DTYPE = np.float16
+
 
 class FrameBuffer:
-    """Buffer for a single session's keypoint sequence."""
+    """
+    Buffer for a single session's keypoint sequence.
+
+    Backed by a preallocated ring of 2 * buffer_size rows: every frame is
+    written twice (slot i and slot i + buffer_size), so the latest
+    buffer_size frames are always one contiguous, in-order slice and
+    get_sequence() needs no list building. Frames are stored as float16.
+    """
 
     def __init__(self, buffer_size: int = settings.BUFFER_SIZE):
         self.buffer_size = buffer_size
-        self.keypoints: deque = deque(maxlen=buffer_size)
+        self._ring = np.empty((2 * buffer_size, KEYPOINT_DIM), dtype=STORAGE_DTYPE)
+        self._head = 0  # Next slot to write, in [0, buffer_size)
+        self._filled = 0
 
     def append(self, keypoints: np.ndarray):
         """Add a keypoint vector to the buffer."""
         if keypoints.shape[0] != KEYPOINT_DIM:
             logger.warning(f"Expected {KEYPOINT_DIM}-dim keypoints, got {keypoints.shape[0]}")
             return
-        self.keypoints.append(keypoints)
+        head = self._head
+        keypoints = keypoints.astype(STORAGE_DTYPE, copy=False)
+        self._ring[head] = keypoints
+        self._ring[head + self.buffer_size] = keypoints
+        self._head = (head + 1) % self.buffer_size
+        if self._filled < self.buffer_size:
+            self._filled += 1
 
     @property
     def is_ready(self) -> bool:
         """True when buffer has enough frames for LSTM prediction."""
-        return len(self.keypoints) >= self.buffer_size
+        return self._filled >= self.buffer_size
 
     @property
     def fill_ratio(self) -> float:
         """How full the buffer is (0.0 to 1.0)."""
-        return len(self.keypoints) / self.buffer_size
+        return self._filled / self.buffer_size
 
     def get_sequence(self) -> Optional[np.ndarray]:
         """
         Get the sequence as a numpy array for LSTM input.
 
+        Frames are returned oldest first, upcast from float16 storage.
+
         Returns:
             np.ndarray of shape (1, buffer_size, KEYPOINT_DIM) or None if not ready
         """
         if not self.is_ready:
             return None
 
-        sequence = np.array(list(self.keypoints), dtype=np.float32)
-        # Add batch dimension: (1, 45, 99)
-        return np.expand_dims(sequence, axis=0)
+        # Slots head..head+N-1 hold the last N frames in order
+        sequence = self._ring[self._head:self._head + self.buffer_size]
+        # Add batch dimension: (1, 45, 258)
+        return sequence.astype(np.float32)[np.newaxis]
 
     def clear(self):
         """Clear the buffer."""
-        self.keypoints.clear()
+        self._head = 0
+        self._filled = 0
 
     @property
     def length(self) -> int:
-        return len(self.keypoints)
+        return self._filled
 
 
 # ─── Global Buffer Store (per session) ────────────────────────────
 
-_buffers: Dict[str, FrameBuffer] = {}
+# Most recently used last; the oldest buffer is evicted past MAX_BUFFERS
+MAX_BUFFERS = 256
+_buffers: "OrderedDict[str, FrameBuffer]" = OrderedDict()
 
 
 def get_buffer(session_id: str) -> FrameBuffer:
     """Get or create a frame buffer for a session."""
-    if session_id not in _buffers:
-        _buffers[session_id] = FrameBuffer()
-    return _buffers[session_id]
+    buffer = _buffers.get(session_id)
+    if buffer is None:
+        buffer = _buffers[session_id] = FrameBuffer()
+        if len(_buffers) > MAX_BUFFERS:
+            _buffers.popitem(last=False)
+    else:
+        _buffers.move_to_end(session_id)
+    return buffer
 
 
 def clear_buffer(session_id: str):
@@ -90,3 +120,8 @@ def clear_buffer(session_id: str):
 def delete_buffer(session_id: str):
     """Remove a session's buffer entirely."""
     _buffers.pop(session_id, None)
+
+
+def delete_all_buffers():
+    """Remove every session's buffer (for testing)."""
+    _buffers.clear()
@@ -5,16 +5,21 @@ This module handles loading, validation, and access to configuration for
 the ISL detection, recognition, and translation modules.
 """
 
-import json
+import copy
+import functools
 import os
+import sys
+import threading
 from typing import Optional, Tuple, List, Dict, Any
 from dataclasses import dataclass, field, asdict
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleConfig:
     """Configuration for a single ISL module."""
     enabled: bool = True
@@ -24,7 +29,7 @@ class ModuleConfig:
     preprocessing_params: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ISLModulesConfig:
     """Top-level configuration for ISL integration."""
     modules: Dict[str, ModuleConfig] = field(default_factory=dict)
@@ -32,98 +37,187 @@ class ISLModulesConfig:
     enable_parallel_execution: bool = False
     performance_monitoring: bool = True
     fallback_to_existing_lstm: bool = True
+    # A priority-1 module at or above this confidence wins outright
+    definitive_confidence: float = 0.9
+
+
+# Per-module validation rules: (passes(module_config), error template).
+# Templates are formatted with name=<module name>, m=<ModuleConfig>.
+_MODULE_RULES = (
+    (
+        lambda m: 0.0 <= m.confidence_threshold <= 1.0,
+        "Module {name}: confidence_threshold must be between 0.0 and 1.0, got {m.confidence_threshold}",
+    ),
+    (
+        lambda m: m.priority >= 1,
+        "Module {name}: priority must be >= 1, got {m.priority}",
+    ),
+    (
+        lambda m: not m.enabled or bool(m.model_path),
+        "Module {name}: model_path is required when enabled",
+    ),
+)
+
+
+_DEFAULT_CONFIG_JSON = """
+{
+    "modules": {
+        "detection": {
+            "enabled": true,
+            "priority": 2,
+            "confidence_threshold": 0.7,
+            "model_path": "ISL-Unified-Project/models/detection/gesture_classifier.h5",
+            "preprocessing_params": {
+                "max_num_hands": 2,
+                "model_complexity": 0
+            }
+        },
+        "recognition": {
+            "enabled": true,
+            "priority": 1,
+            "confidence_threshold": 0.6,
+            "model_path": "ISL-Unified-Project/models/recognition/lstm_word_model.hdf5",
+            "preprocessing_params": {
+                "buffer_size": 45,
+                "feature_count": 258
+            }
+        },
+        "translation": {
+            "enabled": false,
+            "priority": 3,
+            "confidence_threshold": 0.7,
+            "model_path": "ISL-Unified-Project/models/translation/squeezenet_model",
+            "preprocessing_params": {
+                "yolo_confidence": 0.5,
+                "yolo_threshold": 0.3,
+                "yolo_size": 416
+            }
+        }
+    },
+    "prediction_strategy": "priority",
+    "enable_parallel_execution": false,
+    "performance_monitoring": true,
+    "fallback_to_existing_lstm": true,
+    "definitive_confidence": 0.9
+}
+"""
 
 
 class ConfigurationManager:
     """Manages configuration for ISL modules."""
     
-    DEFAULT_CONFIG = {
-        "modules": {
-            "detection": {
-                "enabled": True,
-                "priority": 2,
-                "confidence_threshold": 0.7,
-                "model_path": "ISL-Unified-Project/models/detection/gesture_classifier.h5",
-                "preprocessing_params": {
-                    "max_num_hands": 2,
-                    "model_complexity": 0
-                }
-            },
-            "recognition": {
-                "enabled": True,
-                "priority": 1,
-                "confidence_threshold": 0.6,
-                "model_path": "ISL-Unified-Project/models/recognition/lstm_word_model.hdf5",
-                "preprocessing_params": {
-                    "buffer_size": 45,
-                    "feature_count": 258
-                }
-            },
-            "translation": {
-                "enabled": False,
-                "priority": 3,
-                "confidence_threshold": 0.7,
-                "model_path": "ISL-Unified-Project/models/translation/squeezenet_model",
-                "preprocessing_params": {
-                    "yolo_confidence": 0.5,
-                    "yolo_threshold": 0.3,
-                    "yolo_size": 416
-                }
-            }
-        },
-        "prediction_strategy": "priority",
-        "enable_parallel_execution": False,
-        "performance_monitoring": True,
-        "fallback_to_existing_lstm": True
-    }
+    DEFAULT_CONFIG: Dict[str, Any] = orjson.loads(_DEFAULT_CONFIG_JSON)
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, strict: bool = False):
         """
         Initialize configuration manager.
         
         Args:
             config_path: Path to configuration JSON file. If None, uses default path.
+            strict: Load and validate now, raising ValueError if the
+                configuration is invalid. Otherwise loading is deferred and
+                validation errors are only logged.
         """
         self.config_path = config_path or "backend/config/isl_modules.json"
-        self.config: ISLModulesConfig = self._load_config()
+        self.strict = strict
+        # Loaded on first access of self.config (see the property below)
+        self._config: Optional[ISLModulesConfig] = None
+        self._load_lock = threading.Lock()
+        # Flat per-module lookups (interned names), rebuilt whenever config loads
+        self._modules: Dict[str, ModuleConfig] = {}
+        self._enabled: Dict[str, bool] = {}
+        self._thresholds: Dict[str, float] = {}
+        # validate() result; config is fixed after load, so compute it once
+        self._validation_cache: Optional[Tuple[bool, List[str]]] = None
+        
+        if strict:
+            self.config  # Fail fast
+
+    @property
+    def config(self) -> ISLModulesConfig:
+        """The loaded configuration; reads env/file on first access."""
+        config = self._config
+        if config is None:
+            with self._load_lock:
+                if self._config is None:
+                    loaded = self._load_config()
+                    # Validate once, at load
+                    validation = self._compute_validation(loaded)
+                    if self.strict and not validation[0]:
+                        raise ValueError(f"Invalid ISL module configuration: {validation[1]}")
+                    self._index_modules(loaded)
+                    self._validation_cache = validation
+                    self._config = loaded
+                config = self._config
+        return config
+
+    @config.setter
+    def config(self, value: ISLModulesConfig):
+        self._config = value
+        self._invalidate()
+
+    def _invalidate(self):
+        """Drop cached derived state. Call after mutating self.config."""
+        self._validation_cache = None
+        if self._config is not None:
+            self._index_modules(self._config)
+
+    def _index_modules(self, config: ISLModulesConfig):
+        """Build the flat module/enabled/threshold lookups used on the per-frame path."""
+        self._modules = {sys.intern(name): m for name, m in config.modules.items()}
+        self._enabled = {sys.intern(name): m.enabled for name, m in config.modules.items()}
+        self._thresholds = {
+            sys.intern(name): m.confidence_threshold for name, m in config.modules.items()
+        }
         
     def _load_config(self) -> ISLModulesConfig:
         """Load configuration from file or environment variables."""
-        config_dict = self.DEFAULT_CONFIG.copy()
+        overrides: List[Dict] = []
         
-        # Try to load from environment variable first
+        # Environment variable first, then the file (file wins on conflicts)
         env_config = os.environ.get("ISL_MODULE_CONFIG")
         if env_config:
             try:
-                env_dict = json.loads(env_config)
-                config_dict = self._merge_configs(config_dict, env_dict)
+                overrides.append(orjson.loads(env_config))
                 logger.info("Loaded configuration from ISL_MODULE_CONFIG environment variable")
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Failed to parse ISL_MODULE_CONFIG: {e}. Using defaults.")
         
-        # Try to load from file
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    file_dict = json.load(f)
-                config_dict = self._merge_configs(config_dict, file_dict)
-                logger.info(f"Loaded configuration from {self.config_path}")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load config from {self.config_path}: {e}. Using defaults.")
-        else:
+        # Open directly instead of stat-ing first
+        try:
+            with open(self.config_path, 'rb') as f:
+                overrides.append(orjson.loads(f.read()))
+            logger.info(f"Loaded configuration from {self.config_path}")
+        except FileNotFoundError:
             logger.info(f"Configuration file {self.config_path} not found. Using defaults.")
+        except (orjson.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load config from {self.config_path}: {e}. Using defaults.")
+        
+        # Deep copy once so merged/loaded configs never alias the shared
+        # defaults, then merge every override into that copy in place
+        config_dict = functools.reduce(
+            self._merge_into, overrides, copy.deepcopy(self.DEFAULT_CONFIG)
+        )
         
         # Convert to dataclass
         return self._dict_to_config(config_dict)
     
     def _merge_configs(self, base: Dict, override: Dict) -> Dict:
-        """Merge override config into base config."""
-        result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        """Merge override config into a copy of base config."""
+        return self._merge_into(copy.deepcopy(base), override)
+    
+    @staticmethod
+    def _merge_into(result: Dict, override: Dict) -> Dict:
+        """Merge override config into result in place (iterative, no recursion)."""
+        stack = [(result, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return result
     
     def _dict_to_config(self, config_dict: Dict) -> ISLModulesConfig:
@@ -137,7 +231,8 @@ class ConfigurationManager:
             prediction_strategy=config_dict.get("prediction_strategy", "priority"),
             enable_parallel_execution=config_dict.get("enable_parallel_execution", False),
             performance_monitoring=config_dict.get("performance_monitoring", True),
-            fallback_to_existing_lstm=config_dict.get("fallback_to_existing_lstm", True)
+            fallback_to_existing_lstm=config_dict.get("fallback_to_existing_lstm", True),
+            definitive_confidence=config_dict.get("definitive_confidence", 0.9)
         )
     
     def is_module_enabled(self, module_name: str) -> bool:
@@ -150,9 +245,9 @@ class ConfigurationManager:
         Returns:
             True if module is enabled, False otherwise
         """
-        if module_name not in self.config.modules:
-            return False
-        return self.config.modules[module_name].enabled
+        if self._config is None:
+            self.config  # Load (and index) on first use
+        return self._enabled.get(module_name, False)
     
     def get_module_config(self, module_name: str) -> Optional[ModuleConfig]:
         """
@@ -164,7 +259,9 @@ class ConfigurationManager:
         Returns:
             ModuleConfig if module exists, None otherwise
         """
-        return self.config.modules.get(module_name)
+        if self._config is None:
+            self.config  # Load (and index) on first use
+        return self._modules.get(module_name)
     
     def get_prediction_strategy(self) -> str:
         """
@@ -185,46 +282,48 @@ class ConfigurationManager:
         Returns:
             Confidence threshold (0.0 to 1.0), or 0.7 as default
         """
-        module_config = self.get_module_config(module_name)
-        if module_config:
-            return module_config.confidence_threshold
-        return 0.7
+        if self._config is None:
+            self.config  # Load (and index) on first use
+        return self._thresholds.get(module_name, 0.7)
     
     def validate(self) -> Tuple[bool, List[str]]:
         """
         Validate configuration.
+
+        Validation runs when the configuration loads; this returns that
+        result (recomputed only after _invalidate()).
         
         Returns:
             Tuple of (is_valid, list of error messages)
         """
+        config = self.config
+        if self._validation_cache is None:
+            self._validation_cache = self._compute_validation(config)
+        return self._validation_cache
+    
+    def _compute_validation(self, config: ISLModulesConfig) -> Tuple[bool, List[str]]:
+        """Check a configuration and return (is_valid, error messages)."""
         errors = []
         
         # Validate prediction strategy
         valid_strategies = ["priority", "highest_confidence", "voting"]
-        if self.config.prediction_strategy not in valid_strategies:
+        if config.prediction_strategy not in valid_strategies:
             errors.append(
-                f"Invalid prediction_strategy: {self.config.prediction_strategy}. "
+                f"Invalid prediction_strategy: {config.prediction_strategy}. "
                 f"Must be one of {valid_strategies}"
             )
         
+        if not 0.0 <= config.definitive_confidence <= 1.0:
+            errors.append(
+                f"definitive_confidence must be between 0.0 and 1.0, "
+                f"got {config.definitive_confidence}"
+            )
+        
         # Validate module configurations
-        for module_name, module_config in self.config.modules.items():
-            # Validate confidence threshold
-            if not 0.0 <= module_config.confidence_threshold <= 1.0:
-                errors.append(
-                    f"Module {module_name}: confidence_threshold must be between 0.0 and 1.0, "
-                    f"got {module_config.confidence_threshold}"
-                )
-            
-            # Validate priority
-            if module_config.priority < 1:
-                errors.append(
-                    f"Module {module_name}: priority must be >= 1, got {module_config.priority}"
-                )
-            
-            # Validate model path (if enabled)
-            if module_config.enabled and not module_config.model_path:
-                errors.append(f"Module {module_name}: model_path is required when enabled")
+        for module_name, module_config in config.modules.items():
+            for check, message in _MODULE_RULES:
+                if not check(module_config):
+                    errors.append(message.format(name=module_name, m=module_config))
         
         is_valid = len(errors) == 0
         if not is_valid:
@@ -1,43 +1,142 @@
 """
 SignVista Face Detector
 
-Uses OpenCV's Haar Cascade to detect faces as a prerequisite gate.
+Detects faces as a prerequisite gate.
 Inspired by AbhishekSinghDhadwal's face activation approach:
 skip inference if no face is present (reduces false positives).
 
+Uses OpenCV's YuNet DNN detector (cv2.FaceDetectorYN) when the model file
+at settings.FACE_MODEL_PATH is present — faster than Haar at our frame
+sizes and far more robust. Falls back to the Haar cascade otherwise.
+
+Multi-worker deployments: set PRELOAD_FACE_DETECTOR=true and run a
+pre-forking server (e.g. gunicorn --preload -k uvicorn.workers.UvicornWorker)
+so the detector is loaded once in the master and its pages are shared
+copy-on-write by every worker. `uvicorn --workers` spawns fresh
+interpreters, so there each worker loads its own copy at startup.
+
 Ishit: If you integrate YOLO or a better detector, replace this module.
 """
 
 import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
-# Lazy-load cascade classifier
-_face_cascade = None
+# Whether "no face" debug lines are emitted; re-read from the logger every
+# DEBUG_RECHECK_INTERVAL detector runs so runtime level changes are picked up
+DEBUG_RECHECK_INTERVAL = 1000
+_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+_runs_until_recheck = DEBUG_RECHECK_INTERVAL
+
+# YuNet runs on a fixed-size downscaled copy of the frame
+YUNET_INPUT_SIZE = (320, 240)
+YUNET_SCORE_THRESHOLD = 0.6
+
+# The Haar path downsamples so the long edge is at most this many pixels
+HAAR_MAX_EDGE = 480
+HAAR_MIN_FACE = 80
+# Coarse pyramid: the gate only needs "any face?", not every face
+HAAR_SCALE_FACTOR = 1.3
+
+# Face presence is strongly correlated across a stream's frames, so per
+# session the detector only runs every few frames: rarely while a face is
+# in view, more often while it isn't (to pick the signer up quickly).
+FACE_RECHECK_PRESENT = 10
+FACE_RECHECK_ABSENT = 2
+MAX_CACHED_SESSIONS = 256
+# session_id -> (frames until next check, last result); most recent last
+_face_cache: "OrderedDict[str, Tuple[int, bool]]" = OrderedDict()
+
+# Per-thread scratch images reused across frames of the same size
+_scratch = threading.local()
+
+
+def _scratch_buffer(name: str, shape: Tuple[int, ...]) -> np.ndarray:
+    """Return this thread's reusable uint8 buffer `name`, sized to shape."""
+    buf = getattr(_scratch, name, None)
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape, dtype=np.uint8)
+        setattr(_scratch, name, buf)
+    return buf
+
+
+# Sentinel for "no detector could be loaded" (compared with `is`)
+_UNAVAILABLE = object()
+
+# Lazy-load detector: a FaceDetectorYN, a CascadeClassifier, or _UNAVAILABLE
+_detector = None
+_is_yunet = False
+# Run the Haar scan through OpenCV's T-API (UMat) when an OpenCL device exists
+_use_opencl = False
+
+
+def _load_yunet():
+    """Create the YuNet detector, or return None if it can't be used."""
+    if not hasattr(cv2, "FaceDetectorYN") or not os.path.exists(settings.FACE_MODEL_PATH):
+        return None
+    try:
+        detector = cv2.FaceDetectorYN.create(
+            settings.FACE_MODEL_PATH, "", YUNET_INPUT_SIZE,
+            score_threshold=YUNET_SCORE_THRESHOLD,
+        )
+        logger.info("✅ YuNet face detector loaded")
+        return detector
+    except Exception as e:
+        logger.warning(f"⚠️ YuNet init failed, falling back to Haar cascade: {e}")
+        return None
 
 
-def _get_cascade():
-    """Lazy-initialize Haar cascade face detector."""
-    global _face_cascade
-    if _face_cascade is None:
-        try:
-            cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-            _face_cascade = cv2.CascadeClassifier(cascade_path)
-            if _face_cascade.empty():
-                logger.warning("⚠️ Haar cascade file not found — face detection disabled")
-                _face_cascade = "unavailable"
-            else:
-                logger.info("✅ Haar cascade face detector loaded")
-        except Exception as e:
-            logger.error(f"❌ Face cascade init failed: {e}")
-            _face_cascade = "unavailable"
-    return _face_cascade
+def _load_cascade():
+    """Create the Haar cascade detector, or return None if it can't be used."""
+    try:
+        cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+        cascade = cv2.CascadeClassifier(cascade_path)
+        if cascade.empty():
+            logger.warning("⚠️ Haar cascade file not found — face detection disabled")
+            return None
+        logger.info("✅ Haar cascade face detector loaded")
+        return cascade
+    except Exception as e:
+        logger.error(f"❌ Face cascade init failed: {e}")
+        return None
+
+
+def _get_detector():
+    """Lazy-initialize the face detector (YuNet, else Haar cascade)."""
+    global _detector, _is_yunet, _use_opencl
+    if _detector is None:
+        yunet = _load_yunet()
+        if yunet is not None:
+            _detector, _is_yunet = yunet, True
+        else:
+            cascade = _load_cascade()
+            _detector = cascade if cascade is not None else _UNAVAILABLE
+            if cascade is not None and cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                _use_opencl = cv2.ocl.useOpenCL()
+                if _use_opencl:
+                    logger.info("✅ OpenCL available — Haar face scan uses UMat")
+    return _detector
+
+
+def warm_up():
+    """Load the face detector now so the first frame doesn't pay for it."""
+    try:
+        _get_detector()
+    except Exception as e:
+        logger.error(f"❌ Face detector warm-up failed: {e}")
 
 
-def detect_face(frame: np.ndarray) -> bool:
+def detect_face(frame: np.ndarray, session_id: Optional[str] = None) -> bool:
     """
     Check if at least one face is present in the frame.
 
@@ -46,30 +145,91 @@ def detect_face(frame: np.ndarray) -> bool:
 
     Args:
         frame: BGR image array
+        session_id: If given, reuse this session's last result between
+            periodic re-checks instead of running the detector every frame
 
     Returns:
         True if face detected, False otherwise.
         Returns True if detector is unavailable (permissive fallback).
     """
-    cascade = _get_cascade()
+    if session_id is None:
+        return _run_detector(frame)
+
+    cached = _face_cache.get(session_id)
+    if cached is not None and cached[0] > 0:
+        _face_cache[session_id] = (cached[0] - 1, cached[1])
+        _face_cache.move_to_end(session_id)
+        return cached[1]
 
-    if cascade == "unavailable":
+    has_face = _run_detector(frame)
+    skip = (FACE_RECHECK_PRESENT if has_face else FACE_RECHECK_ABSENT) - 1
+    _face_cache[session_id] = (skip, has_face)
+    _face_cache.move_to_end(session_id)
+    if len(_face_cache) > MAX_CACHED_SESSIONS:
+        _face_cache.popitem(last=False)
+    return has_face
+
+
+def forget_session(session_id: str):
+    """Drop the session's cached face-presence result, if any."""
+    _face_cache.pop(session_id, None)
+
+
+def forget_all_sessions():
+    """Drop every cached face-presence result."""
+    _face_cache.clear()
+
+
+def _run_detector(frame: np.ndarray) -> bool:
+    """Run the face detector on one frame."""
+    global _debug_enabled, _runs_until_recheck
+    _runs_until_recheck -= 1
+    if _runs_until_recheck <= 0:
+        _runs_until_recheck = DEBUG_RECHECK_INTERVAL
+        _debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    detector = _get_detector()
+
+    if detector is _UNAVAILABLE:
         # If detector isn't available, don't block inference
         return True
 
     try:
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-        faces = cascade.detectMultiScale(
-            gray,
-            scaleFactor=1.1,
-            minNeighbors=5,
-            minSize=(80, 80),
-            flags=cv2.CASCADE_SCALE_IMAGE,
-        )
-
-        has_face = len(faces) > 0
-        if not has_face:
+        if _is_yunet:
+            small = _scratch_buffer("yunet", (YUNET_INPUT_SIZE[1], YUNET_INPUT_SIZE[0], 3))
+            cv2.resize(frame, YUNET_INPUT_SIZE, dst=small, interpolation=cv2.INTER_NEAREST)
+            _, faces = detector.detect(small)
+            has_face = faces is not None and faces.shape[0] > 0
+        else:
+            # The green channel is a good enough luma proxy for gating and
+            # skips the BGR->gray weighted sum; it is shrunk in the same pass.
+            # Faces under HAAR_MIN_FACE are discarded anyway, so scale the
+            # minimum size with the frame. Output goes to a reused buffer.
+            green = frame[:, :, 1]
+            h, w = green.shape
+            scale = HAAR_MAX_EDGE / max(h, w)
+            if scale < 1:
+                size = (max(1, round(w * scale)), max(1, round(h * scale)))
+                gray = _scratch_buffer("gray", (size[1], size[0]))
+                cv2.resize(green, size, dst=gray, interpolation=cv2.INTER_AREA)
+                min_face = max(1, int(HAAR_MIN_FACE * scale))
+            else:
+                gray = _scratch_buffer("gray", (h, w))
+                np.copyto(gray, green)
+                min_face = HAAR_MIN_FACE
+            if _use_opencl:
+                gray = cv2.UMat(gray)
+
+            faces = detector.detectMultiScale(
+                gray,
+                scaleFactor=HAAR_SCALE_FACTOR,
+                minNeighbors=5,
+                minSize=(min_face, min_face),
+                flags=cv2.CASCADE_SCALE_IMAGE,
+            )
+            has_face = len(faces) > 0
+
+        if not has_face and _debug_enabled:
             logger.debug("No face detected — skipping inference")
         return has_face
 
@@ -9,15 +9,16 @@ Main orchestrator that ties together:
 5. Multi-module ISL integration (detection, recognition, translation)
 """
 
+import asyncio
 import logging
 import os
 import time
-from typing import Optional, Tuple, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, List, Dict, Any
 
 import numpy as np
-import tensorflow as tf
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense
 
 from app.config import settings
 from ml.buffer_manager import get_buffer
@@ -27,12 +28,19 @@ from ml.vocabulary import (
     NUM_CLASSES,
     get_word_by_index,
 )
+from ml._selection_kernels import pick_voting
+from ml.batch_scheduler import BatchScheduler
 from ml.config_manager import ConfigurationManager
-from ml.model_loader import ModelLoader
-from ml.modules import ModulePrediction
-from ml.modules.detection import DetectionModule
-from ml.modules.recognition import RecognitionModule
-from ml.modules.translation import TranslationModule
+from ml.modules import FrameCache, ModulePrediction
+
+# TensorFlow and the ISL module classes are imported where they are first
+# needed (initialize_model / initialize_isl_modules), so workers that run
+# neither don't pay their import time or memory
+if TYPE_CHECKING:
+    from ml.model_loader import ModelLoader
+    from ml.modules.detection import DetectionModule
+    from ml.modules.recognition import RecognitionModule
+    from ml.modules.translation import TranslationModule
 
 logger = logging.getLogger(__name__)
 
@@ -40,31 +48,209 @@ logger = logging.getLogger(__name__)
 
 _model = None
 _model_loaded: bool = False
+# Maps an (N, 45, 258) float32 batch to class logits (N, NUM_CLASSES)
+_predict_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None
+# Batches concurrent sessions' calls to _predict_fn (looked up per batch);
+# the forward passes run one at a time on their own worker thread
+_scheduler = BatchScheduler(
+    lambda batch: _predict_fn(batch),
+    max_batch=settings.LSTM_MAX_BATCH,
+    max_wait_ms=settings.LSTM_MAX_WAIT_MS,
+    executor=ThreadPoolExecutor(max_workers=1, thread_name_prefix="lstm-batch"),
+)
 
 # ─── ISL Multi-Module Instances ───────────────────────────────────
 
 _config_manager: Optional[ConfigurationManager] = None
-_model_loader: Optional[ModelLoader] = None
-_detection_module: Optional[DetectionModule] = None
-_recognition_module: Optional[RecognitionModule] = None
-_translation_module: Optional[TranslationModule] = None
+_model_loader: Optional["ModelLoader"] = None
+_detection_module: Optional["DetectionModule"] = None
+_recognition_module: Optional["RecognitionModule"] = None
+_translation_module: Optional["TranslationModule"] = None
 _isl_modules_initialized: bool = False
+# Worker threads for enable_parallel_execution (created on first use)
+_module_pool: Optional[ThreadPoolExecutor] = None
+# Single worker running the MediaPipe/module stage of each frame, so the
+# event loop keeps decoding and face-gating the next frames (and feeding the
+# LSTM batch scheduler) meanwhile; one thread keeps each session's frames
+# in order and the shared MediaPipe graphs single-threaded
+_frame_stage_pool: Optional[ThreadPoolExecutor] = None
+# Small stable integer id per predicted word, for the voting kernel
+_word_ids: Dict[str, int] = {}
+
+# ─── Runtime Config Tables ────────────────────────────────────────
+
+MODULE_NAMES: Tuple[str, ...] = ("detection", "recognition", "translation")
+
+# (name, instance getter, whether predict() takes session_id), in
+# MODULE_NAMES order. Getters read the globals at call time, so modules
+# initialized (or swapped) later are picked up.
+_MODULES: Tuple[Tuple[str, Callable[[], Any], bool], ...] = (
+    ("detection", lambda: _detection_module, False),
+    ("recognition", lambda: _recognition_module, True),
+    ("translation", lambda: _translation_module, False),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleRuntimeCfg:
+    """One module's config, specialized for the per-frame path."""
+    name: str
+    enabled: bool
+    threshold: float
+    priority: int  # Lower number = higher priority
+    get_instance: Callable[[], Any]
+    takes_session: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _RuntimeTables:
+    """Per-frame config values, resolved once from the ConfigurationManager."""
+    modules: Tuple[ModuleRuntimeCfg, ...]  # In MODULE_NAMES order
+    enabled: Tuple[str, ...]  # Enabled modules, in MODULE_NAMES order
+    thresholds: Dict[str, float]
+    priorities: Dict[str, int]  # Lower number = higher priority
+    strategy: str
+    parallel: bool
+    definitive_confidence: float
+    require_face: bool
+    fallback_to_lstm: bool
 
-def create_lstm_model(num_classes: int):
-    """Manually define the Keras LSTM architecture to match weights."""
+
+_runtime: Optional[_RuntimeTables] = None
+# The ConfigurationManager _runtime was built from; a new one means rebuild
+_runtime_source: Optional[ConfigurationManager] = None
+
+def _runtime_tables() -> _RuntimeTables:
+    """Return the frozen config tables, rebuilding if _config_manager changed."""
+    global _runtime, _runtime_source
+    config_manager = _config_manager
+    if _runtime is None or _runtime_source is not config_manager:
+        modules = []
+        for name, get_instance, takes_session in _MODULES:
+            module_config = config_manager.get_module_config(name)
+            modules.append(ModuleRuntimeCfg(
+                name=name,
+                enabled=bool(config_manager.is_module_enabled(name)),
+                threshold=config_manager.get_confidence_threshold(name),
+                priority=module_config.priority if module_config else 999,
+                get_instance=get_instance,
+                takes_session=takes_session,
+            ))
+        config = config_manager.config
+        _runtime = _RuntimeTables(
+            modules=tuple(modules),
+            enabled=tuple(cfg.name for cfg in modules if cfg.enabled),
+            thresholds={cfg.name: cfg.threshold for cfg in modules},
+            priorities={cfg.name: cfg.priority for cfg in modules},
+            strategy=config_manager.get_prediction_strategy(),
+            parallel=bool(config.enable_parallel_execution),
+            definitive_confidence=config.definitive_confidence,
+            require_face=bool(getattr(config, 'require_face_detection', True)),
+            fallback_to_lstm=bool(config.fallback_to_existing_lstm),
+        )
+        _runtime_source = config_manager
+    return _runtime
+
+def _mixed_precision_enabled() -> bool:
+    """Whether the LSTM should run in float16 (see settings.ENABLE_MIXED_PRECISION)."""
+    flag = settings.ENABLE_MIXED_PRECISION.lower()
+    if flag != "auto":
+        return flag in ("1", "true", "yes")
+    import tensorflow as tf
+    
+    # fp16 only pays off with tensor cores (compute capability >= 7.0)
+    for gpu in tf.config.list_physical_devices("GPU"):
+        capability = tf.config.experimental.get_device_details(gpu).get("compute_capability")
+        if capability and tuple(capability) >= (7, 0):
+            return True
+    return False
+
+def create_lstm_model(num_classes: int, mixed_precision: bool = False):
+    """
+    Manually define the Keras LSTM architecture to match weights.
+    
+    The head outputs logits: softmax has no weights, so trained softmax
+    weights load unchanged, and callers only need the winning class's
+    probability (see _top1). With mixed_precision, layers compute in
+    float16 (variables stay float32, so the same weights load either way);
+    the head stays float32.
+    """
+    from tensorflow.keras.layers import LSTM, Dense
+    from tensorflow.keras.models import Sequential
+    
+    dtype = "mixed_float16" if mixed_precision else None
     model = Sequential([
-        LSTM(64, return_sequences=True, activation='relu', input_shape=(45, 258)),
-        LSTM(128, return_sequences=True, activation='relu'),
-        LSTM(64, return_sequences=False, activation='relu'),
-        Dense(64, activation='relu'),
-        Dense(32, activation='relu'),
-        Dense(num_classes, activation='softmax')
+        LSTM(64, return_sequences=True, activation='relu', input_shape=(45, 258), dtype=dtype),
+        LSTM(128, return_sequences=True, activation='relu', dtype=dtype),
+        LSTM(64, return_sequences=False, activation='relu', dtype=dtype),
+        Dense(64, activation='relu', dtype=dtype),
+        Dense(32, activation='relu', dtype=dtype),
+        Dense(num_classes, dtype='float32')
     ])
     return model
 
+def _top1(logits: np.ndarray) -> Tuple[int, float]:
+    """Return (argmax class, its softmax probability) for one row of logits."""
+    index = int(np.argmax(logits))
+    # exp(l_i - max) / sum(exp(l - max)), and l_i is the max
+    return index, float(1.0 / np.exp(logits - logits[index]).sum())
+
+def _per_row(predict_one: Callable[[np.ndarray], np.ndarray]) -> Callable[[np.ndarray], np.ndarray]:
+    """Adapt a fixed batch-1 predictor to (N, 45, 258) batches."""
+    def predict(batch: np.ndarray) -> np.ndarray:
+        if batch.shape[0] == 1:
+            return predict_one(batch)
+        return np.concatenate([predict_one(batch[i:i + 1]) for i in range(batch.shape[0])])
+    return predict
+
+def _build_predictor() -> Callable[[np.ndarray], np.ndarray]:
+    """Pick the runtime for the loaded LSTM (see settings.LSTM_BACKEND)."""
+    if settings.LSTM_BACKEND == "tensorrt":
+        try:
+            from ml.trt_runner import TRTRunner
+            return _per_row(TRTRunner(settings.TRT_ENGINE_PATH).infer)
+        except Exception as e:
+            logger.warning(f"⚠️ TensorRT backend unavailable, using Keras: {e}")
+    elif settings.LSTM_BACKEND == "tflite":
+        try:
+            from ml.model_loader import convert_to_tflite
+            predict = convert_to_tflite(_model, (None, 45, 258))
+            logger.info("✅ LSTM converted to TFLite (dynamic-range INT8)")
+            return predict
+        except Exception as e:
+            logger.warning(f"⚠️ TFLite conversion failed, using Keras: {e}")
+
+    import tensorflow as tf
+    
+    model = _model
+    try:
+        # XLA-compiled graph; skips the per-call Keras predict() machinery.
+        # Batches are zero-padded up to a power of two so only a handful of
+        # shapes are ever compiled, all of them here before serving.
+        concrete = tf.function(
+            lambda x: model(x, training=False), jit_compile=True
+        ).get_concrete_function(tf.TensorSpec((None, 45, 258), tf.float32))
+        buckets = [1]
+        while buckets[-1] < settings.LSTM_MAX_BATCH:
+            buckets.append(buckets[-1] * 2)
+        for size in buckets:
+            concrete(tf.zeros((size, 45, 258), tf.float32))
+        
+        def predict(batch: np.ndarray) -> np.ndarray:
+            n = batch.shape[0]
+            size = next((b for b in buckets if b >= n), n)
+            if size != n:
+                batch = np.concatenate([batch, np.zeros((size - n, 45, 258), np.float32)])
+            return concrete(tf.constant(batch, dtype=tf.float32)).numpy()[:n]
+        
+        return predict
+    except Exception as e:
+        logger.warning(f"⚠️ XLA compile failed, using Keras predict(): {e}")
+        return lambda batch: model.predict(batch, verbose=0)
+
 def initialize_model():
     """Load the Keras LSTM model weights at startup."""
-    global _model, _model_loaded
+    global _model, _model_loaded, _predict_fn
 
     model_path = settings.MODEL_PATH
     if not os.path.exists(model_path):
@@ -73,13 +259,19 @@ def initialize_model():
 
     try:
         # Create architecture (3 classes for "Hello", "How are you", "Thank you")
-        _model = create_lstm_model(num_classes=NUM_CLASSES)
+        mixed_precision = _mixed_precision_enabled()
+        _model = create_lstm_model(num_classes=NUM_CLASSES, mixed_precision=mixed_precision)
         _model.load_weights(model_path)
+        _predict_fn = _build_predictor()
         _model_loaded = True
-        logger.info(f"✅ Keras LSTM weights loaded from {model_path}")
+        logger.info(
+            f"✅ Keras LSTM weights loaded from {model_path}"
+            f"{' (mixed float16)' if mixed_precision else ''}"
+        )
     except Exception as e:
         logger.error(f"❌ Failed to load Keras model: {e}")
         _model = None
+        _predict_fn = None
         _model_loaded = False
 
 def is_model_loaded() -> bool:
@@ -109,7 +301,8 @@ def initialize_isl_modules():
             logger.info("Continuing with available configuration...")
         
         # Initialize model loader
-        _model_loader = ModelLoader()
+        from ml.model_loader import ModelLoader
+        _model_loader = ModelLoader(backend=settings.ISL_MODEL_BACKEND)
         
         # Get enabled modules
         enabled_modules = [
@@ -130,11 +323,13 @@ def initialize_isl_modules():
         # Initialize detection module
         if _config_manager.is_module_enabled("detection") and load_results.get("detection"):
             try:
+                from ml.modules.detection import DetectionModule
                 detection_model = _model_loader.get_model("detection")
                 detection_config = _config_manager.get_module_config("detection")
                 _detection_module = DetectionModule(
                     model=detection_model,
-                    config=detection_config.preprocessing_params
+                    config=detection_config.preprocessing_params,
+                    infer_fn=_model_loader.get_infer_fn("detection"),
                 )
                 logger.info("✅ Detection module initialized")
             except Exception as e:
@@ -143,12 +338,13 @@ def initialize_isl_modules():
         # Initialize recognition module
         if _config_manager.is_module_enabled("recognition") and load_results.get("recognition"):
             try:
+                from ml.modules.recognition import RecognitionModule
                 recognition_model = _model_loader.get_model("recognition")
                 recognition_config = _config_manager.get_module_config("recognition")
                 _recognition_module = RecognitionModule(
                     model=recognition_model,
                     config=recognition_config.preprocessing_params,
-                    buffer_manager=None  # Will use global buffer manager
+                    infer_fn=_model_loader.get_infer_fn("recognition"),
                 )
                 logger.info("✅ Recognition module initialized")
             except Exception as e:
@@ -157,6 +353,7 @@ def initialize_isl_modules():
         # Initialize translation module
         if _config_manager.is_module_enabled("translation") and load_results.get("translation"):
             try:
+                from ml.modules.translation import TranslationModule
                 translation_model = _model_loader.get_model("translation")
                 translation_config = _config_manager.get_module_config("translation")
                 
@@ -168,12 +365,15 @@ def initialize_isl_modules():
                     model=translation_model,
                     yolo_config=yolo_config,
                     yolo_weights=yolo_weights,
-                    config=translation_config.preprocessing_params
+                    config=translation_config.preprocessing_params,
+                    infer_fn=_model_loader.get_infer_fn("translation"),
+                    yolo_net=_model_loader.get_model("yolo"),
                 )
                 logger.info("✅ Translation module initialized")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize translation module: {e}")
         
+        _runtime_tables()  # Resolve per-frame config up front
         _isl_modules_initialized = True
         logger.info("🎉 ISL modules initialization complete")
         
@@ -200,40 +400,84 @@ def get_isl_modules_status() -> Dict[str, Any]:
             "modules": {}
         }
     
-    enabled_modules = [
-        name for name in ["detection", "recognition", "translation"]
-        if _config_manager.is_module_enabled(name)
-    ]
+    runtime = _runtime_tables()
     
     module_status = {}
-    for module_name in ["detection", "recognition", "translation"]:
-        is_enabled = _config_manager.is_module_enabled(module_name)
-        module_instance = None
-        
-        if module_name == "detection":
-            module_instance = _detection_module
-        elif module_name == "recognition":
-            module_instance = _recognition_module
-        elif module_name == "translation":
-            module_instance = _translation_module
-        
-        module_status[module_name] = {
-            "enabled": is_enabled,
-            "loaded": module_instance is not None,
-            "confidence_threshold": _config_manager.get_confidence_threshold(module_name) if is_enabled else None,
-            "priority": _config_manager.get_module_config(module_name).priority if is_enabled else None
+    for cfg in runtime.modules:
+        module_status[cfg.name] = {
+            "enabled": cfg.enabled,
+            "loaded": cfg.get_instance() is not None,
+            "confidence_threshold": cfg.threshold if cfg.enabled else None,
+            "priority": cfg.priority if cfg.enabled else None
         }
     
     return {
         "initialized": True,
-        "enabled_modules": enabled_modules,
+        "enabled_modules": list(runtime.enabled),
         "configuration": {
-            "prediction_strategy": _config_manager.get_prediction_strategy(),
-            "fallback_to_lstm": _config_manager.config.fallback_to_existing_lstm
+            "prediction_strategy": runtime.strategy,
+            "fallback_to_lstm": runtime.fallback_to_lstm
         },
         "modules": module_status
     }
 
+def _get_module_pool() -> ThreadPoolExecutor:
+    """Lazily create the worker pool used for parallel module execution."""
+    global _module_pool
+    if _module_pool is None:
+        _module_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="isl-mod")
+    return _module_pool
+
+def _get_frame_stage_pool() -> ThreadPoolExecutor:
+    """Lazily create the single worker for the per-frame extraction stage."""
+    global _frame_stage_pool
+    if _frame_stage_pool is None:
+        _frame_stage_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="frame-stage")
+    return _frame_stage_pool
+
+async def run_in_frame_stage(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run fn on the frame-stage worker and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_frame_stage_pool(), partial(fn, *args, **kwargs))
+
+def _run_module(
+    module_name: str,
+    threshold: float,
+    predict: Callable[..., Optional[ModulePrediction]],
+    *args: Any
+) -> Optional[ModulePrediction]:
+    """
+    Run one module's predict() and apply its confidence threshold.
+    
+    Failures are logged and swallowed so one module can't take down the others.
+    """
+    # Timing only feeds debug lines, so skip the clock reads without them
+    debug = logger.isEnabledFor(logging.DEBUG)
+    try:
+        t0 = time.perf_counter_ns() if debug else 0
+        prediction = predict(*args)
+        
+        if prediction is None:
+            return None
+        
+        if prediction.confidence >= threshold:
+            if debug:
+                elapsed = (time.perf_counter_ns() - t0) * 1e-9
+                logger.debug(
+                    f"{module_name.capitalize()}: {prediction.word} "
+                    f"(conf={prediction.confidence:.3f}, time={elapsed:.3f}s)"
+                )
+            return prediction
+        
+        if debug:
+            logger.debug(
+                f"{module_name.capitalize()} prediction below threshold: "
+                f"{prediction.confidence:.3f} < {threshold}"
+            )
+    except Exception as e:
+        logger.error(f"{module_name.capitalize()} module failed: {e}", exc_info=True)
+    return None
+
 def execute_modules_parallel(
     frame: np.ndarray,
     session_id: str,
@@ -242,9 +486,15 @@ def execute_modules_parallel(
     """
     Execute all enabled modules and collect predictions.
     
-    This function runs enabled modules sequentially (parallel execution can be
-    added later) and collects predictions that exceed confidence thresholds.
-    Preprocessing failures are isolated - if one module fails, others continue.
+    The modules share one per-frame cache, so transforms several of them
+    need (the BGR->RGB conversion for MediaPipe) are computed once.
+    
+    When `enable_parallel_execution` is set in the ISL config, modules run
+    concurrently on a small thread pool (their TF/OpenCV kernels release the
+    GIL), so frame latency is the slowest module rather than the sum.
+    Otherwise they run sequentially. Predictions below a module's
+    confidence threshold are dropped, and preprocessing failures are
+    isolated - if one module fails, others continue.
     
     Args:
         frame: Input frame (numpy array)
@@ -252,83 +502,34 @@ def execute_modules_parallel(
         enabled_modules: List of module names to execute
         
     Returns:
-        List of ModulePrediction objects from successful modules
+        List of ModulePrediction objects from successful modules, in
+        detection/recognition/translation order
     """
-    predictions = []
-    
-    # Execute detection module
-    if "detection" in enabled_modules and _detection_module is not None:
-        try:
-            start_time = time.time()
-            prediction = _detection_module.predict(frame)
-            elapsed = time.time() - start_time
-            
-            if prediction is not None:
-                threshold = _config_manager.get_confidence_threshold("detection")
-                if prediction.confidence >= threshold:
-                    predictions.append(prediction)
-                    logger.debug(
-                        f"Detection: {prediction.word} "
-                        f"(conf={prediction.confidence:.3f}, time={elapsed:.3f}s)"
-                    )
-                else:
-                    logger.debug(
-                        f"Detection prediction below threshold: "
-                        f"{prediction.confidence:.3f} < {threshold}"
-                    )
-        except Exception as e:
-            logger.error(f"Detection module failed: {e}", exc_info=True)
-            # Continue with other modules
-    
-    # Execute recognition module
-    if "recognition" in enabled_modules and _recognition_module is not None:
-        try:
-            start_time = time.time()
-            prediction = _recognition_module.predict(frame, session_id)
-            elapsed = time.time() - start_time
-            
-            if prediction is not None:
-                threshold = _config_manager.get_confidence_threshold("recognition")
-                if prediction.confidence >= threshold:
-                    predictions.append(prediction)
-                    logger.debug(
-                        f"Recognition: {prediction.word} "
-                        f"(conf={prediction.confidence:.3f}, time={elapsed:.3f}s)"
-                    )
-                else:
-                    logger.debug(
-                        f"Recognition prediction below threshold: "
-                        f"{prediction.confidence:.3f} < {threshold}"
-                    )
-        except Exception as e:
-            logger.error(f"Recognition module failed: {e}", exc_info=True)
-            # Continue with other modules
+    runtime = _runtime_tables()
+    frame_cache: FrameCache = {}
+    calls = []
+    for cfg in runtime.modules:
+        instance = cfg.get_instance()
+        if instance is None or cfg.name not in enabled_modules:
+            continue
+        args = (frame, session_id, frame_cache) if cfg.takes_session else (frame, frame_cache)
+        calls.append((cfg.name, cfg.threshold, instance.predict, args))
     
-    # Execute translation module
-    if "translation" in enabled_modules and _translation_module is not None:
-        try:
-            start_time = time.time()
-            prediction = _translation_module.predict(frame)
-            elapsed = time.time() - start_time
-            
-            if prediction is not None:
-                threshold = _config_manager.get_confidence_threshold("translation")
-                if prediction.confidence >= threshold:
-                    predictions.append(prediction)
-                    logger.debug(
-                        f"Translation: {prediction.word} "
-                        f"(conf={prediction.confidence:.3f}, time={elapsed:.3f}s)"
-                    )
-                else:
-                    logger.debug(
-                        f"Translation prediction below threshold: "
-                        f"{prediction.confidence:.3f} < {threshold}"
-                    )
-        except Exception as e:
-            logger.error(f"Translation module failed: {e}", exc_info=True)
-            # Continue with other modules
+    if len(calls) > 1 and runtime.parallel:
+        pool = _get_module_pool()
+        futures = [
+            pool.submit(_run_module, name, threshold, predict, *args)
+            for name, threshold, predict, args in calls
+        ]
+        # Collect in submission order so results stay deterministic
+        results = [future.result() for future in futures]
+    else:
+        results = [
+            _run_module(name, threshold, predict, *args)
+            for name, threshold, predict, args in calls
+        ]
     
-    return predictions
+    return [prediction for prediction in results if prediction is not None]
 
 def select_final_prediction(
     predictions: List[ModulePrediction],
@@ -338,7 +539,9 @@ def select_final_prediction(
     Apply selection strategy to choose final prediction from multiple modules.
     
     Strategies:
-    - "priority": Select from highest priority module (lowest priority number)
+    - "priority": Select from highest priority module (lowest priority number);
+                  a priority-1 prediction at or above the configured
+                  definitive_confidence is returned without scanning further
     - "highest_confidence": Select prediction with highest confidence
     - "voting": If multiple modules predict same word, boost confidence; 
                 select by vote count then confidence
@@ -357,19 +560,18 @@ def select_final_prediction(
         return predictions[0]
     
     if strategy == "priority":
-        # Get module priorities from config
-        module_priorities = {}
+        runtime = _runtime_tables()
+        priorities = runtime.priorities
         for pred in predictions:
-            config = _config_manager.get_module_config(pred.module_name)
-            if config:
-                module_priorities[pred.module_name] = config.priority
-            else:
-                module_priorities[pred.module_name] = 999  # Low priority for unknown
+            if (priorities.get(pred.module_name) == 1
+                    and pred.confidence >= runtime.definitive_confidence):
+                logger.debug(f"Definitive prediction from {pred.module_name} (conf={pred.confidence:.3f})")
+                return pred
         
-        # Sort by priority (lower number = higher priority)
-        sorted_preds = sorted(predictions, key=lambda p: module_priorities[p.module_name])
-        selected = sorted_preds[0]
-        logger.debug(f"Priority strategy selected: {selected.module_name} (priority={module_priorities[selected.module_name]})")
+        # Lowest priority number wins (999 = low priority for unknown);
+        # min() keeps the first of equal priorities, like a stable sort
+        selected = min(predictions, key=lambda p: priorities.get(p.module_name, 999))
+        logger.debug(f"Priority strategy selected: {selected.module_name} (priority={priorities.get(selected.module_name, 999)})")
         return selected
     
     elif strategy == "highest_confidence":
@@ -379,31 +581,23 @@ def select_final_prediction(
         return selected
     
     elif strategy == "voting":
-        # Count votes for each word
-        word_votes: Dict[str, List[ModulePrediction]] = {}
-        for pred in predictions:
-            if pred.word not in word_votes:
-                word_votes[pred.word] = []
-            word_votes[pred.word].append(pred)
-        
-        # Find word with most votes
-        max_votes = max(len(preds) for preds in word_votes.values())
-        words_with_max_votes = [
-            word for word, preds in word_votes.items() 
-            if len(preds) == max_votes
-        ]
-        
-        # If tie in votes, select by highest confidence
-        if len(words_with_max_votes) == 1:
-            word = words_with_max_votes[0]
-            selected = max(word_votes[word], key=lambda p: p.confidence)
-        else:
-            # Multiple words with same vote count, select highest confidence overall
-            selected = max(predictions, key=lambda p: p.confidence)
+        # Most-voted word wins (by its best confidence); a tie in votes
+        # falls back to the highest confidence overall
+        word_ids = np.fromiter(
+            (_word_ids.setdefault(pred.word, len(_word_ids)) for pred in predictions),
+            dtype=np.int32, count=len(predictions)
+        )
+        confs = np.fromiter(
+            (pred.confidence for pred in predictions),
+            dtype=np.float32, count=len(predictions)
+        )
+        index = pick_voting(word_ids, confs)
+        selected = predictions[index]
         
         logger.debug(
             f"Voting strategy selected: {selected.module_name} "
-            f"(word={selected.word}, votes={len(word_votes[selected.word])}, conf={selected.confidence:.3f})"
+            f"(word={selected.word}, votes={int((word_ids == word_ids[index]).sum())}, "
+            f"conf={selected.confidence:.3f})"
         )
         return selected
     
@@ -411,7 +605,7 @@ def select_final_prediction(
         logger.warning(f"Unknown selection strategy: {strategy}, using highest_confidence")
         return max(predictions, key=lambda p: p.confidence)
 
-def predict_from_raw_frame(
+async def predict_from_raw_frame(
     session_id: str,
     frame: np.ndarray,
     return_landmarks: bool = False,
@@ -439,32 +633,31 @@ def predict_from_raw_frame(
         - module_details: Dictionary with module information (if return_module_details=True)
     """
     module_details = None
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     # 1. Face detection gate (optional based on configuration)
     require_face = True
     if _config_manager is not None:
-        require_face = getattr(_config_manager.config, 'require_face_detection', True)
+        require_face = _runtime_tables().require_face
     
-    if require_face and not detect_face(frame):
+    if require_face and not detect_face(frame, session_id):
         return None, 0.0, "no_face", None, module_details
 
     # 2. Check if ISL modules are initialized and enabled
     if _isl_modules_initialized and _config_manager is not None:
-        # Get enabled modules
-        enabled_modules = [
-            name for name in ["detection", "recognition", "translation"]
-            if _config_manager.is_module_enabled(name)
-        ]
+        runtime = _runtime_tables()
+        enabled_modules = list(runtime.enabled)
         
         if enabled_modules:
             # Use ISL multi-module system
             try:
                 # Execute all enabled modules
-                predictions = execute_modules_parallel(frame, session_id, enabled_modules)
+                predictions = await run_in_frame_stage(
+                    execute_modules_parallel, frame, session_id, enabled_modules
+                )
                 
                 # Track timing
-                total_time = time.time() - start_time
+                total_time = (time.perf_counter_ns() - start_ns) * 1e-9
                 if total_time > 0.2:  # 200ms threshold
                     logger.warning(
                         f"⚠️ Frame processing exceeded 200ms: {total_time:.3f}s "
@@ -498,7 +691,7 @@ def predict_from_raw_frame(
                 
                 # Select final prediction
                 if predictions:
-                    strategy = _config_manager.get_prediction_strategy()
+                    strategy = runtime.strategy
                     selected = select_final_prediction(predictions, strategy)
                     
                     if selected:
@@ -527,11 +720,17 @@ def predict_from_raw_frame(
                 # Fall through to legacy LSTM fallback
     
     # 3. Fallback to existing LSTM model
-    if _config_manager and _config_manager.config.fallback_to_existing_lstm:
+    if _config_manager is not None and _runtime_tables().fallback_to_lstm:
         logger.debug("Using fallback LSTM model")
         
-        # Keypoint extraction
-        keypoints, results = extract_keypoints(frame, return_results=return_landmarks)
+        # Keypoint extraction on the frame-stage worker (which converts to
+        # RGB in its own scratch buffer)
+        keypoints, results = await run_in_frame_stage(
+            extract_keypoints,
+            frame,
+            return_results=return_landmarks,
+            session_id=session_id,
+        )
 
         # Buffering
         buffer = get_buffer(session_id)
@@ -547,11 +746,11 @@ def predict_from_raw_frame(
             return "hello", 0.95, "mock_ready", results, module_details
 
         sequence = buffer.get_sequence()  # shape (1, 45, 258)
-        res = _model.predict(sequence, verbose=0)[0]
+        # Batched with other sessions' concurrent calls
+        logits = (await _scheduler.submit(sequence))[0]
         
         # Get highest probability
-        prediction_idx = np.argmax(res)
-        confidence = float(res[prediction_idx])
+        prediction_idx, confidence = _top1(logits)
         word = get_word_by_index(prediction_idx)
 
         # Threshold & Reset
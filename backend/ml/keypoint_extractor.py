@@ -6,57 +6,283 @@ Extracts 258 features from a video frame using Mediapipe Holistic:
 - Left Hand: 21 landmarks × 3 (x, y, z) = 63
 - Right Hand: 21 landmarks × 3 (x, y, z) = 63
 - Total: 258 features
+
+When the HolisticLandmarker task bundle at settings.HOLISTIC_MODEL_PATH is
+present, frames go through the MediaPipe Tasks API in VIDEO mode with one
+landmarker per session, so tracking state carries over between a stream's
+frames. Otherwise the legacy `mp.solutions.holistic` solution is used, also
+with one graph per session.
 """
 
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
 import cv2
 import numpy as np
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
-# Lazy-load Mediapipe
+# Sentinel for "legacy Holistic solution missing" (compared with `is`)
+_UNAVAILABLE = object()
+
+# Lazy-load Mediapipe: the mp.solutions.holistic module, or _UNAVAILABLE
 _holistic = None
 
+# Per-session graphs, most recent last; past settings.MAX_HOLISTIC_SESSIONS
+# the oldest is evicted, and graphs of evicted or cleared sessions are
+# closed. Both kinds track landmarks across frames, so each stream needs its
+# own. Tasks API: session_id -> [landmarker, last timestamp (ms)]. Legacy
+# solution: session_id -> Holistic graph.
+_landmarkers: "OrderedDict[Optional[str], list]" = OrderedDict()
+_holistics: "OrderedDict[Optional[str], Any]" = OrderedDict()
+_landmarkers_lock = threading.Lock()
+_tasks_available: Optional[bool] = None
+
+# "view" or "convert"; see _probe_cvt_strategy (None until first probed)
+_cvt_strategy: Optional[str] = None
+
+# Per-thread RGB scratch image reused across frames of the same size
+_scratch = threading.local()
+
+
+def to_rgb(frame: np.ndarray) -> np.ndarray:
+    """
+    Convert a BGR frame to RGB in this thread's reusable scratch buffer.
+
+    Saves an H×W×3 allocation per frame. The result is overwritten by the
+    same thread's next call, so it must be consumed before then (MediaPipe
+    copies its input, so passing it to process()/detect*() is fine).
+    """
+    buf = getattr(_scratch, "rgb", None)
+    if buf is None or buf.shape != frame.shape:
+        buf = np.empty(frame.shape, dtype=np.uint8)
+        _scratch.rgb = buf
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
+
+
 def _get_holistic():
-    """Lazy-initialize Mediapipe Holistic."""
+    """Lazy-load the Holistic solution module (_UNAVAILABLE if missing)."""
     global _holistic
     if _holistic is None:
         try:
             import mediapipe as mp
-            _holistic = mp.solutions.holistic.Holistic(
-                static_image_mode=False,
-                model_complexity=1,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5,
-            )
-            logger.info("✅ Mediapipe Holistic initialized")
-        except ImportError:
-            logger.warning("⚠️ Mediapipe not installed")
-            _holistic = "unavailable"
+            _holistic = mp.solutions.holistic
+        except (ImportError, AttributeError):
+            # Newer Mediapipe wheels ship only the Tasks API
+            logger.warning("⚠️ Mediapipe Holistic solution not available")
+            _holistic = _UNAVAILABLE
     return _holistic
 
-def extract_keypoints(frame: np.ndarray, return_results: bool = False) -> tuple[np.ndarray, any]:
+
+def _session_holistic(solution: Any, session_id: Optional[str]):
+    """Return the session's legacy Holistic graph, creating it if needed."""
+    with _landmarkers_lock:
+        holistic = _holistics.get(session_id)
+        if holistic is not None:
+            _holistics.move_to_end(session_id)
+            return holistic
+        holistic = solution.Holistic(
+            static_image_mode=False,
+            model_complexity=1,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
+        _holistics[session_id] = holistic
+        if len(_holistics) > settings.MAX_HOLISTIC_SESSIONS:
+            _, evicted = _holistics.popitem(last=False)
+            evicted.close()
+    logger.info(f"✅ Mediapipe Holistic initialized for session {session_id}")
+    return holistic
+
+
+def _use_tasks() -> bool:
+    """Whether the Tasks HolisticLandmarker can be used (checked once)."""
+    global _tasks_available
+    if _tasks_available is None:
+        _tasks_available = False
+        if os.path.exists(settings.HOLISTIC_MODEL_PATH):
+            try:
+                from mediapipe.tasks.python import vision  # noqa: F401
+                _tasks_available = True
+                logger.info("✅ Mediapipe HolisticLandmarker (VIDEO mode) enabled")
+            except ImportError:
+                logger.warning("⚠️ Mediapipe Tasks API not installed")
+    return _tasks_available
+
+
+def _create_landmarker():
+    """Create a VIDEO-mode HolisticLandmarker from the task bundle."""
+    from mediapipe.tasks.python import BaseOptions, vision
+
+    options = vision.HolisticLandmarkerOptions(
+        base_options=BaseOptions(model_asset_path=settings.HOLISTIC_MODEL_PATH),
+        running_mode=vision.RunningMode.VIDEO,
+        min_pose_detection_confidence=0.5,
+        min_pose_landmarks_confidence=0.5,
+        min_hand_landmarks_confidence=0.5,
+    )
+    return vision.HolisticLandmarker.create_from_options(options)
+
+
+def _session_landmarker(session_id: Optional[str]) -> Tuple[Any, int]:
+    """Return (landmarker, timestamp_ms) for the session's next frame."""
+    with _landmarkers_lock:
+        entry = _landmarkers.get(session_id)
+        if entry is None:
+            entry = [_create_landmarker(), -1]
+            _landmarkers[session_id] = entry
+            if len(_landmarkers) > settings.MAX_HOLISTIC_SESSIONS:
+                _, (evicted, _) = _landmarkers.popitem(last=False)
+                evicted.close()
+        else:
+            _landmarkers.move_to_end(session_id)
+        # VIDEO mode rejects timestamps that don't strictly increase
+        entry[1] = max(entry[1] + 1, int(time.monotonic() * 1000))
+        return entry[0], entry[1]
+
+
+def close_session(session_id: Optional[str]):
+    """Close and drop the session's landmarker / Holistic graph, if any."""
+    with _landmarkers_lock:
+        entry = _landmarkers.pop(session_id, None)
+        holistic = _holistics.pop(session_id, None)
+    if entry is not None:
+        entry[0].close()
+    if holistic is not None:
+        holistic.close()
+
+
+def close_all_sessions():
+    """Close every per-session landmarker and Holistic graph."""
+    with _landmarkers_lock:
+        graphs = [landmarker for landmarker, _ in _landmarkers.values()]
+        graphs.extend(_holistics.values())
+        _landmarkers.clear()
+        _holistics.clear()
+    for graph in graphs:
+        graph.close()
+
+
+def _fill_keypoints(pose, left_hand, right_hand) -> np.ndarray:
+    """
+    Write landmark sequences straight into one float32 (258,) vector.
+
+    Missing parts (None or empty) stay zero. Avoids building per-landmark
+    Python lists and the float64 arrays / concatenate copies that went with
+    them on every frame.
+    """
+    out = np.zeros(258, dtype=np.float32)
+
+    # 1. Pose (33 * 4 = 132)
+    if pose:
+        for i, lm in enumerate(pose):
+            base = i * 4
+            out[base] = lm.x
+            out[base + 1] = lm.y
+            out[base + 2] = lm.z
+            out[base + 3] = lm.visibility or 0.0
+
+    # 2. Left Hand (21 * 3 = 63) and 3. Right Hand (21 * 3 = 63)
+    for offset, hand in ((132, left_hand), (195, right_hand)):
+        if hand:
+            for i, lm in enumerate(hand):
+                base = offset + i * 3
+                out[base] = lm.x
+                out[base + 1] = lm.y
+                out[base + 2] = lm.z
+
+    return out
+
+
+def _probe_cvt_strategy() -> str:
+    """
+    Decide how BGR frames become RGB mp.Images on the Tasks path.
+
+    "view" hands Mediapipe a zero-copy channel-reversed view, which only
+    works if mp.Image honours the view's negative stride (some builds
+    silently read it as contiguous and keep BGR order); otherwise
+    "convert" goes through the to_rgb() scratch buffer.
+    """
+    import mediapipe as mp
+
+    probe = np.arange(2 * 2 * 3, dtype=np.uint8).reshape(2, 2, 3)
+    try:
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=probe[..., ::-1])
+        if np.array_equal(image.numpy_view(), probe[..., ::-1]):
+            return "view"
+    except Exception:
+        pass
+    return "convert"
+
+
+def _tasks_rgb(frame: np.ndarray) -> np.ndarray:
+    """RGB data for an mp.Image, per the (once-probed) conversion strategy."""
+    global _cvt_strategy
+    if _cvt_strategy is None:
+        _cvt_strategy = _probe_cvt_strategy()
+        logger.info(f"Mediapipe RGB input strategy: {_cvt_strategy}")
+    if _cvt_strategy == "view":
+        return frame[..., ::-1]
+    return to_rgb(frame)
+
+
+def _tasks_keypoints(frame_rgb: np.ndarray, session_id: Optional[str]):
+    """Run the session's landmarker; returns (keypoints, results)."""
+    import mediapipe as mp
+
+    landmarker, timestamp_ms = _session_landmarker(session_id)
+    if _cvt_strategy != "view":
+        frame_rgb = np.ascontiguousarray(frame_rgb)
+    image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
+    results = landmarker.detect_for_video(image, timestamp_ms)
+
+    return _fill_keypoints(
+        results.pose_landmarks, results.left_hand_landmarks, results.right_hand_landmarks
+    ), results
+
+
+def extract_keypoints(
+    frame: np.ndarray,
+    return_results: bool = False,
+    frame_rgb: Optional[np.ndarray] = None,
+    session_id: Optional[str] = None,
+) -> tuple[np.ndarray, any]:
     """
     Extract 258 features [Pose(132), LH(63), RH(63)].
+
+    Pass `frame_rgb` when the RGB conversion of `frame` is already available.
+    `session_id` selects the session's own landmarker / Holistic graph.
     """
-    holistic = _get_holistic()
-    if holistic == "unavailable":
+    if _use_tasks():
+        try:
+            if frame_rgb is None:
+                frame_rgb = _tasks_rgb(frame)
+            keypoints, results = _tasks_keypoints(frame_rgb, session_id)
+            return keypoints, (results if return_results else None)
+        except Exception as e:
+            logger.error(f"HolisticLandmarker extraction error: {e}")
+            return np.zeros(258, dtype=np.float32), None
+
+    solution = _get_holistic()
+    if solution is _UNAVAILABLE:
         return np.zeros(258, dtype=np.float32), None
 
     try:
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = holistic.process(frame_rgb)
-
-        # 1. Pose (33 * 4 = 132)
-        pose = np.array([[res.x, res.y, res.z, res.visibility] for res in results.pose_landmarks.landmark]).flatten() if results.pose_landmarks else np.zeros(132)
-        
-        # 2. Left Hand (21 * 3 = 63)
-        lh = np.array([[res.x, res.y, res.z] for res in results.left_hand_landmarks.landmark]).flatten() if results.left_hand_landmarks else np.zeros(63)
-        
-        # 3. Right Hand (21 * 3 = 63)
-        rh = np.array([[res.x, res.y, res.z] for res in results.right_hand_landmarks.landmark]).flatten() if results.right_hand_landmarks else np.zeros(63)
-
-        keypoints = np.concatenate([pose, lh, rh]).astype(np.float32)
+        if frame_rgb is None:
+            frame_rgb = to_rgb(frame)
+        results = _session_holistic(solution, session_id).process(frame_rgb)
+
+        keypoints = _fill_keypoints(
+            results.pose_landmarks.landmark if results.pose_landmarks else None,
+            results.left_hand_landmarks.landmark if results.left_hand_landmarks else None,
+            results.right_hand_landmarks.landmark if results.right_hand_landmarks else None,
+        )
         return keypoints, (results if return_results else None)
 
     except Exception as e:
@@ -7,11 +7,18 @@ for the detection, recognition, and translation modules.
 
 import os
 import logging
-from typing import Optional, Dict, Any, Tuple
+import threading
+import time
+from typing import Callable, Optional, Dict, Any, Tuple
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Inference calls made on each model at load time, after validation, so
+# one-off costs (allocator growth, cuDNN autotuning, kernel caches) are
+# paid before the first real frame
+WARMUP_ITERATIONS = 5
+
 # Lazy imports to avoid loading heavy dependencies at module level
 _tf = None
 _cv2 = None
@@ -35,6 +42,95 @@ def _import_cv2():
     return _cv2
 
 
+def compile_inference(model: Any, input_shape: Tuple[int, ...]) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Wrap a Keras model in a traced tf.function for hot-path inference.
+    
+    `model.predict` pays Keras' per-call setup (data adapter, callbacks,
+    step function lookup) on every frame; the returned callable runs one
+    pre-traced graph instead. The batch dimension is left dynamic, so any
+    (B, ...) float32 batch reuses the same trace.
+    
+    Args:
+        model: Loaded Keras model
+        input_shape: Model input shape; its first (batch) entry is ignored
+        
+    Returns:
+        Function mapping a (B, ...) array to the model's (B, classes) output
+    """
+    tf = _import_tensorflow()
+    spec = tf.TensorSpec((None,) + tuple(input_shape[1:]), tf.float32)
+    forward = tf.function(lambda x: model(x, training=False), input_signature=[spec])
+    
+    def infer(batch: np.ndarray) -> np.ndarray:
+        return forward(np.asarray(batch, dtype=np.float32)).numpy()
+    
+    return infer
+
+
+def convert_to_tflite(model: Any, input_shape: Tuple[int, ...]) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Convert a Keras model to TFLite with dynamic-range INT8 quantization.
+    
+    Weights are stored as int8 and activations stay float, so CPU inference
+    runs on XNNPACK's quantized kernels with a fraction of the weight
+    bandwidth. Full-integer quantization would need a representative
+    dataset of real inputs, which isn't shipped with the models.
+    
+    Args:
+        model: Loaded Keras model
+        input_shape: Model input shape; its first (batch) entry is ignored
+        
+    Returns:
+        Function mapping a (B, ...) array to the model's (B, classes) output
+    """
+    tf = _import_tensorflow()
+    
+    # A fixed batch of 1 keeps the converted graph static; batches run per row
+    inputs = tf.keras.Input(batch_shape=(1,) + tuple(input_shape[1:]))
+    converter = tf.lite.TFLiteConverter.from_keras_model(tf.keras.Model(inputs, model(inputs)))
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    interpreter = tf.lite.Interpreter(
+        model_content=converter.convert(), num_threads=os.cpu_count()
+    )
+    interpreter.allocate_tensors()
+    input_index = interpreter.get_input_details()[0]["index"]
+    output_index = interpreter.get_output_details()[0]["index"]
+    # The interpreter owns its tensors and isn't safe to invoke concurrently
+    lock = threading.Lock()
+    
+    def infer_one(row: np.ndarray) -> np.ndarray:
+        with lock:
+            interpreter.set_tensor(input_index, row)
+            interpreter.invoke()
+            return interpreter.get_tensor(output_index)
+    
+    def infer(batch: np.ndarray) -> np.ndarray:
+        batch = np.asarray(batch, dtype=np.float32)
+        if batch.shape[0] == 1:
+            return infer_one(batch)
+        return np.concatenate([infer_one(batch[i:i + 1]) for i in range(batch.shape[0])])
+    
+    return infer
+
+
+def _cuda_dnn_available(cv2: Any) -> bool:
+    """Whether this OpenCV build has CUDA and can see a CUDA device."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+def _probe_forward(cv2: Any, net: Any, size: int = 416):
+    """Run one forward pass so an unusable DNN target fails here."""
+    blob = cv2.dnn.blobFromImage(
+        np.zeros((size, size, 3), dtype=np.uint8), 1 / 255.0, (size, size), swapRB=True
+    )
+    net.setInput(blob)
+    net.forward(net.getUnconnectedOutLayersNames())
+
+
 class ModelLoader:
     """
     Manages loading and validation of ISL Unified Project models.
@@ -46,16 +142,21 @@ class ModelLoader:
     - YOLO hand detector (cross-hands.cfg and weights)
     """
     
-    def __init__(self, base_path: str = "../ISL-Unified-Project/models/"):
+    def __init__(self, base_path: str = "../ISL-Unified-Project/models/", backend: str = "keras"):
         """
         Initialize model loader.
         
         Args:
             base_path: Base directory containing model subdirectories
+            backend: Hot-path runtime for loaded models: "keras" (traced
+                tf.function) or "tflite" (INT8-weight TFLite interpreter)
         """
         self.base_path = base_path
+        self.backend = backend
         self.models: Dict[str, Any] = {}
         self.model_info: Dict[str, Dict[str, Any]] = {}
+        # Compiled batch inference per module (see compile_inference)
+        self.infer_fns: Dict[str, Callable[[np.ndarray], np.ndarray]] = {}
         self._gpu_available = None
         
     def _check_gpu_availability(self) -> bool:
@@ -105,14 +206,26 @@ class ModelLoader:
             # Load model
             model = tf.keras.models.load_model(model_path)
             
-            # Validate model
+            # Validate model: check the declared shapes (free) before any
+            # conversion, then compile (and warm) the hot-path inference
+            # function and validate through it, so loading traces the graph
+            # only once
             test_input = np.random.randn(1, 42).astype(np.float32)
-            if not self.validate_model(model, test_input, expected_shape=(1, 35)):
+            if not self._declared_shapes_match(model, test_input.shape, (1, 35)):
+                logger.error(f"❌ Detection model validation failed")
+                return None
+            self._compile_infer_fn("detection", model, test_input)
+            if not self.validate_model(
+                model, test_input, expected_shape=(1, 35), infer_fn=self.infer_fns.get("detection")
+            ):
+                self.infer_fns.pop("detection", None)
                 logger.error(f"❌ Detection model validation failed")
                 return None
             
+            warmup_ms = self._warm_up("detection", model, test_input)
             self.models["detection"] = model
             self.model_info["detection"] = {
+                "warmup_ms": warmup_ms,
                 "path": model_path,
                 "input_shape": (1, 42),
                 "output_shape": (1, 35),
@@ -150,14 +263,26 @@ class ModelLoader:
             # Load model
             model = tf.keras.models.load_model(model_path)
             
-            # Validate model
+            # Validate model: check the declared shapes (free) before any
+            # conversion, then compile (and warm) the hot-path inference
+            # function and validate through it, so loading traces the graph
+            # only once
             test_input = np.random.randn(1, 45, 258).astype(np.float32)
-            if not self.validate_model(model, test_input, expected_shape=(1, 3)):
+            if not self._declared_shapes_match(model, test_input.shape, (1, 3)):
+                logger.error(f"❌ Recognition model validation failed")
+                return None
+            self._compile_infer_fn("recognition", model, test_input)
+            if not self.validate_model(
+                model, test_input, expected_shape=(1, 3), infer_fn=self.infer_fns.get("recognition")
+            ):
+                self.infer_fns.pop("recognition", None)
                 logger.error(f"❌ Recognition model validation failed")
                 return None
             
+            warmup_ms = self._warm_up("recognition", model, test_input)
             self.models["recognition"] = model
             self.model_info["recognition"] = {
+                "warmup_ms": warmup_ms,
                 "path": model_path,
                 "input_shape": (1, 45, 258),
                 "output_shape": (1, 3),
@@ -181,33 +306,55 @@ class ModelLoader:
             Loaded model or None if loading fails
         """
         model_path = os.path.join(self.base_path, "translation", "squeezenet_model").replace("\\", "/")
+        # An ONNX export next to the SavedModel (python -m ml.onnx_runner
+        # export) runs through ONNX Runtime instead of TensorFlow
+        onnx_path = f"{model_path}.onnx"
+        onnx_model = self._load_onnx_model(onnx_path) if os.path.exists(onnx_path) else None
         
-        if not os.path.exists(model_path):
+        if onnx_model is None and not os.path.exists(model_path):
             logger.warning(f"⚠️ Translation model not found at {model_path}")
             return None
         
         try:
-            tf = _import_tensorflow()
-            
-            # Check GPU availability
-            self._check_gpu_availability()
-            
-            # Load SavedModel format
-            model = tf.keras.models.load_model(model_path)
+            if onnx_model is not None:
+                model, model_path = onnx_model, onnx_path
+                self.infer_fns["translation"] = onnx_model
+            else:
+                tf = _import_tensorflow()
+                
+                # Check GPU availability
+                self._check_gpu_availability()
+                
+                # Load SavedModel format
+                model = tf.keras.models.load_model(model_path)
             
-            # Validate model
+            # Validate model: check the declared shapes (free) before any
+            # conversion, then compile (and warm) the hot-path inference
+            # function and validate through it, so loading traces the graph
+            # only once
             test_input = np.random.randn(1, 224, 224, 3).astype(np.float32)
-            if not self.validate_model(model, test_input, expected_shape=(1, 10)):
+            if not self._declared_shapes_match(model, test_input.shape, (1, 10)):
+                logger.error(f"❌ Translation model validation failed")
+                return None
+            if onnx_model is None:
+                self._compile_infer_fn("translation", model, test_input)
+            if not self.validate_model(
+                model, test_input, expected_shape=(1, 10), infer_fn=self.infer_fns.get("translation")
+            ):
+                self.infer_fns.pop("translation", None)
                 logger.error(f"❌ Translation model validation failed")
                 return None
             
+            warmup_ms = self._warm_up("translation", model, test_input)
             self.models["translation"] = model
             self.model_info["translation"] = {
+                "warmup_ms": warmup_ms,
                 "path": model_path,
                 "input_shape": (1, 224, 224, 3),
                 "output_shape": (1, 10),
                 "num_classes": 10,
                 "type": "SqueezeNet",
+                "runtime": "onnxruntime" if onnx_model is not None else "tensorflow",
                 "loaded": True
             }
             
@@ -218,6 +365,17 @@ class ModelLoader:
             logger.error(f"❌ Failed to load translation model: {e}")
             return None
     
+    def _load_onnx_model(self, onnx_path: str) -> Optional[Any]:
+        """Open an ONNX export with ONNX Runtime, or return None if unavailable."""
+        try:
+            from ml.onnx_runner import ONNXModel
+            return ONNXModel(onnx_path)
+        except ImportError:
+            logger.warning("⚠️ onnxruntime not installed, ignoring ONNX export")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load ONNX model {onnx_path}: {e}")
+        return None
+    
     def load_yolo_detector(
         self, 
         config_path: str = "../ISL-Unified-Project/config/yolo/cross-hands.cfg",
@@ -248,17 +406,29 @@ class ModelLoader:
             # Load YOLO using OpenCV DNN
             net = cv2.dnn.readNetFromDarknet(config_path, weights_path)
             
-            # Try to use GPU if available
-            if self._check_gpu_availability():
-                try:
-                    net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
-                    net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
-                    logger.info("✅ YOLO using GPU acceleration")
-                except Exception as e:
-                    logger.warning(f"Could not enable GPU for YOLO: {e}, using CPU")
-                    net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
-                    net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
-            else:
+            # Try to use GPU if available: FP16 first (half the weight
+            # bandwidth, tensor cores), then FP32. OpenCV accepts any target
+            # and only fails (or silently falls back) at forward(), so
+            # require a CUDA build with a device and probe each target.
+            target = "cpu"
+            if _cuda_dnn_available(cv2):
+                for name, dnn_target in (
+                    ("cuda_fp16", cv2.dnn.DNN_TARGET_CUDA_FP16),
+                    ("cuda", cv2.dnn.DNN_TARGET_CUDA),
+                ):
+                    try:
+                        net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+                        net.setPreferableTarget(dnn_target)
+                        _probe_forward(cv2, net)
+                        target = name
+                        break
+                    except Exception as e:
+                        logger.warning(f"Could not enable {name} target for YOLO: {e}")
+                if target == "cpu":
+                    logger.warning("Could not enable GPU for YOLO, using CPU")
+                else:
+                    logger.info(f"✅ YOLO using GPU acceleration ({target})")
+            if target == "cpu":
                 net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
                 net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
             
@@ -267,6 +437,7 @@ class ModelLoader:
                 "config_path": config_path,
                 "weights_path": weights_path,
                 "type": "YOLO-v3",
+                "target": target,
                 "loaded": True
             }
             
@@ -281,7 +452,8 @@ class ModelLoader:
         self, 
         model: Any, 
         test_input: np.ndarray,
-        expected_shape: Optional[Tuple[int, ...]] = None
+        expected_shape: Optional[Tuple[int, ...]] = None,
+        infer_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None
     ) -> bool:
         """
         Validate model produces expected output shape.
@@ -290,12 +462,17 @@ class ModelLoader:
             model: Model to validate
             test_input: Test input array
             expected_shape: Expected output shape (optional)
+            infer_fn: Compiled inference for the model; used instead of
+                model.predict when given
             
         Returns:
             True if validation passes, False otherwise
         """
         try:
-            output = model.predict(test_input, verbose=0)
+            if infer_fn is not None:
+                output = infer_fn(test_input)
+            else:
+                output = model.predict(test_input, verbose=0)
             
             # Check output is not None
             if output is None:
@@ -328,6 +505,87 @@ class ModelLoader:
             logger.error(f"Model validation failed with exception: {e}")
             return False
     
+    def _declared_shapes_match(
+        self,
+        model: Any,
+        input_shape: Tuple[int, ...],
+        output_shape: Tuple[int, ...]
+    ) -> bool:
+        """
+        Compare a Keras model's declared input/output shapes (batch excluded)
+        with the expected ones, without running it.
+        
+        Models that don't declare tuple shapes (e.g. ONNX adapters) pass, and
+        are left to the forward-pass check in validate_model.
+        """
+        for attr, expected in (("input_shape", input_shape), ("output_shape", output_shape)):
+            declared = getattr(model, attr, None)
+            if isinstance(declared, tuple) and tuple(declared[1:]) != tuple(expected[1:]):
+                logger.error(
+                    f"Model validation failed: declared {attr} {declared}, expected {expected}"
+                )
+                return False
+        return True
+    
+    def _compile_infer_fn(self, module_name: str, model: Any, test_input: np.ndarray):
+        """Build the model's inference function now, so the first frame doesn't."""
+        if self.backend == "tflite":
+            try:
+                infer = convert_to_tflite(model, test_input.shape)
+                infer(test_input)
+                self.infer_fns[module_name] = infer
+                logger.info(f"✅ {module_name} model converted to TFLite (dynamic-range INT8)")
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ TFLite conversion failed for {module_name}, using Keras: {e}")
+        try:
+            infer = compile_inference(model, test_input.shape)
+            infer(test_input)
+            self.infer_fns[module_name] = infer
+        except Exception as e:
+            logger.warning(f"⚠️ Could not compile {module_name} inference, using model.predict: {e}")
+    
+    def _warm_up(self, module_name: str, model: Any, test_input: np.ndarray) -> float:
+        """Run WARMUP_ITERATIONS inferences on the hot path; returns their total ms."""
+        infer = self.infer_fns.get(module_name)
+        start = time.perf_counter()
+        for _ in range(WARMUP_ITERATIONS):
+            if infer is not None:
+                infer(test_input)
+            else:
+                model.predict(test_input, verbose=0)
+        warmup_ms = (time.perf_counter() - start) * 1000
+        logger.debug(f"{module_name} warm-up: {warmup_ms:.1f} ms")
+        return round(warmup_ms, 1)
+    
+    def get_infer_fn(self, module_name: str) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """
+        Get the compiled batch inference function for a module's model.
+        
+        Args:
+            module_name: Name of module (detection, recognition, translation)
+            
+        Returns:
+            Function mapping (B, ...) -> (B, classes), or None if unavailable
+        """
+        return self.infer_fns.get(module_name)
+    
+    def predict_batch(self, module_name: str, batch: np.ndarray) -> np.ndarray:
+        """
+        Run a stacked batch through a module's model.
+        
+        Args:
+            module_name: Name of module (detection, recognition, translation)
+            batch: (B, ...) float32 inputs, e.g. (B, 45, 258) recognition windows
+            
+        Returns:
+            Model outputs of shape (B, classes)
+        """
+        infer = self.infer_fns.get(module_name)
+        if infer is not None:
+            return infer(batch)
+        return self.models[module_name].predict(batch, verbose=0)
+    
     def get_model(self, module_name: str) -> Optional[Any]:
         """
         Get loaded model by module name.
@@ -6,7 +6,11 @@ for the ISL (Indian Sign Language) Unified Project integration.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+from ..keypoint_extractor import to_rgb
 
 
 @dataclass
@@ -23,4 +27,45 @@ class ModulePrediction:
     timestamp: float  # Unix timestamp
 
 
-__all__ = ["ModulePrediction"]
+# Per-frame cache of derived images shared by all modules that see the frame.
+# Built once per frame by the orchestrator; keys identify the transform.
+FrameCache = Dict[Hashable, np.ndarray]
+
+
+def rgb_frame(frame: np.ndarray, frame_cache: Optional[FrameCache] = None) -> np.ndarray:
+    """
+    Return the frame converted BGR -> RGB, converting at most once per frame.
+    
+    The conversion lands in the converting thread's scratch buffer (see
+    keypoint_extractor.to_rgb); every module finishes with a frame before
+    the orchestrator hands over the next one.
+    
+    Args:
+        frame: Input frame as numpy array (H, W, 3) in BGR format
+        frame_cache: Shared per-frame cache, or None to convert unconditionally
+    """
+    if frame_cache is None:
+        return to_rgb(frame)
+    rgb = frame_cache.get("rgb")
+    if rgb is None:
+        rgb = frame_cache.setdefault("rgb", to_rgb(frame))
+    return rgb
+
+
+# Compiled batch inference for a module's model: (B, ...) -> (B, classes)
+InferFn = Callable[[np.ndarray], np.ndarray]
+
+
+def run_model(model: Any, infer_fn: Optional[InferFn], batch: np.ndarray) -> np.ndarray:
+    """
+    Run a module's model on a batch.
+    
+    Uses the compiled `infer_fn` from ModelLoader when there is one, and
+    Keras `model.predict` (much higher per-call overhead) otherwise.
+    """
+    if infer_fn is not None:
+        return infer_fn(batch)
+    return model.predict(batch, verbose=0)
+
+
+__all__ = ["FrameCache", "InferFn", "ModulePrediction", "rgb_frame", "run_model"]
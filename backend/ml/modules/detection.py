@@ -16,7 +16,8 @@ import logging
 from typing import Optional, Dict, Any
 import numpy as np
 
-from . import ModulePrediction
+from . import FrameCache, InferFn, ModulePrediction, rgb_frame, run_model
+from .._landmark_kernels import normalize_hand_landmarks
 from ..vocabulary import get_word_by_module_index, get_display_name
 
 logger = logging.getLogger(__name__)
@@ -46,15 +47,18 @@ class DetectionModule:
     into 35 classes (1-9, A-Z).
     """
     
-    def __init__(self, model: Any, config: Dict[str, Any]):
+    def __init__(self, model: Any, config: Dict[str, Any], infer_fn: Optional[InferFn] = None):
         """
         Initialize detection module.
         
         Args:
             model: Loaded FNN gesture classifier (Keras model)
             config: Module configuration with preprocessing_params and confidence_threshold
+            infer_fn: Compiled batch inference from ModelLoader.get_infer_fn;
+                falls back to model.predict when None
         """
         self.model = model
+        self.infer_fn = infer_fn
         self.config = config
         self.confidence_threshold = config.get("confidence_threshold", 0.7)
         
@@ -108,12 +112,15 @@ class DetectionModule:
             f"(max_hands={self.max_num_hands}, complexity={self.model_complexity})"
         )
     
-    def predict(self, frame: np.ndarray) -> Optional[ModulePrediction]:
+    def predict(
+        self, frame: np.ndarray, frame_cache: Optional[FrameCache] = None
+    ) -> Optional[ModulePrediction]:
         """
         Process frame and return gesture prediction.
         
         Args:
             frame: Input frame as numpy array (H, W, 3) in BGR format
+            frame_cache: Per-frame cache shared with the other modules
             
         Returns:
             ModulePrediction with gesture classification, or None if:
@@ -126,7 +133,7 @@ class DetectionModule:
         try:
             # Extract hand landmarks
             preprocessing_start = time.time()
-            landmarks = self.extract_hand_landmarks(frame)
+            landmarks = self.extract_hand_landmarks(frame, frame_cache)
             preprocessing_time = time.time() - preprocessing_start
             
             if landmarks is None:
@@ -138,7 +145,7 @@ class DetectionModule:
             
             # Run inference
             inference_start = time.time()
-            predictions = self.model.predict(processed_landmarks, verbose=0)
+            predictions = run_model(self.model, self.infer_fn, processed_landmarks)
             inference_time = time.time() - inference_start
             
             # Get top 3 predictions for analysis
@@ -227,25 +234,27 @@ class DetectionModule:
             logger.error(f"Detection module prediction failed: {e}", exc_info=True)
             return None
     
-    def extract_hand_landmarks(self, frame: np.ndarray) -> Optional[np.ndarray]:
+    def extract_hand_landmarks(
+        self, frame: np.ndarray, frame_cache: Optional[FrameCache] = None
+    ) -> Optional[np.ndarray]:
         """
         Extract 42-point hand landmarks using MediaPipe Hands.
         
         Args:
             frame: Input frame as numpy array (H, W, 3) in BGR format
+            frame_cache: Per-frame cache; reuses its RGB conversion if present
             
         Returns:
             Numpy array of shape (42,) with [x1, y1, x2, y2, ..., x21, y21] for one hand,
             or None if no hands detected
         """
         try:
-            # Convert BGR to RGB for MediaPipe
-            import cv2
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Convert BGR to RGB for MediaPipe (shared with recognition)
+            rgb = rgb_frame(frame, frame_cache)
             
             # Create MediaPipe Image
             mp, _, _ = _import_mediapipe()
-            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
             
             # Process frame
             results = self.hands.detect(mp_image)
@@ -258,12 +267,12 @@ class DetectionModule:
             # We only use x and y for 42 features
             hand_landmarks = results.hand_landmarks[0]
             
-            landmarks = []
-            for landmark in hand_landmarks:
-                landmarks.append(landmark.x)
-                landmarks.append(landmark.y)
+            landmarks = np.empty(2 * len(hand_landmarks), dtype=np.float32)
+            for i, landmark in enumerate(hand_landmarks):
+                landmarks[2 * i] = landmark.x
+                landmarks[2 * i + 1] = landmark.y
             
-            return np.array(landmarks, dtype=np.float32)
+            return landmarks
             
         except Exception as e:
             logger.error(f"Hand landmark extraction failed: {e}")
@@ -284,28 +293,14 @@ class DetectionModule:
         Returns:
             Preprocessed landmarks array of shape (1, 42)
         """
-        # Make a copy to avoid modifying original
-        processed = landmarks.copy()
-        
-        # Extract wrist coordinates (first landmark, indices 0 and 1)
-        wrist_x = processed[0]
-        wrist_y = processed[1]
-        
-        # Convert to relative coordinates
-        # Subtract wrist position from all x coordinates
-        processed[0::2] -= wrist_x  # Every even index is x
-        # Subtract wrist position from all y coordinates
-        processed[1::2] -= wrist_y  # Every odd index is y
-        
-        # Normalize by max absolute value
-        max_val = np.max(np.abs(processed))
-        if max_val > 0:
-            processed = processed / max_val
+        # Work on a float32 copy so the original is not modified; the kernel
+        # subtracts the wrist (first landmark) and normalizes by the max
+        # absolute value in place
+        processed = np.array(landmarks, dtype=np.float32)
+        normalize_hand_landmarks(processed)
         
         # Reshape to (1, 42) for model input
-        processed = processed.reshape(1, -1)
-        
-        return processed
+        return processed.reshape(1, -1)
     
     def __del__(self):
         """Cleanup MediaPipe resources."""
@@ -16,7 +16,7 @@ import logging
 from typing import Optional, Dict, Any
 import numpy as np
 
-from . import ModulePrediction
+from . import FrameCache, InferFn, ModulePrediction, rgb_frame, run_model
 from ..vocabulary import get_word_by_module_index, get_display_name
 from ..keypoint_extractor import extract_keypoints
 from ..buffer_manager import get_buffer, clear_buffer
@@ -32,15 +32,18 @@ class RecognitionModule:
     analysis. Requires 45 frames before making predictions.
     """
     
-    def __init__(self, model: Any, config: Dict[str, Any]):
+    def __init__(self, model: Any, config: Dict[str, Any], infer_fn: Optional[InferFn] = None):
         """
         Initialize recognition module.
         
         Args:
             model: Loaded LSTM word recognition model (Keras model)
             config: Module configuration with preprocessing_params and confidence_threshold
+            infer_fn: Compiled batch inference from ModelLoader.get_infer_fn;
+                falls back to model.predict when None
         """
         self.model = model
+        self.infer_fn = infer_fn
         self.config = config
         self.confidence_threshold = config.get("confidence_threshold", 0.6)
         
@@ -54,13 +57,19 @@ class RecognitionModule:
             f"(buffer_size={self.buffer_size}, threshold={self.confidence_threshold})"
         )
     
-    def predict(self, frame: np.ndarray, session_id: str) -> Optional[ModulePrediction]:
+    def predict(
+        self,
+        frame: np.ndarray,
+        session_id: str,
+        frame_cache: Optional[FrameCache] = None
+    ) -> Optional[ModulePrediction]:
         """
         Process frame with temporal buffering and return word prediction.
         
         Args:
             frame: Input frame as numpy array (H, W, 3) in BGR format
             session_id: Session identifier for buffer management
+            frame_cache: Per-frame cache shared with the other modules
             
         Returns:
             ModulePrediction with word classification, or None if:
@@ -73,7 +82,7 @@ class RecognitionModule:
         try:
             # Extract pose keypoints
             preprocessing_start = time.time()
-            keypoints = self.extract_pose_keypoints(frame)
+            keypoints = self.extract_pose_keypoints(frame, frame_cache, session_id)
             preprocessing_time = time.time() - preprocessing_start
             
             if keypoints is None:
@@ -102,7 +111,7 @@ class RecognitionModule:
             
             # Run inference
             inference_start = time.time()
-            predictions = self.model.predict(sequence, verbose=0)
+            predictions = run_model(self.model, self.infer_fn, sequence)
             inference_time = time.time() - inference_start
             
             # Get class with highest confidence
@@ -154,7 +163,12 @@ class RecognitionModule:
             logger.error(f"Recognition module prediction failed: {e}", exc_info=True)
             return None
     
-    def extract_pose_keypoints(self, frame: np.ndarray) -> Optional[np.ndarray]:
+    def extract_pose_keypoints(
+        self,
+        frame: np.ndarray,
+        frame_cache: Optional[FrameCache] = None,
+        session_id: Optional[str] = None,
+    ) -> Optional[np.ndarray]:
         """
         Extract 258 features using MediaPipe Holistic.
         
@@ -166,6 +180,8 @@ class RecognitionModule:
         
         Args:
             frame: Input frame as numpy array (H, W, 3) in BGR format
+            frame_cache: Per-frame cache; reuses its RGB conversion if present
+            session_id: Session whose landmarker tracks this stream
             
         Returns:
             Numpy array of shape (258,) with extracted keypoints,
@@ -173,7 +189,12 @@ class RecognitionModule:
         """
         try:
             # Use existing keypoint extractor
-            keypoints, _ = extract_keypoints(frame, return_results=False)
+            keypoints, _ = extract_keypoints(
+                frame,
+                return_results=False,
+                frame_rgb=rgb_frame(frame, frame_cache),
+                session_id=session_id,
+            )
             
             # Verify shape
             if keypoints.shape[0] != 258:
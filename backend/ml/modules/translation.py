@@ -19,7 +19,7 @@ from typing import Optional, Dict, Any, List, Tuple
 import numpy as np
 import cv2
 
-from . import ModulePrediction
+from . import FrameCache, InferFn, ModulePrediction, run_model
 from ..vocabulary import get_word_by_module_index, get_display_name
 
 logger = logging.getLogger(__name__)
@@ -33,7 +33,15 @@ class TranslationModule:
     into 10 classes (G, I, K, O, P, S, U, V, X, Y).
     """
     
-    def __init__(self, model: Any, yolo_config: str, yolo_weights: str, config: Dict[str, Any]):
+    def __init__(
+        self,
+        model: Any,
+        yolo_config: str,
+        yolo_weights: str,
+        config: Dict[str, Any],
+        infer_fn: Optional[InferFn] = None,
+        yolo_net: Optional[cv2.dnn.Net] = None,
+    ):
         """
         Initialize translation module.
         
@@ -42,8 +50,13 @@ class TranslationModule:
             yolo_config: Path to YOLO configuration file
             yolo_weights: Path to YOLO weights file
             config: Module configuration with preprocessing_params and confidence_threshold
+            infer_fn: Compiled batch inference from ModelLoader.get_infer_fn;
+                falls back to model.predict when None
+            yolo_net: YOLO net from ModelLoader.load_yolo_detector; loaded from
+                yolo_config/yolo_weights when None
         """
         self.model = model
+        self.infer_fn = infer_fn
         self.config = config
         self.confidence_threshold = config.get("confidence_threshold", 0.7)
         
@@ -54,8 +67,9 @@ class TranslationModule:
         self.yolo_size = preprocessing_params.get("yolo_size", 416)
         self.target_size = tuple(preprocessing_params.get("target_size", [224, 224]))
         
-        # Initialize YOLO detector
-        self.yolo_net = self._load_yolo(yolo_config, yolo_weights)
+        # Initialize YOLO detector (reuse the loader's, already on its
+        # preferred DNN target, when given)
+        self.yolo_net = yolo_net if yolo_net is not None else self._load_yolo(yolo_config, yolo_weights)
         
         logger.info(
             f"✅ Translation module initialized "
@@ -93,7 +107,9 @@ class TranslationModule:
         except Exception as e:
             raise ValueError(f"Failed to load YOLO detector: {e}")
     
-    def predict(self, frame: np.ndarray) -> Optional[ModulePrediction]:
+    def predict(
+        self, frame: np.ndarray, frame_cache: Optional[FrameCache] = None
+    ) -> Optional[ModulePrediction]:
         """
         Detect hands, segment skin, and classify sign.
         
@@ -107,6 +123,8 @@ class TranslationModule:
         
         Args:
             frame: Input frame as numpy array (H, W, 3) in BGR format
+            frame_cache: Per-frame cache shared with the other modules
+                (accepted for a uniform call signature; YOLO works on BGR)
             
         Returns:
             ModulePrediction with sign classification, or None if:
@@ -151,7 +169,7 @@ class TranslationModule:
             
             # Run inference
             inference_start = time.time()
-            predictions = self.model.predict(preprocessed, verbose=0)
+            predictions = run_model(self.model, self.infer_fn, preprocessed)
             inference_time = time.time() - inference_start
             
             # Get class with highest confidence
@@ -263,7 +281,7 @@ class TranslationModule:
                     # Handle both old and new OpenCV API
                     if isinstance(idxs, np.ndarray):
                         if idxs.ndim == 2:
-                            idxs = idxs.flatten()
+                            idxs = idxs.ravel()
                     
                     result_boxes = []
                     for i in idxs:
@@ -382,8 +400,8 @@ class TranslationModule:
             # Convert to RGB (SqueezeNet expects RGB)
             rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
             
-            # Normalize to [0, 1]
-            normalized = rgb.astype(np.float32) / 255.0
+            # Normalize to [0, 1] (one float32 allocation, no uint8->float copy)
+            normalized = np.multiply(rgb, np.float32(1 / 255), dtype=np.float32)
             
             # Add batch dimension
             preprocessed = np.expand_dims(normalized, axis=0)
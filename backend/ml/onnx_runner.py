@@ -0,0 +1,80 @@
+"""
+SignVista ONNX Runtime Runner
+
+Optional backend for the translation SqueezeNet. The Keras SavedModel is
+exported to ONNX once; at startup ModelLoader.load_translation_model loads
+`squeezenet_model.onnx` (next to the SavedModel directory) through ONNX
+Runtime with every graph optimization enabled, instead of TensorFlow.
+
+Export the model:
+
+    python -m ml.onnx_runner export
+
+Needs `onnxruntime` (or `onnxruntime-gpu`) and, for the export step,
+`tf2onnx`; neither is in requirements.txt, and the loader falls back to the
+SavedModel if they are missing.
+"""
+
+import logging
+import os
+import sys
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class ONNXModel:
+    """
+    ONNX Runtime session behind the small slice of the Keras model API the
+    loader and modules use (`predict`, and calling it on a batch).
+    """
+
+    def __init__(self, onnx_path: str):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # Only ask for CUDA when this onnxruntime build has it
+        providers = [
+            p for p in ("CUDAExecutionProvider", "CPUExecutionProvider")
+            if p in ort.get_available_providers()
+        ]
+        self.session = ort.InferenceSession(onnx_path, sess_options=options, providers=providers)
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_name = self.session.get_outputs()[0].name
+        logger.info(f"✅ ONNX Runtime session loaded from {onnx_path} ({providers[0]})")
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        """Run a (B, 224, 224, 3) batch; returns (B, classes)."""
+        inputs = np.asarray(batch, dtype=np.float32)
+        return self.session.run([self.output_name], {self.input_name: inputs})[0]
+
+    def predict(self, batch: np.ndarray, verbose: Any = 0) -> np.ndarray:
+        """Keras-compatible alias of __call__ (`verbose` is ignored)."""
+        return self(batch)
+
+
+# ─── Offline Export ───────────────────────────────────────────────
+
+def export_onnx(saved_model_dir: str, onnx_path: str):
+    """Export the translation SavedModel to ONNX (dynamic batch size)."""
+    import tensorflow as tf
+    import tf2onnx
+
+    model = tf.keras.models.load_model(saved_model_dir)
+    spec = (tf.TensorSpec((None, 224, 224, 3), tf.float32, name="image"),)
+    tf2onnx.convert.from_keras(model, input_signature=spec, opset=15, output_path=onnx_path)
+    logger.info(f"✅ ONNX model written to {onnx_path}")
+
+
+if __name__ == "__main__":
+    from ml.model_loader import ModelLoader
+
+    if sys.argv[1:] != ["export"]:
+        print("Usage: python -m ml.onnx_runner export")
+        sys.exit(1)
+    logging.basicConfig(level=logging.INFO)
+    saved_model_dir = os.path.join(ModelLoader().base_path, "translation", "squeezenet_model")
+    export_onnx(saved_model_dir, saved_model_dir + ".onnx")
@@ -0,0 +1,154 @@
+"""
+SignVista TensorRT Runner
+
+Optional GPU backend for the fallback Keras LSTM. The model is exported to
+ONNX once, compiled into an FP16 TensorRT engine, and the engine is
+serialized next to the weights so server startup only deserializes it.
+
+Build the engine (on the deployment GPU — engines are not portable):
+
+    python -m ml.trt_runner build
+
+then run the server with LSTM_BACKEND=tensorrt. Needs `tensorrt`,
+`cuda-python` and (for the export step) `tf2onnx`; none of them are in
+requirements.txt, and inference.py falls back to Keras if they are missing.
+"""
+
+import logging
+import os
+from typing import Tuple
+
+import numpy as np
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# The LSTM's fixed input signature
+INPUT_SHAPE: Tuple[int, int, int] = (1, 45, 258)
+
+
+def _check(result):
+    """Unwrap a cuda-python (err, *values) tuple, raising on error."""
+    from cuda import cudart
+
+    err, *values = result
+    if err != cudart.cudaError_t.cudaSuccess:
+        raise RuntimeError(f"CUDA error: {err}")
+    return values[0] if len(values) == 1 else values
+
+
+class TRTRunner:
+    """Runs a serialized TensorRT engine with one static-shape input/output."""
+
+    def __init__(self, engine_path: str):
+        import tensorrt as trt
+        from cuda import cudart
+
+        trt_logger = trt.Logger(trt.Logger.WARNING)
+        with open(engine_path, "rb") as f:
+            self.engine = trt.Runtime(trt_logger).deserialize_cuda_engine(f.read())
+        if self.engine is None:
+            raise RuntimeError(f"Failed to deserialize TensorRT engine: {engine_path}")
+        self.context = self.engine.create_execution_context()
+
+        names = [self.engine.get_tensor_name(i) for i in range(self.engine.num_io_tensors)]
+        self.input_name = next(
+            n for n in names if self.engine.get_tensor_mode(n) == trt.TensorIOMode.INPUT
+        )
+        self.output_name = next(
+            n for n in names if self.engine.get_tensor_mode(n) == trt.TensorIOMode.OUTPUT
+        )
+        self.context.set_input_shape(self.input_name, INPUT_SHAPE)
+        output_shape = tuple(self.context.get_tensor_shape(self.output_name))
+
+        # Host buffers are reused for every call; device buffers live for the
+        # lifetime of the runner
+        self.host_in = np.empty(INPUT_SHAPE, dtype=np.float32)
+        self.host_out = np.empty(output_shape, dtype=np.float32)
+        self.dev_in = _check(cudart.cudaMalloc(self.host_in.nbytes))
+        self.dev_out = _check(cudart.cudaMalloc(self.host_out.nbytes))
+        self.stream = _check(cudart.cudaStreamCreate())
+        self.context.set_tensor_address(self.input_name, self.dev_in)
+        self.context.set_tensor_address(self.output_name, self.dev_out)
+        logger.info(f"✅ TensorRT engine loaded from {engine_path}")
+
+    def infer(self, sequence: np.ndarray) -> np.ndarray:
+        """Run one (1, 45, 258) sequence; returns class logits (1, C)."""
+        from cuda import cudart
+
+        np.copyto(self.host_in, sequence, casting="same_kind")
+        h2d = cudart.cudaMemcpyKind.cudaMemcpyHostToDevice
+        d2h = cudart.cudaMemcpyKind.cudaMemcpyDeviceToHost
+        _check(cudart.cudaMemcpyAsync(
+            self.dev_in, self.host_in.ctypes.data, self.host_in.nbytes, h2d, self.stream
+        ))
+        if not self.context.execute_async_v3(self.stream):
+            raise RuntimeError("TensorRT execution failed")
+        _check(cudart.cudaMemcpyAsync(
+            self.host_out.ctypes.data, self.dev_out, self.host_out.nbytes, d2h, self.stream
+        ))
+        _check(cudart.cudaStreamSynchronize(self.stream))
+        return self.host_out.copy()
+
+    def __del__(self):
+        try:
+            from cuda import cudart
+
+            cudart.cudaFree(self.dev_in)
+            cudart.cudaFree(self.dev_out)
+            cudart.cudaStreamDestroy(self.stream)
+        except Exception:
+            pass
+
+
+# ─── Offline Build ────────────────────────────────────────────────
+
+def export_onnx(onnx_path: str):
+    """Export the fallback Keras LSTM (with loaded weights) to ONNX."""
+    import tensorflow as tf
+    import tf2onnx
+
+    from ml.inference import create_lstm_model
+    from ml.vocabulary import NUM_CLASSES
+
+    model = create_lstm_model(num_classes=NUM_CLASSES)
+    model.load_weights(settings.MODEL_PATH)
+    spec = (tf.TensorSpec(INPUT_SHAPE, tf.float32, name="keypoints"),)
+    tf2onnx.convert.from_keras(model, input_signature=spec, opset=15, output_path=onnx_path)
+
+
+def build_engine(onnx_path: str, engine_path: str, fp16: bool = True):
+    """Compile an ONNX model into a serialized TensorRT engine."""
+    import tensorrt as trt
+
+    trt_logger = trt.Logger(trt.Logger.WARNING)
+    builder = trt.Builder(trt_logger)
+    network = builder.create_network(0)
+    parser = trt.OnnxParser(network, trt_logger)
+    with open(onnx_path, "rb") as f:
+        if not parser.parse(f.read()):
+            errors = [str(parser.get_error(i)) for i in range(parser.num_errors)]
+            raise RuntimeError(f"ONNX parse failed: {errors}")
+
+    config = builder.create_builder_config()
+    if fp16:
+        config.set_flag(trt.BuilderFlag.FP16)
+    engine = builder.build_serialized_network(network, config)
+    if engine is None:
+        raise RuntimeError("TensorRT engine build failed")
+    with open(engine_path, "wb") as f:
+        f.write(engine)
+    logger.info(f"✅ TensorRT engine written to {engine_path}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if sys.argv[1:] != ["build"]:
+        print("Usage: python -m ml.trt_runner build")
+        sys.exit(1)
+    logging.basicConfig(level=logging.INFO)
+    onnx_path = os.path.splitext(settings.TRT_ENGINE_PATH)[0] + ".onnx"
+    export_onnx(onnx_path)
+    build_engine(onnx_path, settings.TRT_ENGINE_PATH)
@@ -3,6 +3,7 @@ Quick diagnostic script to test ISL detection system.
 Run this to see what's happening with the modules.
 """
 
+import asyncio
 import sys
 import logging
 import numpy as np
@@ -55,11 +56,11 @@ dummy_frame = np.zeros((480, 640, 3), dtype=np.uint8)
 # Add a simple face-like region (to pass face detection)
 cv2.rectangle(dummy_frame, (200, 100), (440, 380), (255, 255, 255), -1)
 
-word, confidence, status, _, module_details = predict_from_raw_frame(
+word, confidence, status, _, module_details = asyncio.run(predict_from_raw_frame(
     session_id="test-diagnostic",
     frame=dummy_frame,
     return_module_details=True
-)
+))
 
 print(f"   Result: word={word}, confidence={confidence}, status={status}")
 if module_details:
@@ -3,6 +3,7 @@ Test live camera detection with real-time feedback.
 Press 'q' to quit.
 """
 
+import asyncio
 import cv2
 import logging
 import sys
@@ -39,11 +40,11 @@ while True:
     # Only process every 5th frame for performance
     if frame_count % 5 == 0:
         # Get prediction with module details
-        word, confidence, status, _, module_details = predict_from_raw_frame(
+        word, confidence, status, _, module_details = asyncio.run(predict_from_raw_frame(
             session_id="live-test",
             frame=frame,
             return_module_details=True
-        )
+        ))
         
         # Display results
         if word:
@@ -0,0 +1,86 @@
+"""Tests for ml.batch_scheduler."""
+
+import asyncio
+
+import numpy as np
+
+from ml.batch_scheduler import BatchScheduler
+
+
+def _sequence(value: float) -> np.ndarray:
+    return np.full((1, 45, 258), value, dtype=np.float32)
+
+
+def _recording_predictor(batch_sizes):
+    def predict(batch):
+        batch_sizes.append(batch.shape[0])
+        # One "probability" row per sequence, echoing its fill value
+        return batch[:, 0, :3].copy()
+    return predict
+
+
+def test_concurrent_submits_share_one_forward_pass():
+    batch_sizes = []
+    scheduler = BatchScheduler(_recording_predictor(batch_sizes), max_batch=8, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(*(scheduler.submit(_sequence(i)) for i in range(3)))
+
+    results = asyncio.run(run())
+    assert batch_sizes == [3]
+    assert [r.shape for r in results] == [(1, 3)] * 3
+    assert [float(r[0, 0]) for r in results] == [0.0, 1.0, 2.0]
+
+
+def test_batches_are_capped_at_max_batch():
+    batch_sizes = []
+    scheduler = BatchScheduler(_recording_predictor(batch_sizes), max_batch=2, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(*(scheduler.submit(_sequence(i)) for i in range(5)))
+
+    asyncio.run(run())
+    assert batch_sizes == [2, 2, 1]
+
+
+def test_max_batch_one_calls_predictor_directly():
+    batch_sizes = []
+    scheduler = BatchScheduler(_recording_predictor(batch_sizes), max_batch=1)
+    result = asyncio.run(scheduler.submit(_sequence(7)))
+    assert batch_sizes == [1]
+    assert float(result[0, 0]) == 7.0
+
+
+def test_predictor_errors_reach_every_caller():
+    def failing(batch):
+        raise RuntimeError("boom")
+
+    scheduler = BatchScheduler(failing, max_batch=4, max_wait_ms=10)
+
+    async def run():
+        return await asyncio.gather(
+            scheduler.submit(_sequence(0)), scheduler.submit(_sequence(1)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_predictor_runs_off_event_loop_thread():
+    import threading
+
+    threads = []
+
+    def predict(batch):
+        threads.append(threading.current_thread())
+        return batch[:, 0, :3].copy()
+
+    async def run():
+        for max_batch in (1, 4):
+            await BatchScheduler(predict, max_batch=max_batch, max_wait_ms=1).submit(_sequence(0))
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 2
+    assert all(t is not loop_thread for t in threads)
@@ -0,0 +1,75 @@
+"""Tests for ml.buffer_manager."""
+
+import numpy as np
+
+from ml.buffer_manager import KEYPOINT_DIM, FrameBuffer
+
+
+def _frame(value: float) -> np.ndarray:
+    return np.full(KEYPOINT_DIM, value, dtype=np.float32)
+
+
+def test_sequence_is_none_until_full():
+    buf = FrameBuffer(buffer_size=3)
+    buf.append(_frame(0))
+    buf.append(_frame(1))
+    assert not buf.is_ready
+    assert buf.get_sequence() is None
+    assert buf.length == 2
+
+
+def test_sequence_keeps_last_frames_in_order_after_wrap():
+    buf = FrameBuffer(buffer_size=3)
+    for i in range(7):
+        buf.append(_frame(i))
+    seq = buf.get_sequence()
+    assert seq.shape == (1, 3, KEYPOINT_DIM)
+    assert seq.dtype == np.float32
+    assert seq[0, :, 0].tolist() == [4.0, 5.0, 6.0]
+
+
+def test_clear_resets_fill():
+    buf = FrameBuffer(buffer_size=2)
+    buf.append(_frame(1))
+    buf.append(_frame(2))
+    buf.clear()
+    assert buf.length == 0
+    assert buf.fill_ratio == 0.0
+
+
+def test_wrong_dim_is_ignored():
+    buf = FrameBuffer(buffer_size=2)
+    buf.append(np.zeros(10, dtype=np.float32))
+    assert buf.length == 0
+
+
+def test_storage_is_half_precision():
+    buf = FrameBuffer(buffer_size=2)
+    assert buf._ring.dtype == np.float16
+    buf.append(np.full(KEYPOINT_DIM, 0.123456, dtype=np.float64))
+    buf.append(_frame(0.5))
+    seq = buf.get_sequence()
+    assert seq.dtype == np.float32
+    assert abs(seq[0, 0, 0] - 0.123456) < 1e-3
+
+
+def test_buffers_evict_least_recently_used(monkeypatch):
+    from ml import buffer_manager
+
+    monkeypatch.setattr(buffer_manager, "MAX_BUFFERS", 2)
+    buffer_manager.delete_all_buffers()
+    first = buffer_manager.get_buffer("a")
+    buffer_manager.get_buffer("b")
+    assert buffer_manager.get_buffer("a") is first  # "a" is now most recent
+    buffer_manager.get_buffer("c")
+    assert set(buffer_manager._buffers) == {"a", "c"}
+    buffer_manager.delete_all_buffers()
+
+
+def test_clear_session_deletes_buffer():
+    from app import session_store
+    from ml import buffer_manager
+
+    buffer_manager.get_buffer("sess-buf")
+    session_store.clear_session("sess-buf")
+    assert "sess-buf" not in buffer_manager._buffers
@@ -212,6 +212,68 @@ class TestConfigurationManager:
         finally:
             os.unlink(temp_path)
     
+    def test_strict_mode_raises_on_invalid_config(self):
+        """Test strict construction fails fast on an invalid configuration."""
+        config_data = {"modules": {}, "prediction_strategy": "invalid_strategy"}
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            temp_path = f.name
+        
+        try:
+            with pytest.raises(ValueError):
+                ConfigurationManager(config_path=temp_path, strict=True)
+            
+            # Non-strict managers still load and report the errors
+            config_manager = ConfigurationManager(config_path=temp_path)
+            assert not config_manager.validate()[0]
+        finally:
+            os.unlink(temp_path)
+    
+    def test_validate_result_is_cached_until_invalidated(self):
+        """Test validate() is computed once and recomputed after _invalidate()."""
+        config_manager = ConfigurationManager(config_path="nonexistent.json")
+        
+        first = config_manager.validate()
+        assert config_manager.validate() is first
+        
+        config_manager.config.prediction_strategy = "invalid_strategy"
+        config_manager._invalidate()
+        is_valid, errors = config_manager.validate()
+        assert not is_valid
+        assert any("prediction_strategy" in error for error in errors)
+    
+    def test_module_lookups_follow_invalidate(self):
+        """Test flat enabled/threshold lookups are rebuilt by _invalidate()."""
+        config_manager = ConfigurationManager(config_path="nonexistent.json")
+        assert config_manager.is_module_enabled("detection")
+        
+        detection = config_manager.get_module_config("detection")
+        detection.enabled = False
+        detection.confidence_threshold = 0.9
+        config_manager._invalidate()
+        
+        assert not config_manager.is_module_enabled("detection")
+        assert config_manager.get_confidence_threshold("detection") == 0.9
+    
+    def test_instances_do_not_share_default_params(self):
+        """Test mutating one manager's module params leaves the defaults intact."""
+        first = ConfigurationManager(config_path="nonexistent.json")
+        first.get_module_config("detection").preprocessing_params["max_num_hands"] = 1
+        
+        second = ConfigurationManager(config_path="nonexistent.json")
+        assert second.get_module_config("detection").preprocessing_params["max_num_hands"] == 2
+        assert ConfigurationManager.DEFAULT_CONFIG["modules"]["detection"]["preprocessing_params"]["max_num_hands"] == 2
+    
+    def test_config_is_loaded_on_first_access(self, monkeypatch):
+        """Test the environment is not read until config is accessed."""
+        config_manager = ConfigurationManager(config_path="nonexistent.json")
+        assert config_manager._config is None
+        
+        monkeypatch.setenv("ISL_MODULE_CONFIG", json.dumps({"prediction_strategy": "voting"}))
+        assert config_manager.get_prediction_strategy() == "voting"
+        assert config_manager._config is config_manager.config
+    
     def test_get_health_status(self):
         """Test health status reporting."""
         config_manager = ConfigurationManager(config_path="nonexistent.json")
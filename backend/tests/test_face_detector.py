@@ -0,0 +1,100 @@
+"""Tests for ml.face_detector."""
+
+import numpy as np
+
+from ml import face_detector
+
+
+def test_session_results_are_reused_between_checks(monkeypatch):
+    calls = []
+
+    def fake_detector(frame):
+        calls.append(frame)
+        return True
+
+    monkeypatch.setattr(face_detector, "_run_detector", fake_detector)
+    monkeypatch.setattr(face_detector, "_face_cache", face_detector.OrderedDict())
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    for _ in range(face_detector.FACE_RECHECK_PRESENT + 1):
+        assert face_detector.detect_face(frame, "sess-face")
+    assert len(calls) == 2
+
+
+def test_absent_face_is_rechecked_sooner(monkeypatch):
+    calls = []
+
+    def fake_detector(frame):
+        calls.append(frame)
+        return False
+
+    monkeypatch.setattr(face_detector, "_run_detector", fake_detector)
+    monkeypatch.setattr(face_detector, "_face_cache", face_detector.OrderedDict())
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+    for _ in range(face_detector.FACE_RECHECK_ABSENT * 3):
+        assert not face_detector.detect_face(frame, "sess-noface")
+    assert len(calls) == 3
+
+
+def test_without_session_always_runs(monkeypatch):
+    calls = []
+    monkeypatch.setattr(face_detector, "_run_detector", lambda frame: calls.append(frame) or True)
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    face_detector.detect_face(frame)
+    face_detector.detect_face(frame)
+    assert len(calls) == 2
+
+
+def test_haar_path_downsamples_large_frames(monkeypatch):
+    seen = {}
+
+    class FakeCascade:
+        def detectMultiScale(self, gray, **kwargs):
+            seen["shape"] = gray.shape
+            seen["minSize"] = kwargs["minSize"]
+            return []
+
+    monkeypatch.setattr(face_detector, "_detector", FakeCascade())
+    monkeypatch.setattr(face_detector, "_is_yunet", False)
+    frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    assert not face_detector.detect_face(frame)
+    assert max(seen["shape"]) == face_detector.HAAR_MAX_EDGE
+    assert seen["minSize"] == (20, 20)
+
+
+def test_haar_path_scans_green_channel(monkeypatch):
+    seen = {}
+
+    class FakeCascade:
+        def detectMultiScale(self, gray, **kwargs):
+            seen["gray"] = gray
+            return [(0, 0, 10, 10)]
+
+    monkeypatch.setattr(face_detector, "_detector", FakeCascade())
+    monkeypatch.setattr(face_detector, "_is_yunet", False)
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    frame[:, :, 1] = 77
+
+    assert face_detector.detect_face(frame)
+    assert seen["gray"].ndim == 2
+    assert seen["gray"].flags["C_CONTIGUOUS"]
+    assert (seen["gray"] == 77).all()
+
+
+def test_haar_path_reuses_gray_buffer(monkeypatch):
+    seen = []
+
+    class FakeCascade:
+        def detectMultiScale(self, gray, **kwargs):
+            seen.append(gray)
+            return []
+
+    monkeypatch.setattr(face_detector, "_detector", FakeCascade())
+    monkeypatch.setattr(face_detector, "_is_yunet", False)
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    face_detector.detect_face(frame)
+    face_detector.detect_face(frame)
+    assert seen[0] is seen[1]
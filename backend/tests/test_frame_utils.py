@@ -0,0 +1,67 @@
+"""Tests for app.utils.frame_utils."""
+
+import pytest
+
+from app.utils.frame_utils import FrameDecodeError, decode_base64_frame
+from tests.conftest import make_fake_frame
+
+
+def test_decode_data_uri_and_raw_base64():
+    data_uri = make_fake_frame()
+    raw = data_uri.split(",", 1)[1]
+    assert decode_base64_frame(data_uri).shape == (200, 200, 3)
+    assert decode_base64_frame(raw).shape == (200, 200, 3)
+
+
+def test_decode_rejects_malformed_data_uri():
+    with pytest.raises(FrameDecodeError, match="Invalid data URI"):
+        decode_base64_frame("data:image/jpeg,abcd")
+
+
+def test_decode_rejects_empty_frame():
+    with pytest.raises(FrameDecodeError):
+        decode_base64_frame("")
+
+
+def _jpeg_data_uri(width: int, height: int) -> str:
+    import base64
+
+    import cv2
+    import numpy as np
+
+    img = np.full((height, width, 3), 128, dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", img)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer).decode("ascii")
+
+
+def test_large_jpeg_is_reduced_during_decode():
+    frame = decode_base64_frame(_jpeg_data_uri(1920, 1080), target_width=640)
+    # 1920 / 2 = 960 keeps the frame at or above the 640px target
+    assert frame.shape[1] == 960
+
+
+def test_small_jpeg_decodes_full_size():
+    frame = decode_base64_frame(_jpeg_data_uri(800, 600), target_width=640)
+    assert frame.shape[1] == 800
+
+
+def test_decode_accepts_bytes():
+    frame = decode_base64_frame(_jpeg_data_uri(320, 240).encode("ascii"))
+    assert frame.shape[:2] == (240, 320)
+
+
+def test_non_ascii_frame_raises():
+    with pytest.raises(FrameDecodeError):
+        decode_base64_frame("data:image/jpeg;base64,/9j/é")
+
+
+def test_validate_frame():
+    import numpy as np
+
+    from app.utils.frame_utils import validate_frame
+
+    assert validate_frame(np.zeros((120, 160, 3), dtype=np.uint8))
+    assert not validate_frame(None)
+    assert not validate_frame(np.zeros((120, 160), dtype=np.uint8))
+    assert not validate_frame(np.zeros((120, 160, 4), dtype=np.uint8))
+    assert not validate_frame(np.zeros((50, 160, 3), dtype=np.uint8))
@@ -5,6 +5,7 @@ Tests the execute_modules_parallel, select_final_prediction, and
 predict_from_raw_frame functions with multi-module support.
 """
 
+import asyncio
 import numpy as np
 import pytest
 from unittest.mock import Mock, patch, MagicMock
@@ -32,6 +33,7 @@ def mock_config_manager():
     }.get(module, 0.7)
     
     config_mgr.get_prediction_strategy.return_value = "priority"
+    config_mgr.config.definitive_confidence = 0.9
     
     config_mgr.get_module_config.side_effect = lambda module: ModuleConfig(
         enabled=True,
@@ -128,6 +130,58 @@ def test_select_final_prediction_voting_strategy(sample_predictions):
     assert selected.word == "A"
 
 
+def test_select_final_prediction_voting_tie_uses_confidence(sample_predictions):
+    """Test voting falls back to the most confident prediction on a vote tie."""
+    # "A" and "hello" have one vote each; "hello" is more confident
+    selected = select_final_prediction(sample_predictions, "voting")
+    
+    assert selected is not None
+    assert selected.word == "hello"
+    assert selected.confidence == 0.92
+
+
+def test_select_final_prediction_definitive_only_applies_to_priority(
+    sample_predictions, mock_config_manager
+):
+    """Test a confident priority-1 prediction short-circuits only "priority"."""
+    for word in ("A", "A"):
+        sample_predictions.append(
+            ModulePrediction(
+                module_name="translation",
+                class_index=0,
+                word=word,
+                display_name=word,
+                confidence=0.80,
+                preprocessing_time=0.020,
+                inference_time=0.010,
+                metadata={},
+                timestamp=time.time()
+            )
+        )
+    mock_config_manager.get_module_config.side_effect = lambda module: ModuleConfig(
+        enabled=True,
+        priority={"detection": 1, "recognition": 1, "translation": 3}.get(module, 999),
+        confidence_threshold=0.7,
+        model_path="",
+        preprocessing_params={}
+    )
+    
+    with patch('ml.inference._config_manager', mock_config_manager):
+        # Recognition (priority 1) at 0.92 clears the 0.9 definitive bar and
+        # wins over the earlier priority-1 detection prediction
+        selected = select_final_prediction(sample_predictions, "priority")
+        assert selected.module_name == "recognition"
+        
+        # Voting still follows the majority
+        selected = select_final_prediction(sample_predictions, "voting")
+        assert selected.word == "A"
+        
+        # Below the bar, the first priority-1 prediction wins as usual
+        sample_predictions[1].confidence = 0.89
+        selected = select_final_prediction(sample_predictions, "priority")
+        assert selected.module_name == "detection"
+
+
 def test_select_final_prediction_empty_list():
     """Test selection with empty predictions list."""
     selected = select_final_prediction([], "priority")
@@ -268,12 +322,12 @@ def test_predict_from_raw_frame_with_module_details(
     mock_select.return_value = sample_predictions[1]  # Recognition selected
     
     # Execute
-    word, confidence, status, results, module_details = predict_from_raw_frame(
+    word, confidence, status, results, module_details = asyncio.run(predict_from_raw_frame(
         "test_session",
         sample_frame,
         return_landmarks=False,
         return_module_details=True
-    )
+    ))
     
     # Verify
     assert word == "hello"
@@ -290,12 +344,12 @@ def test_predict_from_raw_frame_with_module_details(
 def test_predict_from_raw_frame_no_face(sample_frame):
     """Test predict_from_raw_frame returns no_face when no face detected."""
     with patch('ml.inference.detect_face', return_value=False):
-        word, confidence, status, results, module_details = predict_from_raw_frame(
+        word, confidence, status, results, module_details = asyncio.run(predict_from_raw_frame(
             "test_session",
             sample_frame,
             return_landmarks=False,
             return_module_details=False
-        )
+        ))
         
         assert word is None
         assert confidence == 0.0
@@ -314,12 +368,12 @@ def test_predict_from_raw_frame_low_confidence(
     mock_config.is_module_enabled.return_value = True
     mock_execute.return_value = []  # No predictions above threshold
     
-    word, confidence, status, results, module_details = predict_from_raw_frame(
+    word, confidence, status, results, module_details = asyncio.run(predict_from_raw_frame(
         "test_session",
         sample_frame,
         return_landmarks=False,
         return_module_details=True
-    )
+    ))
     
     assert word is None
     assert confidence == 0.0
@@ -330,12 +384,12 @@ def test_predict_from_raw_frame_low_confidence(
 @patch('ml.inference._isl_modules_initialized', False)
 @patch('ml.inference._config_manager')
 @patch('ml.inference._model_loaded', True)
-@patch('ml.inference._model')
+@patch('ml.inference._predict_fn')
 @patch('ml.inference.extract_keypoints')
 @patch('ml.inference.get_buffer')
 @patch('ml.inference.get_word_by_index')
 def test_predict_from_raw_frame_fallback_to_lstm(
-    mock_get_word, mock_get_buffer, mock_extract, mock_model,
+    mock_get_word, mock_get_buffer, mock_extract, mock_predict_fn,
     mock_config, mock_detect_face, sample_frame
 ):
     """Test predict_from_raw_frame falls back to LSTM when ISL modules unavailable."""
@@ -352,19 +406,155 @@ def test_predict_from_raw_frame_fallback_to_lstm(
     mock_buffer.get_sequence.return_value = np.zeros((1, 45, 258))
     mock_get_buffer.return_value = mock_buffer
     
-    # Mock model prediction
-    mock_model.predict.return_value = np.array([[0.1, 0.2, 0.95]])
+    # Mock model prediction (logits; softmax of the last class is 0.95)
+    mock_predict_fn.return_value = np.array([[0.0, 0.0, np.log(38.0)]])
     mock_get_word.return_value = "thank_you"
     
     # Execute
-    word, confidence, status, results, module_details = predict_from_raw_frame(
+    word, confidence, status, results, module_details = asyncio.run(predict_from_raw_frame(
         "test_session",
         sample_frame,
         return_landmarks=False,
         return_module_details=False
-    )
+    ))
     
     # Verify fallback to LSTM
     assert word == "thank_you"
-    assert confidence == 0.95
+    assert confidence == pytest.approx(0.95)
     assert status == "ready"
+
+
+def test_top1_matches_full_softmax():
+    """Test the top-1 probability equals the softmax of the winning logit."""
+    import ml.inference as inference
+    
+    logits = np.array([1.5, -0.3, 2.2, 0.4], dtype=np.float32)
+    probabilities = np.exp(logits) / np.exp(logits).sum()
+    
+    index, confidence = inference._top1(logits)
+    assert index == 2
+    assert confidence == pytest.approx(float(probabilities[2]), rel=1e-6)
+
+
+def test_compiled_predictor_matches_keras_predict():
+    """Test the XLA-compiled LSTM predictor agrees with Keras predict()."""
+    import ml.inference as inference
+    
+    model = inference.create_lstm_model(num_classes=3)
+    sequence = np.random.rand(1, 45, 258).astype(np.float32)
+    
+    with patch('ml.inference._model', model):
+        predict_fn = inference._build_predictor()
+    
+    np.testing.assert_allclose(
+        predict_fn(sequence), model.predict(sequence, verbose=0), atol=1e-5
+    )
+
+
+def test_mixed_precision_model_keeps_float32_head():
+    """Test the mixed-precision LSTM computes in float16 but outputs float32 logits."""
+    import ml.inference as inference
+    
+    model = inference.create_lstm_model(num_classes=3, mixed_precision=True)
+    output = model(np.random.rand(1, 45, 258).astype(np.float32))
+    
+    assert model.layers[0].compute_dtype == "float16"
+    assert model.layers[0].variable_dtype == "float32"
+    assert output.dtype == "float32"
+    assert output.shape == (1, 3)
+
+
+def test_compiled_predictor_pads_odd_batches():
+    """Test batches between compiled bucket sizes come back unpadded and correct."""
+    import ml.inference as inference
+    
+    model = inference.create_lstm_model(num_classes=3)
+    batch = np.random.rand(3, 45, 258).astype(np.float32)
+    
+    with patch('ml.inference._model', model):
+        predict_fn = inference._build_predictor()
+    
+    np.testing.assert_allclose(
+        predict_fn(batch), model.predict(batch, verbose=0), atol=1e-5
+    )
+
+
+def test_tflite_predictor_approximates_keras_predict():
+    """Test the INT8-quantized TFLite LSTM stays close to the FP32 model."""
+    import ml.inference as inference
+    
+    model = inference.create_lstm_model(num_classes=3)
+    sequence = np.random.rand(1, 45, 258).astype(np.float32)
+    
+    with patch('ml.inference._model', model), \
+         patch('ml.inference.settings.LSTM_BACKEND', 'tflite'):
+        predict_fn = inference._build_predictor()
+    
+    result = predict_fn(sequence)
+    assert result.shape == (1, 3)
+    np.testing.assert_allclose(
+        result, model.predict(sequence, verbose=0), atol=0.02
+    )
+
+
+@patch('ml.inference._detection_module')
+@patch('ml.inference._recognition_module')
+@patch('ml.inference._translation_module', None)
+@patch('ml.inference._config_manager')
+def test_execute_modules_parallel_uses_pool_when_enabled(
+    mock_config, mock_recognition, mock_detection, sample_frame, sample_predictions
+):
+    """Test modules run on worker threads when parallel execution is enabled."""
+    import threading
+    
+    mock_config.config.enable_parallel_execution = True
+    mock_config.get_confidence_threshold.return_value = 0.5
+    threads = []
+    
+    def record(prediction):
+        def predict(*args):
+            threads.append(threading.current_thread().name)
+            return prediction
+        return predict
+    
+    mock_detection.predict.side_effect = record(sample_predictions[0])
+    mock_recognition.predict.side_effect = record(sample_predictions[1])
+    
+    predictions = execute_modules_parallel(
+        sample_frame, "test_session", ["detection", "recognition"]
+    )
+    
+    assert [p.module_name for p in predictions] == ["detection", "recognition"]
+    assert all(name.startswith("isl-mod") for name in threads)
+
+
+def test_runtime_tables_resolved_once_per_config_manager(mock_config_manager):
+    """Test per-frame config is read from the manager once, then reused."""
+    import ml.inference as inference
+    
+    mock_config_manager.is_module_enabled.side_effect = lambda m: m != "translation"
+    
+    with patch('ml.inference._config_manager', mock_config_manager):
+        first = inference._runtime_tables()
+        second = inference._runtime_tables()
+    
+    assert first is second
+    assert first.enabled == ("detection", "recognition")
+    assert first.priorities == {"detection": 2, "recognition": 1, "translation": 3}
+    assert first.strategy == "priority"
+    assert mock_config_manager.get_prediction_strategy.call_count == 1
+    
+    # A different manager (e.g. after a config reload) rebuilds the tables
+    with patch('ml.inference._config_manager', Mock(spec=ConfigurationManager)):
+        assert inference._runtime_tables() is not first
+
+
+def test_frame_stage_runs_off_event_loop_thread():
+    """Test the MediaPipe stage runs on the frame-stage worker, not the loop."""
+    import threading
+    import ml.inference as inference
+
+    async def run():
+        return await inference.run_in_frame_stage(lambda: threading.current_thread().name)
+
+    assert asyncio.run(run()).startswith("frame-stage")
@@ -138,7 +138,7 @@ def test_api_route_supports_module_details(client):
     assert response.status_code == 200
     data = response.json()
     assert "word" in data
-    assert "confidence" in data
+    assert "confidence_bp" in data
     assert "buffer_status" in data
     # module_details should be None when not requested
     assert data.get("module_details") is None
@@ -224,9 +224,9 @@ def test_complete_end_to_end_flow_with_all_modules_enabled(client):
     
     # Verify response structure
     assert "word" in frame_data
-    assert "confidence" in frame_data
+    assert "confidence_bp" in frame_data
     assert "buffer_status" in frame_data
-    assert "history" in frame_data
+    assert "history_version" in frame_data
     assert "module_details" in frame_data
     
     # Step 4: Verify vocabulary mappings work
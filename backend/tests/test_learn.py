@@ -14,9 +14,24 @@ def test_learn_attempt_valid(client):
     data = response.json()
     assert "predicted" in data
     assert "correct" in data
-    assert "proficiency" in data
+    assert "proficiency_bp" in data
     assert "fault" in data
-    assert "confidence" in data
+    assert "confidence_bp" in data
+
+
+def test_learn_attempt_fault_is_code(client):
+    """fault is a FaultCode integer; the client renders the text."""
+    from app.schemas import FaultCode
+
+    response = client.post("/api/learn/attempt", json={
+        "sessionId": "learn-test-fault",
+        "targetWord": "hello",
+        "frame": make_fake_frame(),
+    })
+    assert response.status_code == 200
+    fault = response.json()["fault"]
+    assert type(fault) is int
+    assert fault in set(FaultCode)
 
 
 def test_learn_attempt_invalid_word(client):
@@ -115,6 +115,42 @@ class TestModelLoaderUnit:
         assert result is None
         assert "yolo" not in model_loader.models
     
+    @staticmethod
+    def _fake_cv2(cuda_devices, failing_targets=()):
+        """Mock cv2 whose DNN net fails forward() on the given targets."""
+        cv2 = MagicMock()
+        cv2.error = RuntimeError
+        cv2.cuda.getCudaEnabledDeviceCount.return_value = cuda_devices
+        cv2.dnn.DNN_TARGET_CUDA_FP16 = "fp16"
+        cv2.dnn.DNN_TARGET_CUDA = "cuda"
+        cv2.dnn.DNN_TARGET_CPU = "cpu"
+        net = cv2.dnn.readNetFromDarknet.return_value
+        
+        def forward(*args):
+            if net.setPreferableTarget.call_args[0][0] in failing_targets:
+                raise RuntimeError("target unsupported")
+        net.forward.side_effect = forward
+        return cv2, net
+    
+    @patch('os.path.exists', return_value=True)
+    def test_load_yolo_detector_without_cuda_device_uses_cpu(self, mock_exists, model_loader):
+        """Test YOLO never selects a CUDA target when OpenCV sees no device."""
+        cv2, net = self._fake_cv2(cuda_devices=0)
+        with patch('backend.ml.model_loader._import_cv2', return_value=cv2):
+            assert model_loader.load_yolo_detector() is net
+        
+        assert model_loader.model_info["yolo"]["target"] == "cpu"
+        net.setPreferableTarget.assert_called_once_with("cpu")
+    
+    @patch('os.path.exists', return_value=True)
+    def test_load_yolo_detector_probes_cuda_targets(self, mock_exists, model_loader):
+        """Test a CUDA target that fails its probe forward() is skipped."""
+        cv2, net = self._fake_cv2(cuda_devices=1, failing_targets=("fp16",))
+        with patch('backend.ml.model_loader._import_cv2', return_value=cv2):
+            assert model_loader.load_yolo_detector() is net
+        
+        assert model_loader.model_info["yolo"]["target"] == "cuda"
+    
     def test_validate_model_with_none_output(self, model_loader):
         """Test validate_model returns False when model output is None."""
         mock_model = Mock()
@@ -125,6 +161,44 @@ class TestModelLoaderUnit:
         
         assert result is False
     
+    def test_validate_model_prefers_infer_fn(self, model_loader):
+        """Test validate_model runs the compiled infer fn instead of predict."""
+        mock_model = Mock()
+        output = np.full((1, 35), 1 / 35)
+        infer_fn = Mock(return_value=output)
+        test_input = np.random.randn(1, 42)
+        
+        result = model_loader.validate_model(
+            mock_model, test_input, expected_shape=(1, 35), infer_fn=infer_fn
+        )
+        
+        assert result is True
+        infer_fn.assert_called_once_with(test_input)
+        mock_model.predict.assert_not_called()
+    
+    def test_declared_shapes_checked_without_inference(self, model_loader):
+        """Test a declared shape mismatch is caught without running the model."""
+        mock_model = Mock(input_shape=(None, 42), output_shape=(None, 10))
+        
+        assert not model_loader._declared_shapes_match(mock_model, (1, 42), (1, 35))
+        assert model_loader._declared_shapes_match(mock_model, (1, 42), (1, 10))
+        mock_model.predict.assert_not_called()
+    
+    def test_load_translation_model_prefers_onnx_export(self, tmp_path):
+        """Test an ONNX export next to the SavedModel is used instead of TF."""
+        translation_dir = tmp_path / "translation"
+        translation_dir.mkdir()
+        (translation_dir / "squeezenet_model.onnx").write_bytes(b"")
+        onnx_model = Mock(return_value=np.full((1, 10), 0.1))
+        loader = ModelLoader(base_path=str(tmp_path))
+        
+        with patch.object(ModelLoader, "_load_onnx_model", return_value=onnx_model):
+            model = loader.load_translation_model()
+        
+        assert model is onnx_model
+        assert loader.get_infer_fn("translation") is onnx_model
+        assert loader.get_model_info("translation")["runtime"] == "onnxruntime"
+    
     def test_validate_model_with_wrong_shape(self, model_loader):
         """Test validate_model returns False when output shape is wrong."""
         mock_model = Mock()
@@ -212,6 +286,43 @@ class TestModelLoaderUnit:
         assert status["models_loaded"] == ["detection"]
         assert status["total_models"] == 1
         assert status["gpu_available"] is False
+    
+    def test_predict_batch_uses_compiled_inference(self, model_loader):
+        """Test the compiled infer fn matches predict for any batch size."""
+        import tensorflow as tf
+        
+        model = tf.keras.Sequential([
+            tf.keras.Input(shape=(42,)),
+            tf.keras.layers.Dense(35, activation="softmax"),
+        ])
+        model_loader.models["detection"] = model
+        model_loader._compile_infer_fn("detection", model, np.zeros((1, 42), np.float32))
+        assert model_loader.get_infer_fn("detection") is not None
+        
+        batch = np.random.randn(5, 42).astype(np.float32)
+        np.testing.assert_allclose(
+            model_loader.predict_batch("detection", batch),
+            model.predict(batch, verbose=0),
+            atol=1e-5,
+        )
+    
+    def test_tflite_backend_matches_keras(self):
+        """Test the INT8-weight TFLite infer fn stays close to Keras output."""
+        import tensorflow as tf
+        
+        model = tf.keras.Sequential([
+            tf.keras.Input(shape=(42,)),
+            tf.keras.layers.Dense(64, activation="relu"),
+            tf.keras.layers.Dense(35, activation="softmax"),
+        ])
+        loader = ModelLoader(backend="tflite")
+        loader.models["detection"] = model
+        loader._compile_infer_fn("detection", model, np.zeros((1, 42), np.float32))
+        
+        batch = np.random.randn(3, 42).astype(np.float32)
+        result = loader.predict_batch("detection", batch)
+        assert result.shape == (3, 35)
+        np.testing.assert_allclose(result, model.predict(batch, verbose=0), atol=0.02)
 
 
 class TestModelLoaderIntegration:
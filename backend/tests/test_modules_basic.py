@@ -10,7 +10,7 @@ import pytest
 from unittest.mock import Mock, MagicMock
 import time
 
-from ml.modules import ModulePrediction
+from ml.modules import ModulePrediction, rgb_frame
 from ml.modules.detection import DetectionModule
 from ml.modules.recognition import RecognitionModule
 from ml.modules.translation import TranslationModule
@@ -74,6 +74,21 @@ class TestDetectionModuleBasic:
         assert max(indices) == 34
         assert len(set(indices)) == 35  # All unique
 
+    @pytest.mark.parametrize("kernel", ["_normalize_loops", "_normalize_numpy"])
+    def test_landmark_kernel_normalizes_in_place(self, kernel):
+        """Both kernels make landmarks wrist-relative and max-abs scaled."""
+        from ml import _landmark_kernels
+        normalize = getattr(_landmark_kernels, kernel)
+
+        landmarks = np.random.rand(42).astype(np.float32)
+        points = landmarks.reshape(-1, 2) - landmarks[:2]
+        expected = (points / np.abs(points).max()).ravel()
+
+        out = normalize(landmarks)
+        assert out is landmarks
+        np.testing.assert_allclose(out, expected, atol=1e-6)
+        assert not normalize(np.zeros(42, dtype=np.float32)).any()
+
 
 class TestRecognitionModuleBasic:
     """Basic tests for Recognition Module without model."""
@@ -261,3 +276,29 @@ class TestModuleIndependence:
         assert len(detection_words) == 35
         assert len(recognition_words) == 3
         assert len(translation_words) == 10
+
+
+class TestSharedFrameCache:
+    """Test the per-frame cache modules share for common transforms."""
+    
+    def test_rgb_frame_converts_once_per_cache(self):
+        """The RGB conversion is computed once and reused from the cache."""
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        frame[..., 0] = 255  # Blue in BGR
+        frame_cache = {}
+        
+        first = rgb_frame(frame, frame_cache)
+        second = rgb_frame(frame, frame_cache)
+        
+        assert first is second
+        assert (first[..., 2] == 255).all()
+    
+    def test_rgb_frame_without_cache(self):
+        """Without a cache each call converts into the thread's scratch buffer."""
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        first = rgb_frame(frame)
+        frame[..., 0] = 255  # Blue in BGR
+        second = rgb_frame(frame)
+        
+        assert first is second  # Same scratch buffer, no new allocation
+        assert (second[..., 2] == 255).all()
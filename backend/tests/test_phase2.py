@@ -4,6 +4,8 @@ Tests for Phase 2 — Profile, Text-to-Sign, Sign Demos, AR Landmarks
 
 import pytest
 
+from app.dependencies import get_current_user
+
 
 # ─── Profile Tests ────────────────────────────────────────────────
 
@@ -23,8 +25,7 @@ class TestProfile:
         assert data["name"] == "Ravi Kumar"
         assert data["email"] == "ravi@example.com"
         assert data["preferred_language"] == "en"
-        assert "Welcome" in data["welcome_message"]
-        assert "Ravi Kumar" in data["welcome_message"]
+        assert data["welcome_key"] == "welcome"
         assert len(data["welcome_sign_data"]) > 0
 
     def test_create_profile_hindi(self, client):
@@ -37,7 +38,29 @@ class TestProfile:
         })
         assert response.status_code == 200
         data = response.json()
-        assert "स्वागत" in data["welcome_message"]
+        assert data["preferred_language"] == "hi"
+        assert data["welcome_key"] == "welcome"
+
+    def test_create_profile_authenticated_welcome_key(self, client):
+        """Profile response carries the welcome key, not formatted text."""
+        session_id = "test-profile-auth"
+        client.app.dependency_overrides[get_current_user] = lambda: {"user_id": session_id}
+        try:
+            for lang in ("en", "hi"):
+                response = client.post("/api/profile", json={
+                    "sessionId": session_id,
+                    "name": "Ravi Kumar",
+                    "email": "ravi@example.com",
+                    "preferred_language": lang,
+                })
+                assert response.status_code == 200
+                data = response.json()
+                assert data["preferred_language"] == lang
+                assert data["welcome_key"] == "welcome"
+                assert "welcome_message" not in data
+                assert len(data["welcome_sign_data"]) > 0
+        finally:
+            client.app.dependency_overrides.pop(get_current_user, None)
 
     def test_get_profile(self, client):
         """Create then retrieve a profile."""
@@ -208,3 +231,30 @@ class TestARLandmarks:
             "frame": "not-valid-base64!!!",
         })
         assert response.status_code == 400
+
+    def test_ar_full_extraction_runs_in_frame_stage(self, monkeypatch):
+        """Pose/hands extraction runs on the frame-stage worker, not the loop."""
+        import asyncio
+        import threading
+        import numpy as np
+        from app.routes import ar
+
+        threads = []
+
+        class FakeGraph:
+            def process(self, frame_rgb):
+                threads.append(threading.current_thread().name)
+
+                class Results:
+                    pose_landmarks = None
+                    multi_hand_landmarks = None
+                return Results()
+
+        monkeypatch.setattr(ar, "_pose", FakeGraph())
+        monkeypatch.setattr(ar, "_hands", FakeGraph())
+        monkeypatch.setattr(ar, "detect_face", lambda frame: True)
+
+        result = asyncio.run(ar._extract_landmarks_full(np.zeros((48, 64, 3), dtype=np.uint8)))
+        assert result["face_detected"]
+        assert len(threads) == 2
+        assert all(name.startswith("frame-stage") for name in threads)
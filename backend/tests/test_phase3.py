@@ -3,6 +3,7 @@ Tests for Phase 3 — Learning & Gamified Dashboard
 """
 
 import pytest
+from app.dependencies import get_current_user
 from app.session_store import get_session, ACHIEVEMENT_DEFINITIONS
 
 
@@ -122,3 +123,31 @@ class TestPhase3:
         assert "recent_activity" in data
         assert "suggested_next_words" in data
         assert data["total_achievements"] == 12
+
+    def test_dashboard_cache_invalidated_on_xp(self, client):
+        """Cached dashboard is rebuilt after an XP write."""
+        session_id = "test-dash-cache"
+        client.app.dependency_overrides[get_current_user] = lambda: {"user_id": session_id}
+        try:
+            first = client.get(f"/api/dashboard/{session_id}").json()
+            assert client.get(f"/api/dashboard/{session_id}").json() == first
+
+            get_session(session_id).award_xp(50, "test")
+            data = client.get(f"/api/dashboard/{session_id}").json()
+            assert data["xp_info"]["current_xp"] == first["xp_info"]["current_xp"] + 50
+        finally:
+            client.app.dependency_overrides.pop(get_current_user, None)
+
+    def test_dashboard_cache_is_bounded(self, client, monkeypatch):
+        """The least recently served dashboard is evicted past the bound."""
+        from app import session_store
+
+        monkeypatch.setattr(session_store, "MAX_CACHED_DASHBOARDS", 2)
+        session_store.dashboard_cache.clear()
+        client.app.dependency_overrides[get_current_user] = lambda: {"user_id": "test-dash"}
+        try:
+            for session_id in ("test-dash-lru-1", "test-dash-lru-2", "test-dash-lru-3"):
+                assert client.get(f"/api/dashboard/{session_id}").status_code == 200
+            assert list(session_store.dashboard_cache) == ["test-dash-lru-2", "test-dash-lru-3"]
+        finally:
+            client.app.dependency_overrides.pop(get_current_user, None)
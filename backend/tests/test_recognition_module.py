@@ -151,3 +151,65 @@ class TestRecognitionModule:
             
             display = get_display_name(word, "recognition")
             assert display in ["Hello", "How Are You", "Thank You"]
+
+
+def test_fill_keypoints_layout():
+    """Landmarks land at their fixed offsets; missing parts stay zero."""
+    from types import SimpleNamespace
+    from ml.keypoint_extractor import _fill_keypoints
+
+    pose = [SimpleNamespace(x=i, y=i + 0.25, z=i + 0.5, visibility=0.75) for i in range(33)]
+    right = [SimpleNamespace(x=i, y=-i, z=2 * i) for i in range(21)]
+
+    keypoints = _fill_keypoints(pose, None, right)
+
+    assert keypoints.dtype == np.float32
+    assert keypoints.shape == (258,)
+    np.testing.assert_allclose(keypoints[4:8], [1, 1.25, 1.5, 0.75])
+    assert not keypoints[132:195].any()
+    np.testing.assert_allclose(keypoints[195 + 3:195 + 6], [1, -1, 2])
+
+
+def test_tasks_rgb_matches_cvtcolor():
+    """Whichever strategy the probe picks, Mediapipe sees RGB channel order."""
+    import cv2
+    mp = pytest.importorskip("mediapipe")
+    from ml import keypoint_extractor
+
+    frame = np.random.randint(0, 256, (6, 8, 3), dtype=np.uint8)
+    image = mp.Image(image_format=mp.ImageFormat.SRGB, data=keypoint_extractor._tasks_rgb(frame))
+
+    assert keypoint_extractor._cvt_strategy in ("view", "convert")
+    np.testing.assert_array_equal(image.numpy_view(), cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+
+def test_holistic_graphs_are_per_session(monkeypatch):
+    """Each session tracks on its own legacy Holistic graph."""
+    import types
+    from ml import keypoint_extractor
+
+    class FakeHolistic:
+        closed = False
+
+        def __init__(self, **kwargs):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    solution = types.SimpleNamespace(Holistic=FakeHolistic)
+    monkeypatch.setattr(keypoint_extractor, "_holistics", keypoint_extractor.OrderedDict())
+    monkeypatch.setattr(keypoint_extractor.settings, "MAX_HOLISTIC_SESSIONS", 2)
+
+    first = keypoint_extractor._session_holistic(solution, "hol-a")
+    assert keypoint_extractor._session_holistic(solution, "hol-a") is first
+    second = keypoint_extractor._session_holistic(solution, "hol-b")
+    assert second is not first
+
+    # Past the cap the least recently used session's graph is closed
+    keypoint_extractor._session_holistic(solution, "hol-c")
+    assert first.closed and "hol-a" not in keypoint_extractor._holistics
+
+    keypoint_extractor.close_session("hol-b")
+    assert second.closed
+    assert list(keypoint_extractor._holistics) == ["hol-c"]
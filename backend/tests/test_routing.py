@@ -0,0 +1,36 @@
+"""Tests for the orjson-backed APIRoute in app.routing."""
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.routing import ORJSONRoute
+
+
+class _Body(BaseModel):
+    name: str
+
+
+def _make_client() -> TestClient:
+    router = APIRouter(route_class=ORJSONRoute)
+
+    @router.post("/echo")
+    async def echo(body: _Body):
+        return {"name": body.name}
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_orjson_route_parses_body():
+    response = _make_client().post("/echo", json={"name": "नमस्ते"})
+    assert response.status_code == 200
+    assert response.json() == {"name": "नमस्ते"}
+
+
+def test_orjson_route_invalid_json_is_422():
+    response = _make_client().post(
+        "/echo", content=b"{not json", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 422
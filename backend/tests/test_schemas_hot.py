@@ -0,0 +1,49 @@
+"""Tests for the hot-path request decoders in app._schemas_hot."""
+
+import pytest
+
+from app._schemas_hot import (
+    HotDecodeError,
+    decode_game_attempt,
+    decode_learn_attempt,
+    decode_recognize_frame,
+)
+
+
+def test_decode_recognize_frame():
+    req = decode_recognize_frame(b'{"sessionId": "s1", "frame": "abc"}')
+    assert req.sessionId == "s1"
+    assert req.frame == "abc"
+
+
+def test_decode_learn_and_game_attempt():
+    learn = decode_learn_attempt(b'{"sessionId": "s1", "targetWord": "hello", "frame": "abc"}')
+    assert learn.targetWord == "hello"
+    game = decode_game_attempt(b'{"sessionId": "s1", "gameId": "g1", "frame": "abc"}')
+    assert game.gameId == "g1"
+
+
+@pytest.mark.parametrize("raw", [
+    b'{"sessionId": "s1"}',
+    b'{"sessionId": 5, "frame": "abc"}',
+    b'["sessionId", "frame"]',
+    b'not json',
+])
+def test_decode_rejects_malformed_bodies(raw):
+    with pytest.raises(HotDecodeError) as exc_info:
+        decode_recognize_frame(raw)
+    (error,) = exc_info.value.errors()
+    assert {"type", "loc", "msg", "input"} <= error.keys()
+    assert error["loc"][0] == "body"
+
+
+def test_ids_are_interned():
+    a = decode_recognize_frame(b'{"sessionId": "intern-me-1", "frame": "abc"}')
+    b = decode_recognize_frame(b'{"sessionId": "intern-me-1", "frame": "abc"}')
+    assert a.sessionId is b.sessionId
+
+
+def test_structs_are_frozen():
+    req = decode_recognize_frame(b'{"sessionId": "s1", "frame": "abc"}')
+    with pytest.raises(AttributeError):
+        req.sessionId = "other"
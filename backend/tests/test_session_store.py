@@ -0,0 +1,192 @@
+"""Tests for session_store internals (auth helpers, session bookkeeping)."""
+
+from app import session_store
+from app.session_store import get_legacy_pwd_context, hash_password, verify_password
+
+
+def test_hash_password_uses_bcrypt():
+    hashed = hash_password("secret123")
+    assert hashed.startswith("$2")
+    assert verify_password("secret123", hashed)
+    assert not verify_password("wrong-pass", hashed)
+
+
+def test_verify_password_accepts_legacy_sha256_crypt():
+    legacy = get_legacy_pwd_context().hash("secret123")
+    assert verify_password("secret123", legacy)
+    assert not verify_password("wrong-pass", legacy)
+
+
+def test_verify_cache_does_not_hold_plaintext():
+    hashed = hash_password("cache-me")
+    assert verify_password("cache-me", hashed)
+    for fingerprint, cached_hash in session_store._verified:
+        assert b"cache-me" not in fingerprint
+    assert any(cached_hash == hashed for _, cached_hash in session_store._verified)
+
+
+def test_save_users_is_debounced_and_atomic(tmp_path, monkeypatch):
+    import orjson
+
+    db_path = tmp_path / "users_db.json"
+    monkeypatch.setattr(session_store, "USERS_DB_PATH", str(db_path))
+    monkeypatch.setitem(session_store.USERS, "+910000000000", {"user_id": "abc"})
+
+    session_store.save_users()
+    session_store.save_users()  # coalesced into the pending write
+    assert session_store._save_timer is not None
+
+    session_store._flush_users()
+    assert session_store._save_timer is None
+    assert orjson.loads(db_path.read_bytes())["+910000000000"] == {"user_id": "abc"}
+    assert not (tmp_path / "users_db.json.tmp").exists()
+
+
+def test_load_users_round_trip(tmp_path, monkeypatch):
+    db_path = tmp_path / "users_db.json"
+    db_path.write_bytes(b'{"+911111111111": {"user_id": "xyz", "name": "Asha"}}')
+    monkeypatch.setattr(session_store, "USERS_DB_PATH", str(db_path))
+    monkeypatch.setattr(session_store, "USERS", {})
+
+    session_store.load_users()
+    assert session_store.USERS["+911111111111"]["name"] == "Asha"
+
+
+def test_level_up_uses_thresholds():
+    session = session_store.UserSession("level-test")
+    session.award_xp(99, "test")
+    assert session.level == 1
+    session.award_xp(1, "test")
+    assert session.level == 2
+    session.award_xp(10_000, "test")
+    assert session.level == len(session_store.USER_LEVEL_THRESHOLDS)
+
+
+def test_activity_history_is_capped():
+    session = session_store.UserSession("activity-cap")
+    for i in range(session_store.ACTIVITY_HISTORY_SIZE + 10):
+        session.add_activity("custom_event", {"i": i})
+    assert len(session.activity_history) == session_store.ACTIVITY_HISTORY_SIZE
+    assert session.activity_history[-1]["data"]["i"] == session_store.ACTIVITY_HISTORY_SIZE + 9
+
+
+def test_learn_total_correct_tracks_word_stats():
+    session = session_store.UserSession("total-correct")
+    session.learn.record_attempt("hello", "hello", 0.9, session)
+    session.learn.record_attempt("hello", "thanks", 0.4, session)
+    session.learn.record_attempt("thanks", "thanks", 0.8, session)
+    expected = sum(s["correct"] for s in session.learn.word_stats.values())
+    assert session.learn.total_correct == expected == 2
+
+
+def test_learn_overall_proficiency_tracks_word_stats():
+    session = session_store.UserSession("proficiency-sum")
+    for target, predicted in [("hello", "hello"), ("hello", None), ("thanks", "thanks"), ("hello", "hello")]:
+        session.learn.record_attempt(target, predicted, 0.8, session)
+    stats = session.learn.word_stats.values()
+    expected = round(sum(s["proficiency"] for s in stats) / len(stats), 1)
+    assert session.learn.get_overall_proficiency() == expected
+
+
+def test_check_achievements_short_circuits_when_all_unlocked():
+    session = session_store.UserSession("all-unlocked")
+    session.unlocked_achievements = set(session_store._CHECKED_ACHIEVEMENT_IDS)
+    before = len(session.activity_history)
+    session.check_achievements("level", {"level": 10})
+    assert len(session.activity_history) == before
+
+
+def test_level_trigger_unlocks_level_achievements():
+    session = session_store.UserSession("level-ach")
+    session.check_achievements("level", {"level": 7})
+    assert {"rising_star", "isl_champion"} <= session.unlocked_achievements
+    assert "grandmaster" not in session.unlocked_achievements
+
+
+def test_get_session_creates_once():
+    session_store.clear_all_sessions()
+    first = session_store.get_session("sess-missing")
+    assert session_store.session_exists("sess-missing")
+    assert session_store.get_session("sess-missing") is first
+    assert session_store.get_active_session_count() == 1
+    session_store.clear_all_sessions()
+
+
+def test_community_feed_stays_newest_first():
+    older = {"id": "t_old", "timestamp": 1.0, "likes": 0, "comments": []}
+    newer = {"id": "t_new", "timestamp": 9e12, "likes": 0, "comments": []}
+    session_store.add_community_post(older)
+    session_store.add_community_post(newer)
+    try:
+        feed = session_store.get_community_feed()
+        timestamps = [p["timestamp"] for p in feed]
+        assert timestamps == sorted(timestamps, reverse=True)
+        assert feed[0] is newer and feed[-1] is older
+    finally:
+        _remove_posts(older, newer)
+
+
+def test_community_feed_ties_keep_insertion_order():
+    posts = [{"id": f"t_tie_{i}", "timestamp": 5e12, "likes": 0, "comments": []} for i in range(5)]
+    for post in posts:
+        session_store.add_community_post(post)
+    try:
+        feed = session_store.get_community_feed()
+        assert [p["id"] for p in feed[:5]] == [p["id"] for p in posts]
+    finally:
+        _remove_posts(*posts)
+
+
+def _remove_posts(*posts):
+    for post in posts:
+        session_store.COMMUNITY_POSTS.remove(post)
+    session_store._POSTS_BY_TS[:] = [
+        entry for entry in session_store._POSTS_BY_TS if all(entry[2] is not p for p in posts)
+    ]
+
+
+def test_clear_session_closes_landmarker(monkeypatch):
+    from ml import keypoint_extractor
+
+    class FakeLandmarker:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(keypoint_extractor, "_create_landmarker", FakeLandmarker)
+    landmarker, first_ts = keypoint_extractor._session_landmarker("lm-session")
+    same, next_ts = keypoint_extractor._session_landmarker("lm-session")
+    assert same is landmarker
+    assert next_ts > first_ts
+
+    session_store.clear_session("lm-session")
+    assert landmarker.closed
+    assert "lm-session" not in keypoint_extractor._landmarkers
+
+
+def test_clear_session_drops_cached_dashboard():
+    session_store.dashboard_cache["dash-a"] = (0, b"{}")
+    session_store.dashboard_cache["dash-b"] = (0, b"{}")
+
+    session_store.clear_session("dash-a")
+    assert "dash-a" not in session_store.dashboard_cache
+    assert "dash-b" in session_store.dashboard_cache
+    session_store.clear_all_sessions()
+    assert not session_store.dashboard_cache
+
+
+def test_clear_session_forgets_face_result(monkeypatch):
+    import numpy as np
+    from ml import face_detector
+
+    monkeypatch.setattr(face_detector, "_run_detector", lambda frame: True)
+    monkeypatch.setattr(face_detector, "_face_cache", face_detector.OrderedDict())
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    face_detector.detect_face(frame, "face-a")
+    face_detector.detect_face(frame, "face-b")
+
+    session_store.clear_session("face-a")
+    assert list(face_detector._face_cache) == ["face-b"]
+    session_store.clear_all_sessions()
+    assert not face_detector._face_cache
@@ -12,10 +12,12 @@ def test_recognize_frame_valid(client):
     assert response.status_code == 200
     data = response.json()
     assert "word" in data
-    assert "confidence" in data
+    assert "confidence_bp" in data
     assert "buffer_status" in data
-    assert "history" in data
-    assert isinstance(data["confidence"], (int, float))
+    assert "history_version" in data
+    assert "history" not in data
+    assert isinstance(data["confidence_bp"], int)
+    assert 0 <= data["confidence_bp"] <= 10000
 
 
 def test_recognize_frame_missing_session_id(client):
@@ -42,6 +44,10 @@ def test_recognize_frame_missing_fields(client):
         "sessionId": "test-session-3",
     })
     assert response.status_code == 422
+    # Same error shape as the Pydantic-validated routes
+    detail = response.json()["detail"]
+    assert detail[0]["type"] == "missing"
+    assert detail[0]["loc"] == ["body", "frame"]
 
 
 def test_translate_history_builds_up(client):
@@ -54,7 +60,12 @@ def test_translate_history_builds_up(client):
         assert response.status_code == 200
     
     data = response.json()
-    assert isinstance(data["history"], list)
+    assert isinstance(data["history_version"], int)
+
+    history = client.get("/api/recognize-frame/history/history-test")
+    assert history.status_code == 200
+    assert isinstance(history.json()["history"], list)
+    assert history.json()["history_version"] == data["history_version"]
 
 
 def test_recognize_frame_without_module_details(client):
@@ -145,7 +145,7 @@ export default function DictionaryPage() {
                 
                 attempts.push({
                     predicted: result.word,
-                    confidence: result.confidence,
+                    confidence: result.confidence_bp / 10000,
                     correct: result.word?.toLowerCase() === word.toLowerCase()
                 });
 
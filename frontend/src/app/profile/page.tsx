@@ -33,6 +33,7 @@ import {
 } from 'recharts';
 import { toast } from 'sonner';
 import { api } from '../utils/api';
+import { welcomeMessage } from '../utils/messages';
 
 interface Achievement {
     id: string;
@@ -112,8 +113,8 @@ export default function ProfilePage() {
         e.preventDefault();
         try {
             setIsSaving(true);
-            await api.updateProfile(formData.name, formData.email, formData.phone);
-            toast.success('Persona updated successfully!');
+            const saved = await api.updateProfile(formData.name, formData.email, formData.phone);
+            toast.success(welcomeMessage(saved.welcome_key, saved.name, saved.preferred_language));
             setIsEditModalOpen(false);
             await fetchData(); // Refresh data
         } catch (error) {
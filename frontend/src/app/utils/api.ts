@@ -3,6 +3,8 @@
  * Handles communication with the FastAPI backend.
  */
 
+import { faultMessage, type Language } from './messages';
+
 const API_BASE_URL = 'http://127.0.0.1:8001/api';
 
 class ApiService {
@@ -101,6 +103,17 @@ class ApiService {
         return this.post('/recognize-frame', { sessionId: this.sessionId, frame });
     }
 
+    // fault comes back as a FaultCode; feedback is its text in the given language
+    async learnAttempt(targetWord: string, frame: string, lang: Language = 'en') {
+        const result = await this.post('/learn/attempt', { sessionId: this.sessionId, targetWord, frame });
+        return { ...result, feedback: faultMessage(result.fault, lang) };
+    }
+
+    // Call when recognizeFrame's history_version changes
+    async getTranslateHistory() {
+        return this.get(`/recognize-frame/history/${this.sessionId}`);
+    }
+
     async getARLandmarks(frame: string) {
         return this.post('/ar/landmarks', { sessionId: this.sessionId, frame });
     }
@@ -0,0 +1,59 @@
+/**
+ * SignVista Message Tables
+ * The backend sends numeric fault codes and message keys; the text lives here.
+ */
+
+export type Language = 'en' | 'hi';
+
+// Must match FaultCode in backend/app/schemas.py
+export enum FaultCode {
+    GOOD = 0,
+    EXCELLENT = 1,
+    IMPRECISE = 2,
+    LOW_CONFIDENCE = 3,
+    NOT_RECOGNIZED = 4,
+    CLOSE = 5,
+    INCORRECT = 6,
+    BUFFERING = 7,
+}
+
+const FAULT_MESSAGES: Record<Language, Record<FaultCode, string>> = {
+    en: {
+        [FaultCode.GOOD]: 'Good form! Keep it up! 👍',
+        [FaultCode.EXCELLENT]: 'Excellent form! Perfect sign! 🌟',
+        [FaultCode.IMPRECISE]: 'Correct! Try to be more precise with hand positioning.',
+        [FaultCode.LOW_CONFIDENCE]: 'Correct, but confidence is low. Practice the motion more smoothly.',
+        [FaultCode.NOT_RECOGNIZED]: 'Sign not recognized clearly. Ensure good lighting and face visibility.',
+        [FaultCode.CLOSE]: 'Close, but not quite. Check your hand position and movement speed.',
+        [FaultCode.INCORRECT]: 'Incorrect sign detected. Watch the demo again and focus on the hand shape.',
+        [FaultCode.BUFFERING]: 'Building frame buffer...',
+    },
+    hi: {
+        [FaultCode.GOOD]: 'अच्छा प्रयास! ऐसे ही जारी रखें! 👍',
+        [FaultCode.EXCELLENT]: 'शानदार! बिल्कुल सही संकेत! 🌟',
+        [FaultCode.IMPRECISE]: 'सही! हाथ की स्थिति थोड़ी और सटीक रखें।',
+        [FaultCode.LOW_CONFIDENCE]: 'सही, लेकिन भरोसा कम है। गति को और सहज बनाने का अभ्यास करें।',
+        [FaultCode.NOT_RECOGNIZED]: 'संकेत स्पष्ट रूप से पहचाना नहीं गया। अच्छी रोशनी रखें और चेहरा दिखाई दे।',
+        [FaultCode.CLOSE]: 'लगभग सही! हाथ की स्थिति और गति की जाँच करें।',
+        [FaultCode.INCORRECT]: 'गलत संकेत। डेमो फिर से देखें और हाथ के आकार पर ध्यान दें।',
+        [FaultCode.BUFFERING]: 'फ़्रेम बफ़र तैयार हो रहा है...',
+    },
+};
+
+const WELCOME_MESSAGES: Record<Language, Record<string, (name: string) => string>> = {
+    en: {
+        welcome: (name) => `Welcome to SignVista, ${name}! 🖐️ Let's bridge the communication gap together.`,
+    },
+    hi: {
+        welcome: (name) => `साइनविस्टा में आपका स्वागत है, ${name}! 🖐️ आइए साथ मिलकर संवाद की खाई पाटें।`,
+    },
+};
+
+export function faultMessage(code: number, lang: Language = 'en'): string {
+    return FAULT_MESSAGES[lang][code as FaultCode] ?? FAULT_MESSAGES.en[FaultCode.GOOD];
+}
+
+export function welcomeMessage(key: string, name: string, lang: Language = 'en'): string {
+    const render = WELCOME_MESSAGES[lang][key] ?? WELCOME_MESSAGES.en.welcome;
+    return render(name);
+}